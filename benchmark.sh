@@ -0,0 +1,46 @@
+#!/usr/bin/env bash
+#
+# Runs the CRC-64 micro-benchmark suite, writing the results as JSON (any arguments are passed on to
+# the suite, e.g. --max-size=1048576 --output=benchmark.json)
+
+
+# utility function for writing to stderr
+function __echo_to_stderr() {
+    if [ $? -ne 0 ]
+    then
+        return 1
+    fi
+
+    echo "$@" 1>&2
+}
+
+# test for existence of python
+PYTHON_PATH=$(which python)
+if [ $? -ne 0 ]
+then
+    __echo_to_stderr "Python is not installed"
+    exit 1
+fi
+
+# where is this script executing?
+SCRIPT_DIRECTORY=$(readlink -f "$(dirname "$0")")
+if [ $? -ne 0 ]
+then
+    __echo_to_stderr "Cannot determine where script is running from"
+    exit 1
+fi
+
+# run the benchmark suite
+cd "$SCRIPT_DIRECTORY" && python -m benchmarks.crc64benchmark "$@"
+EXIT_CODE=$?
+if [ $EXIT_CODE -ne 0 ]
+then
+    __echo_to_stderr "Benchmark suite returned exit code $EXIT_CODE"
+fi
+
+# exit with appropriate code
+if [ $EXIT_CODE -ne 0 ]
+then
+    exit 1
+fi
+exit 0
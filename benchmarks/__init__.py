@@ -0,0 +1,2 @@
+"""Implements the pydvdid benchmark suite.
+"""
@@ -0,0 +1,280 @@
+"""Implements a micro-benchmark suite that measures the throughput of every CRC-64 backend across a
+   range of content sizes, the time taken to construct the lookup tables each backend requires,
+   and the memory allocated per calculator. Results are written as JSON, so that they may be
+   compared across releases.
+
+   Usage: python -m benchmarks.crc64benchmark [options]
+"""
+
+
+from __future__ import absolute_import
+from __future__ import print_function
+from datetime import datetime
+from json import dumps
+from optparse import OptionParser
+from os import urandom
+from platform import (
+    machine, python_implementation, python_version, system
+)
+from sys import stdout
+from timeit import default_timer
+from pydvdid import (
+    crc64numpy, crc64tables
+)
+from pydvdid.crc64backends import (
+    _get_available_backend_names, _get_registered_backend
+)
+from pydvdid.crc64calculator import _Crc64Calculator
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+
+# content sizes run from 16 bytes to 64 MiB in powers of four
+_CONTENT_SIZES = [0x10 << (shift << 1) for shift in range(0, 12)]
+
+# the polynomial used for throughput measurements, and a polynomial without a precomputed lookup
+# table (that of CRC-64/XZ), used when measuring table construction
+_POLYNOMIAL = 0x92c64265d32139a4
+
+_CONSTRUCTION_POLYNOMIAL = 0xc96c5795d7870f42
+
+_MINIMUM_TIME = 0.2
+
+_REPEATS = 3
+
+
+def run_benchmarks(content_sizes=None, backend_names=None, minimum_time=_MINIMUM_TIME,
+                   repeats=_REPEATS):
+    """Runs the benchmark suite for the supplied content sizes and backend names (defaulting to all
+       of them), timing each measurement for at least 'minimum_time' seconds and keeping the best
+       of 'repeats' timings.
+       Returns the results as a dictionary which may be serialised as JSON.
+    """
+
+    if content_sizes is None:
+        content_sizes = _CONTENT_SIZES
+
+    backends = _get_backends(backend_names)
+
+    results = {
+        "environment": _get_environment(),
+        "throughput": [],
+        "table_construction": [],
+        "memory": []
+    }
+
+    for backend_name, backend in backends:
+        for content_size in content_sizes:
+            results["throughput"].append(
+                _measure_throughput(backend_name, backend, content_size, minimum_time, repeats))
+
+        results["table_construction"].append(
+            _measure_table_construction(backend_name, backend, repeats))
+        results["memory"].append(_measure_memory(backend_name, backend))
+
+    return results
+
+
+def _get_backends(backend_names):
+    """Returns the (name, backend) pairs for the supplied backend names, or all of the backends
+       available on this host where no names are supplied.
+    """
+
+    if backend_names is None:
+        backend_names = _get_available_backend_names()
+
+    return [(backend_name, _get_registered_backend(backend_name)) for backend_name in backend_names]
+
+
+def _get_environment():
+    """Returns a dictionary describing the environment the benchmarks were run in.
+    """
+
+    return {
+        "timestamp": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "python_implementation": python_implementation(),
+        "python_version": python_version(),
+        "system": system(),
+        "machine": machine(),
+        "available_backends": _get_available_backend_names()
+    }
+
+
+def _measure_throughput(backend_name, backend, content_size, minimum_time, repeats):
+    """Returns a dictionary holding the throughput of the supplied backend when updating a
+       calculator with random content of the supplied size.
+    """
+
+    content = bytearray(urandom(content_size))
+    calculator = _Crc64Calculator(_POLYNOMIAL, backend=backend)
+
+    iterations = 1
+    while True:
+        elapsed = _time_updates(calculator, content, iterations)
+        if elapsed >= minimum_time:
+            break
+        iterations = max(iterations << 1, int(iterations * minimum_time / max(elapsed, 1e-6)))
+
+    best = min([elapsed] + [
+        _time_updates(calculator, content, iterations) for _ in range(1, repeats)
+    ])
+    seconds_per_update = best / iterations
+
+    return {
+        "backend": backend_name,
+        "content_size": content_size,
+        "iterations": iterations,
+        "seconds_per_update": seconds_per_update,
+        "megabytes_per_second": content_size / seconds_per_update / 1e6,
+        "nanoseconds_per_byte": seconds_per_update * 1e9 / content_size
+    }
+
+
+def _time_updates(calculator, content, iterations):
+    """Returns the number of seconds taken to update the supplied calculator with the supplied
+       content 'iterations' times.
+    """
+
+    update = calculator.update
+
+    start = default_timer()
+    for _ in range(0, iterations):
+        update(content)
+
+    return default_timer() - start
+
+
+def _measure_table_construction(backend_name, backend, repeats):
+    """Returns a dictionary holding the best time taken to construct a calculator using the
+       supplied backend from a polynomial whose lookup tables have not yet been constructed, which
+       includes constructing those tables.
+    """
+
+    timings = []
+
+    for _ in range(0, repeats):
+        _forget_tables(_CONSTRUCTION_POLYNOMIAL)
+
+        start = default_timer()
+        _Crc64Calculator(_CONSTRUCTION_POLYNOMIAL, backend=backend)
+        timings.append(default_timer() - start)
+
+    return {
+        "backend": backend_name,
+        "seconds": min(timings)
+    }
+
+
+def _measure_memory(backend_name, backend):
+    """Returns a dictionary holding the number of bytes allocated when constructing a calculator
+       using the supplied backend, both when its lookup tables must be constructed ('cold') and
+       when they are already shared in the registry ('warm'). Sizes are None where tracemalloc is
+       unavailable.
+    """
+
+    memory = {
+        "backend": backend_name,
+        "cold_bytes": None,
+        "warm_bytes": None
+    }
+
+    if tracemalloc is None:
+        return memory
+
+    _forget_tables(_CONSTRUCTION_POLYNOMIAL)
+
+    for key in ("cold_bytes", "warm_bytes"):
+        tracemalloc.start()
+        try:
+            calculator = _Crc64Calculator(_CONSTRUCTION_POLYNOMIAL, backend=backend)
+            memory[key] = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+
+        del calculator
+
+    return memory
+
+
+def _forget_tables(polynomial):
+    """Removes the lookup tables, update function and folding tables constructed for the supplied
+       polynomial from the shared registries, so that the next calculator seeded from it
+       constructs them afresh.
+       No return value.
+    """
+
+    # pylint: disable=locally-disabled, protected-access
+    with crc64tables._REGISTRY_LOCK:
+        crc64tables._SLICING_TABLES.pop(polynomial, None)
+
+        for key in list(crc64tables._INDEXABLE_SLICING_TABLES):
+            if key[0] == polynomial:
+                del crc64tables._INDEXABLE_SLICING_TABLES[key]
+
+        crc64tables._UPDATE_FUNCTIONS.pop(polynomial, None)
+
+    for key in list(crc64numpy._FOLDING_TABLES):
+        if key[0] == polynomial:
+            del crc64numpy._FOLDING_TABLES[key]
+
+
+def _parse_content_size(option, _, value, parser):
+    """Parses a comma-separated list of content sizes (in bytes) into the named option.
+       No return value.
+    """
+
+    setattr(parser.values, option.dest, [int(content_size, 0) for content_size in value.split(",")])
+
+
+def main(arguments=None):
+    """Runs the benchmark suite from the command line, writing the results as JSON to standard
+       output or to the file named by --output.
+       Returns the exit code.
+    """
+
+    parser = OptionParser(usage="python -m benchmarks.crc64benchmark [options]")
+    parser.add_option("--sizes", type="string", action="callback", callback=_parse_content_size,
+                      dest="content_sizes", default=None,
+                      help="comma-separated content sizes in bytes (default 16 B to 64 MiB)")
+    parser.add_option("--max-size", type="int", dest="max_size", default=None,
+                      help="omit content sizes larger than this many bytes")
+    parser.add_option("--backends", type="string", dest="backends", default=None,
+                      help="comma-separated backend names (default all available)")
+    parser.add_option("--minimum-time", type="float", dest="minimum_time", default=_MINIMUM_TIME,
+                      help="minimum seconds per timing (default {0})".format(_MINIMUM_TIME))
+    parser.add_option("--repeats", type="int", dest="repeats", default=_REPEATS,
+                      help="timings per measurement, the best is kept (default {0})".format(
+                          _REPEATS))
+    parser.add_option("--output", type="string", dest="output", default=None,
+                      help="file to write the JSON results to (default standard output)")
+
+    options, _ = parser.parse_args(arguments)
+
+    content_sizes = options.content_sizes or _CONTENT_SIZES
+    if options.max_size is not None:
+        content_sizes = [size for size in content_sizes if size <= options.max_size]
+
+    backend_names = options.backends.split(",") if options.backends else None
+
+    try:
+        results = run_benchmarks(content_sizes, backend_names, options.minimum_time,
+                                 options.repeats)
+    except ValueError as exception:
+        parser.error(str(exception))
+
+    output = dumps(results, indent=2, sort_keys=True)
+
+    if options.output is None:
+        print(output, file=stdout)
+    else:
+        with open(options.output, "wb") as output_file:
+            output_file.write((output + "\n").encode("utf-8"))
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
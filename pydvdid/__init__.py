@@ -4,6 +4,26 @@
 
 from __future__ import absolute_import
 from __future__ import unicode_literals
+from .computeasync import (
+    compute_async, iter_compute_async
+)
+from .computemany import (
+    compute_many, iter_compute
+)
+from .computeprocesses import compute_many_in_processes
+from .crc64backends import (
+    get_crc64_backend, set_crc64_backend
+)
+from .crc64batch import compute_crc64_batch
+from .crc64combine import combine
+from .crc64hash import Crc64Hash
+from .crc64parallel import (
+    compute_crc64_of_content, compute_crc64_of_files
+)
+from .crc64resultarray import Crc64ResultArray
+from .crcengine import (
+    CRC_MODELS, CrcEngine, CrcModel
+)
 from .exceptions import (
     FileContentReadException, FileTimeOutOfRangeException, PathDoesNotExistException,
     PydvdidException
@@ -12,6 +32,9 @@ from .functions import compute
 
 
 __all__ = [
-    "compute", "FileContentReadException", "FileTimeOutOfRangeException",
-    "PathDoesNotExistException", "PydvdidException"
+    "combine", "compute", "compute_async", "compute_crc64_batch", "compute_crc64_of_content",
+    "compute_crc64_of_files", "compute_many", "compute_many_in_processes", "Crc64Hash",
+    "Crc64ResultArray", "CRC_MODELS", "CrcEngine", "CrcModel", "FileContentReadException",
+    "FileTimeOutOfRangeException", "get_crc64_backend", "iter_compute", "iter_compute_async",
+    "PathDoesNotExistException", "PydvdidException", "set_crc64_backend"
 ]
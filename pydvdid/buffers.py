@@ -0,0 +1,105 @@
+"""Implements supporting 'private' functions for handling the content supplied to calculators.
+"""
+
+
+from __future__ import absolute_import
+from sys import version_info
+
+
+def _as_byte_view(content):
+    """Returns the supplied content as a one-dimensional sequence of unsigned bytes, which is a
+       memoryview over the content (without copying) where the content supports the buffer protocol
+       (e.g. bytes, bytearray, memoryview, mmap and array objects), and a bytearray copy of the
+       content otherwise (e.g. a list of integers).
+
+       (Python 2 memoryviews enumerate as strings and cannot be cast, so a bytearray is always
+       returned on Python 2).
+    """
+
+    if version_info[0] < 3:
+        return content if isinstance(content, bytearray) else bytearray(content)
+
+    try:
+        view = memoryview(content)
+    except TypeError:
+        return memoryview(bytearray(content))
+
+    if view.format == "B" and view.ndim == 1:
+        return view
+
+    try:
+        return view.cast("B")
+    except TypeError:
+        # non-contiguous views cannot be cast, so fall back to a contiguous copy
+        return memoryview(view.tobytes())
+
+
+# the extent of a zero run is found by copying the bytes around it to bytes (memoryviews lack the
+# fast lstrip() and rstrip() methods), starting with _ZERO_RUN_INITIAL_STEP bytes and doubling up to
+# _ZERO_RUN_MAXIMUM_STEP bytes at a time, which bounds both the bytes copied around the short runs
+# found in most content, and the memory used to examine long runs
+_ZERO_RUN_INITIAL_STEP = 0x40
+
+_ZERO_RUN_MAXIMUM_STEP = 0x100000
+
+
+def _find_zero_runs(content, minimum_length):
+    """Yields a (start, end) pair of offsets for each run of at least 'minimum_length' zero bytes in
+       the supplied byte view, in order.
+
+       Every such run includes an offset that is a multiple of 'minimum_length', so only the bytes
+       at those offsets are examined, and the extent of a run is only sought around a zero byte
+       found there; content without long zero runs is therefore searched without being copied.
+    """
+
+    run_end = 0
+
+    for offset in range(0, len(content), minimum_length):
+        if offset < run_end or content[offset] != 0:
+            continue
+
+        run_start = _find_zero_run_start(content, offset, run_end)
+        run_end = _find_zero_run_end(content, offset)
+
+        if run_end - run_start >= minimum_length:
+            yield run_start, run_end
+
+
+def _find_zero_run_start(content, offset, minimum_offset):
+    """Returns the offset of the first byte of the run of zero bytes that ends at the supplied
+       offset in the supplied byte view, searching back no further than 'minimum_offset'.
+    """
+
+    step = _ZERO_RUN_INITIAL_STEP
+
+    while offset > minimum_offset:
+        chunk = bytes(content[max(minimum_offset, offset - step):offset])
+        zero_count = len(chunk) - len(chunk.rstrip(b"\x00"))
+        offset -= zero_count
+
+        if zero_count < len(chunk):
+            break
+
+        step = min(step << 1, _ZERO_RUN_MAXIMUM_STEP)
+
+    return offset
+
+
+def _find_zero_run_end(content, offset):
+    """Returns the offset of the first non-zero byte at or after the supplied offset in the supplied
+       byte view (or the length of the byte view, where there is none).
+    """
+
+    step = _ZERO_RUN_INITIAL_STEP
+
+    while offset < len(content):
+        chunk = bytes(content[offset:offset + step])
+        zero_count = len(chunk) - len(chunk.lstrip(b"\x00"))
+        offset += zero_count
+
+        if zero_count < len(chunk):
+            break
+
+        step = min(step << 1, _ZERO_RUN_MAXIMUM_STEP)
+
+    return offset
@@ -0,0 +1,200 @@
+"""Implements the public asyncio compute functions and supporting 'private' functions.
+
+   (The functions return awaitables rather than being defined with the async keyword, so that the
+   module may still be imported on Python 2, which lacks asyncio).
+"""
+
+
+from __future__ import absolute_import
+from collections import deque
+from threading import Lock
+from .computemany import _get_thread_count
+from .functions import compute
+
+try:
+    import asyncio
+except ImportError:
+    asyncio = None
+
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:
+    ThreadPoolExecutor = None
+
+
+_EXECUTOR_LOCK = Lock()
+
+_DEFAULT_EXECUTOR = []
+
+# by default, iter_compute_async() keeps this many paths in flight per thread of the executor
+_DEFAULT_IN_FLIGHT_PER_THREAD = 2
+
+
+def compute_async(dvd_path, timeout=None, executor=None):
+    """Computes a Windows API IDvdInfo2::GetDiscID-compatible 64-bit Cyclic Redundancy Check
+       checksum from the DVD .vob, .ifo and .bup files found in the supplied DVD path, as compute
+       does, without blocking the running event loop.
+
+       Returns an asyncio Task which resolves to a Crc64Result (or raises the exception raised by
+       compute). The stat calls and reads are run on the supplied executor, or on a shared pool of
+       threads by default. Where a timeout (in seconds) is supplied and expires, the Task raises an
+       asyncio.TimeoutError. Cancelling the Task (or its timing out) before the path has started
+       prevents it from being computed; a path already being computed runs to completion on its
+       thread, but its result is discarded.
+    """
+
+    if asyncio is None:
+        raise ImportError("asyncio is required by compute_async() but is not available.")
+
+    loop = _get_event_loop()
+    future = loop.run_in_executor(executor or _get_default_executor(), compute, dvd_path)
+
+    if timeout is not None:
+        future = asyncio.wait_for(future, timeout)
+
+    return asyncio.ensure_future(future)
+
+
+def iter_compute_async(dvd_paths, max_in_flight=None, timeout=None, executor=None):
+    """Computes a Windows API IDvdInfo2::GetDiscID-compatible 64-bit Cyclic Redundancy Check
+       checksum for each of the supplied DVD paths, as compute_async does.
+
+       Returns an asynchronous iterator (for use with 'async for') that yields a (dvd_path, result)
+       pair as each path completes, where the result is either a Crc64Result or the exception
+       raised computing the checksum for the path (including an asyncio.TimeoutError where the
+       per-path timeout expires). Paths are read from the supplied iterable only as results are
+       consumed, so that no more than 'max_in_flight' paths (by default, twice the number of
+       threads of the shared pool) are in progress at once. The iterator's cancel() method stops
+       reading paths and cancels those in progress, which are then yielded with an
+       asyncio.CancelledError.
+    """
+
+    if asyncio is None:
+        raise ImportError("asyncio is required by iter_compute_async() but is not available.")
+
+    if max_in_flight is None:
+        max_in_flight = _get_thread_count(None) * _DEFAULT_IN_FLIGHT_PER_THREAD
+
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight must be greater than 0.")
+
+    return _AsyncComputeIterator(iter(dvd_paths), max_in_flight, timeout, executor)
+
+
+class _AsyncComputeIterator(object):
+    """Implements the asynchronous iterator returned by iter_compute_async().
+
+       Class initialiser requires an iterator of DVD paths, the maximum number of paths in flight,
+       and the per-path timeout and executor passed to compute_async().
+    """
+
+    def __init__(self, dvd_paths, max_in_flight, timeout, executor):
+        self._dvd_paths = dvd_paths
+        self._max_in_flight = max_in_flight
+        self._timeout = timeout
+        self._executor = executor
+
+        self._pending_tasks = set()
+        self._completed_results = deque()
+        self._waiter = None
+
+
+    def __aiter__(self):
+        return self
+
+
+    def __anext__(self):
+        self._submit_paths()
+
+        loop = _get_event_loop()
+        future = loop.create_future() if hasattr(loop, "create_future") else asyncio.Future()
+
+        if self._completed_results:
+            future.set_result(self._completed_results.popleft())
+        elif self._pending_tasks:
+            self._waiter = future
+        else:
+            raise StopAsyncIteration # pylint: disable=locally-disabled, undefined-variable
+
+        return future
+
+
+    def cancel(self):
+        """Cancels the paths in progress, and stops reading further paths.
+           No return value.
+        """
+
+        self._dvd_paths = iter(())
+
+        for task in list(self._pending_tasks):
+            task.cancel()
+
+
+    def _submit_paths(self):
+        """Starts computing further paths until 'max_in_flight' are in progress (or held completed
+           but not yet consumed), or the paths are exhausted.
+           No return value.
+        """
+
+        while len(self._pending_tasks) + len(self._completed_results) < self._max_in_flight:
+            try:
+                dvd_path = next(self._dvd_paths)
+            except StopIteration:
+                return
+
+            try:
+                task = compute_async(dvd_path, self._timeout, self._executor)
+            except Exception as exception: # pylint: disable=locally-disabled, broad-except
+                self._completed_results.append((dvd_path, exception))
+                continue
+
+            task.add_done_callback(lambda task, dvd_path=dvd_path: self._complete(dvd_path, task))
+            self._pending_tasks.add(task)
+
+
+    def _complete(self, dvd_path, task):
+        """Records the result of the supplied completed task for the supplied DVD path, and hands
+           it to the waiting consumer, if any.
+           No return value.
+        """
+
+        self._pending_tasks.discard(task)
+
+        if task.cancelled():
+            result = asyncio.CancelledError()
+        else:
+            result = task.exception() or task.result()
+
+        self._completed_results.append((dvd_path, result))
+
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(self._completed_results.popleft())
+
+        self._waiter = None
+
+
+def _get_event_loop():
+    """Returns the running event loop.
+
+       (asyncio.get_running_loop() is preferred where available, as it was added in Python 3.7).
+    """
+
+    get_running_loop = getattr(asyncio, "get_running_loop", None)
+
+    if get_running_loop is not None:
+        return get_running_loop()
+
+    return asyncio.get_event_loop()
+
+
+def _get_default_executor():
+    """Returns the shared pool of threads that compute_async() runs on by default, creating it on
+       first use with as many threads as compute_many() uses by default.
+    """
+
+    if not _DEFAULT_EXECUTOR:
+        with _EXECUTOR_LOCK:
+            if not _DEFAULT_EXECUTOR:
+                _DEFAULT_EXECUTOR.append(ThreadPoolExecutor(max_workers=_get_thread_count(None)))
+
+    return _DEFAULT_EXECUTOR[0]
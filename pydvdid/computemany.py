@@ -0,0 +1,140 @@
+"""Implements the public compute_many function and supporting 'private' functions.
+"""
+
+
+from __future__ import absolute_import
+from itertools import islice
+from .functions import compute
+
+try:
+    from concurrent.futures import (
+        FIRST_COMPLETED, ThreadPoolExecutor, wait
+    )
+except ImportError:
+    ThreadPoolExecutor = None
+
+try:
+    from os import cpu_count
+except ImportError:
+    from multiprocessing import cpu_count
+
+
+# computing a disc ID is dominated by stat calls and small reads, which release the GIL, so by
+# default more threads are used than there are processors (as Python 3.8's ThreadPoolExecutor does)
+_MAXIMUM_DEFAULT_THREADS = 32
+
+_EXTRA_DEFAULT_THREADS = 4
+
+# by default, iter_compute() keeps this many paths in flight per thread, so that a thread that
+# finishes a path always has another waiting for it
+_DEFAULT_IN_FLIGHT_PER_THREAD = 2
+
+
+def compute_many(dvd_paths, max_workers=None, ordered=True):
+    """Computes a Windows API IDvdInfo2::GetDiscID-compatible 64-bit Cyclic Redundancy Check
+       checksum for each of the supplied DVD paths, as compute does, on a pool of worker threads.
+
+       Returns a list of (dvd_path, result) pairs, where the result is either a Crc64Result or the
+       exception raised computing the checksum for the path, so that one unreadable disc does not
+       abort the batch. Pairs are in the order of the supplied paths where 'ordered' is True, and in
+       the order in which they complete otherwise.
+    """
+
+    if not ordered:
+        return list(iter_compute(dvd_paths, max_workers))
+
+    dvd_paths = list(dvd_paths)
+    thread_count = _get_thread_count(max_workers)
+
+    if len(dvd_paths) < 2 or thread_count < 2 or ThreadPoolExecutor is None:
+        return [_compute_or_capture_exception(dvd_path) for dvd_path in dvd_paths]
+
+    with ThreadPoolExecutor(max_workers=min(thread_count, len(dvd_paths))) as executor:
+        futures = [
+            executor.submit(_compute_or_capture_exception, dvd_path) for dvd_path in dvd_paths
+        ]
+
+        return [future.result() for future in futures]
+
+
+def iter_compute(dvd_paths, max_workers=None, max_in_flight=None):
+    """Computes a Windows API IDvdInfo2::GetDiscID-compatible 64-bit Cyclic Redundancy Check
+       checksum for each of the supplied DVD paths, as compute does, on a pool of worker threads.
+
+       Returns a generator that yields a (dvd_path, result) pair as each path completes, where the
+       result is either a Crc64Result or the exception raised computing the checksum for the path.
+       Paths are read from the supplied iterable only as results are consumed, so that no more than
+       'max_in_flight' paths (by default, twice the number of threads) are being computed at once,
+       however many paths the iterable yields. Closing the generator cancels the paths that have
+       not yet started.
+    """
+
+    thread_count = _get_thread_count(max_workers)
+
+    if max_in_flight is None:
+        max_in_flight = thread_count * _DEFAULT_IN_FLIGHT_PER_THREAD
+
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight must be greater than 0.")
+
+    if thread_count < 2 or ThreadPoolExecutor is None:
+        return (_compute_or_capture_exception(dvd_path) for dvd_path in dvd_paths)
+
+    return _iter_compute_on_threads(iter(dvd_paths), thread_count, max_in_flight)
+
+
+def _iter_compute_on_threads(dvd_paths, thread_count, max_in_flight):
+    """Yields a (dvd_path, result) pair for each of the DVD paths in the supplied iterator as it
+       completes on a pool of 'thread_count' threads, submitting further paths as others complete
+       so that no more than 'max_in_flight' are pending at once.
+    """
+
+    executor = ThreadPoolExecutor(max_workers=thread_count)
+    futures = set()
+
+    try:
+        while True:
+            # submit further paths before yielding the completed ones, so that the threads are kept
+            # busy while the results are consumed
+            futures.update(
+                executor.submit(_compute_or_capture_exception, dvd_path)
+                for dvd_path in islice(dvd_paths, max_in_flight - len(futures))
+            )
+
+            if not futures:
+                return
+
+            completed_futures, futures = wait(futures, return_when=FIRST_COMPLETED)
+
+            for future in completed_futures:
+                yield future.result()
+    finally:
+        for future in futures:
+            future.cancel()
+
+        executor.shutdown(wait=True)
+
+
+def _get_thread_count(max_workers):
+    """Returns the number of worker threads to use, defaulting to a few more than the number of
+       processors.
+    """
+
+    if max_workers is None:
+        max_workers = min(_MAXIMUM_DEFAULT_THREADS, (cpu_count() or 1) + _EXTRA_DEFAULT_THREADS)
+
+    if max_workers < 1:
+        raise ValueError("max_workers must be greater than 0.")
+
+    return max_workers
+
+
+def _compute_or_capture_exception(dvd_path):
+    """Returns a pair of the supplied DVD path and either its checksum, as returned by compute, or
+       the exception raised computing it.
+    """
+
+    try:
+        return dvd_path, compute(dvd_path)
+    except Exception as exception: # pylint: disable=locally-disabled, broad-except
+        return dvd_path, exception
@@ -0,0 +1,122 @@
+"""Implements the public compute_many_in_processes function and supporting 'private' functions.
+"""
+
+
+from __future__ import absolute_import
+from functools import partial
+from .crc64backends import (
+    get_crc64_backend, set_crc64_backend, _get_crc64_backend
+)
+from .crc64calculator import _Crc64Calculator
+from .crc64parallel import _get_worker_count
+from .crc64resultarray import Crc64ResultArray
+from .functions import compute
+
+try:
+    from concurrent.futures import ProcessPoolExecutor
+except ImportError:
+    ProcessPoolExecutor = None
+
+
+# paths are sent to the workers in chunks, sized so that each worker receives several of them
+# (which evens out the load when some discs are slower to read than others), but no larger than
+# _MAXIMUM_PATHS_PER_CHUNK paths (which bounds the work lost to a slow worker at the end of a scan)
+_CHUNKS_PER_WORKER = 4
+
+_MAXIMUM_PATHS_PER_CHUNK = 256
+
+_WORKER_STATE = {}
+
+
+def compute_many_in_processes(dvd_paths, max_workers=None, chunk_size=None):
+    """Computes a Windows API IDvdInfo2::GetDiscID-compatible 64-bit Cyclic Redundancy Check
+       checksum for each of the supplied DVD paths, as compute does, on a pool of worker processes,
+       so that checksumming a large library scales across processors (which a pool of threads
+       cannot, as the checksum is calculated while holding the GIL).
+
+       Paths are sent to the workers in chunks of 'chunk_size' paths (by default, enough for each
+       worker to receive several chunks), and each chunk's checksums are returned as 8 bytes per
+       path. Each worker selects the backend selected in this process and constructs its lookup
+       tables once, on receiving its first chunk.
+
+       Returns a pair of a Crc64ResultArray holding the checksum of each path in the order supplied
+       (or 0 for a path whose checksum could not be computed), and a dict mapping the index of
+       each path whose checksum could not be computed to the exception raised computing it.
+    """
+
+    dvd_paths = list(dvd_paths)
+    worker_count = _get_worker_count(max_workers)
+
+    if chunk_size is None:
+        chunk_size = _get_paths_per_chunk(len(dvd_paths), worker_count)
+
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be greater than 0.")
+
+    chunks = [
+        dvd_paths[offset:offset + chunk_size] for offset in range(0, len(dvd_paths), chunk_size)
+    ]
+
+    if len(chunks) > 1 and worker_count > 1 and ProcessPoolExecutor is not None:
+        function = partial(_compute_chunk_in_worker, backend_name=get_crc64_backend())
+
+        with ProcessPoolExecutor(max_workers=min(worker_count, len(chunks))) as executor:
+            chunk_results = list(executor.map(function, chunks))
+    else:
+        chunk_results = [_compute_chunk(chunk) for chunk in chunks]
+
+    exceptions = {}
+
+    for chunk_index, (_, chunk_exceptions) in enumerate(chunk_results):
+        for index, exception in chunk_exceptions:
+            exceptions[chunk_index * chunk_size + index] = exception
+
+    crc64s = b"".join(chunk_crc64s for chunk_crc64s, _ in chunk_results)
+
+    return Crc64ResultArray.from_bytes(crc64s), exceptions
+
+
+def _get_paths_per_chunk(path_count, worker_count):
+    """Returns the number of paths in each of the chunks that the supplied number of paths are
+       split into for the supplied number of workers.
+    """
+
+    paths_per_chunk = -(-path_count // (worker_count * _CHUNKS_PER_WORKER))
+
+    return max(1, min(paths_per_chunk, _MAXIMUM_PATHS_PER_CHUNK))
+
+
+def _compute_chunk_in_worker(dvd_paths, backend_name):
+    """Initialises the worker process with the named backend, on its first chunk, and returns the
+       result of _compute_chunk() for the supplied DVD paths. Invoked in a worker process.
+    """
+
+    if not _WORKER_STATE:
+        set_crc64_backend(backend_name)
+
+        # updating a calculator constructs the shared lookup table and update function, and warms
+        # the backend (e.g. loading the compiled numba kernel), so the first disc need not
+        _Crc64Calculator(0x92c64265d32139a4, backend=_get_crc64_backend()).update(b"\x00")
+
+        _WORKER_STATE["backend_name"] = backend_name
+
+    return _compute_chunk(dvd_paths)
+
+
+def _compute_chunk(dvd_paths):
+    """Returns a pair of the checksums of the supplied DVD paths, as 8 big-endian bytes per path (or
+       8 zero bytes for a path whose checksum could not be computed), and a list of (index,
+       exception) pairs for each path whose checksum could not be computed.
+    """
+
+    crc64s = Crc64ResultArray()
+    exceptions = []
+
+    for index, dvd_path in enumerate(dvd_paths):
+        try:
+            crc64s.append(compute(dvd_path))
+        except Exception as exception: # pylint: disable=locally-disabled, broad-except
+            crc64s.append(0x0)
+            exceptions.append((index, exception))
+
+    return crc64s.to_bytes(), exceptions
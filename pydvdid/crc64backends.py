@@ -0,0 +1,355 @@
+"""Implements the registry of CRC-64 backends, and the public functions that select the backend used
+   by compute and the other public functions.
+
+   The backend is selected on first use: a name set with set_crc64_backend() or held in the
+   PYDVDID_CRC64_BACKEND environment variable takes precedence, otherwise every available backend
+   is self-tested and timed, and the fastest correct backend is chosen. A backend is timed from its
+   first use in the process (which includes importing and compiling any optional dependencies), as
+   that is what a process computing a single disc ID pays. The outcome of calibration is cached in
+   a file in the user's cache folder, so that later processes on the same host start without
+   calibrating, once the cached backend has passed its self-test.
+"""
+
+
+from __future__ import absolute_import
+from __future__ import unicode_literals
+from json import (
+    dumps, loads
+)
+from os import (
+    environ, getpid, makedirs, remove, rename
+)
+from os.path import (
+    expanduser, isdir, join
+)
+from platform import (
+    machine, python_implementation, python_version
+)
+from threading import Lock
+from timeit import default_timer
+from warnings import warn
+from .crc64bigint import _BigIntCrc64Backend
+from .crc64calculator import _Crc64Calculator
+from .crc64numba import _NumbaCrc64Backend
+from .crc64numpy import _NumpyCrc64Backend
+from .crc64result import Crc64Result
+from .crc64slicing import (
+    _SlicingBy8Crc64Backend, _SlicingBy16Crc64Backend
+)
+
+
+# the registered backends, by name, in order of preference when calibration timings are equal; the
+# reference implementation is the calculator's own byte-at-a-time loop, used when no backend is
+# supplied, and backends with a false AVAILABLE attribute are never selected; slicing-by-8 and
+# slicing-by-16 measure within a few percent of each other under CPython (which is the faster
+# varies by host), so the one with half the lookup tables is preferred on a tie
+_BACKENDS = [
+    ("reference", None),
+    ("slicing-by-8", _SlicingBy8Crc64Backend),
+    ("slicing-by-16", _SlicingBy16Crc64Backend),
+    ("bigint", _BigIntCrc64Backend),
+    ("numpy", _NumpyCrc64Backend),
+    ("numba", _NumbaCrc64Backend)
+]
+
+_ENVIRONMENT_VARIABLE = "PYDVDID_CRC64_BACKEND"
+
+# requesting this name selects a backend by calibration, as if no name were requested
+_AUTOMATIC = "auto"
+
+_CACHE_FILE_NAME = "crc64backend.json"
+
+# calibration self-tests and times every backend against this much content, which matches the size
+# of the IFO file content read by compute, keeping the best of _CALIBRATION_REPEATS timings
+_CALIBRATION_SIZE = 0x10000
+
+_CALIBRATION_REPEATS = 3
+
+_POLYNOMIAL = 0x92c64265d32139a4
+
+# the CRC-64 of the ASCII string "123456789" for the polynomial above, which every backend must
+# reproduce before it may be selected
+_CHECK_CONTENT = b"123456789"
+
+_CHECK_CRC64 = 0x75d4b74f024eceea
+
+_SELECTION_LOCK = Lock()
+
+_SELECTED_BACKEND = {}
+
+
+def get_crc64_backend():
+    """Returns the name of the backend used by compute and the other public functions, selecting
+       it on first use.
+    """
+
+    return _select_backend()[0]
+
+
+def set_crc64_backend(name=None):
+    """Sets the backend used by compute and the other public functions to the backend registered
+       under the supplied name, overriding both calibration and the PYDVDID_CRC64_BACKEND
+       environment variable. Supplying None (or "auto") reverts to automatic selection.
+       No return value.
+    """
+
+    with _SELECTION_LOCK:
+        if name is None or name == _AUTOMATIC:
+            _SELECTED_BACKEND.clear()
+            return
+
+        backend = _get_registered_backend(name)
+
+        if not _is_available(backend):
+            raise ValueError("CRC-64 backend '{0}' is not available.".format(name))
+
+        _SELECTED_BACKEND["backend"] = (name, backend)
+
+
+def _get_crc64_backend():
+    """Returns the backend class used by compute and the other public functions (or None for the
+       reference implementation), selecting it on first use.
+    """
+
+    return _select_backend()[1]
+
+
+def _select_backend():
+    """Returns the (name, backend) pair used by compute and the other public functions, selecting
+       it on first use from the PYDVDID_CRC64_BACKEND environment variable or, where that is unset
+       or names a backend that is unknown or not available on this host (which raises a
+       RuntimeWarning), from the calibration cache file or calibration.
+    """
+
+    selected_backend = _SELECTED_BACKEND.get("backend")
+
+    if selected_backend is not None:
+        return selected_backend
+
+    with _SELECTION_LOCK:
+        if "backend" not in _SELECTED_BACKEND:
+            name = environ.get(_ENVIRONMENT_VARIABLE, _AUTOMATIC).strip().lower()
+
+            if name != _AUTOMATIC and name not in _get_available_backend_names():
+                template = ("The {0} environment variable names CRC-64 backend '{1}', which is "
+                            "unknown or not available; the backend is selected automatically.")
+                warn(template.format(_ENVIRONMENT_VARIABLE, name), RuntimeWarning)
+
+                name = _AUTOMATIC
+
+            if name != _AUTOMATIC:
+                _SELECTED_BACKEND["backend"] = (name, _get_registered_backend(name))
+            else:
+                name = _read_cached_backend_name()
+
+                if name is None:
+                    name = _calibrate()
+                    _write_cached_backend_name(name)
+
+                _SELECTED_BACKEND["backend"] = (name, _get_registered_backend(name))
+
+        return _SELECTED_BACKEND["backend"]
+
+
+def _get_registered_backend(name):
+    """Returns the backend registered under the supplied name.
+    """
+
+    for registered_name, backend in _BACKENDS:
+        if registered_name == name:
+            return backend
+
+    template = "Unknown CRC-64 backend '{0}', expected one of: {1}."
+    raise ValueError(template.format(name, ", ".join(_get_available_backend_names())))
+
+
+def _get_available_backend_names():
+    """Returns a list of the names of the registered backends that are available on this host.
+    """
+
+    return [name for name, backend in _BACKENDS if _is_available(backend)]
+
+
+def _is_available(backend):
+    """Returns whether the supplied backend may be used on this host.
+    """
+
+    return getattr(backend, "AVAILABLE", True)
+
+
+def _calibrate():
+    """Self-tests and times every available backend, and returns the name of the fastest backend
+       that computes correct CRC-64s. Each backend is timed from its first use, so that the cost of
+       importing and compiling its dependencies is counted along with its throughput.
+    """
+
+    content = bytearray((i * 131 + (i >> 8)) & 0xff for i in range(0, _CALIBRATION_SIZE))
+
+    reference_calculator = _Crc64Calculator(_POLYNOMIAL)
+    reference_calculator.update(content)
+    expected_crc64 = reference_calculator.crc64
+
+    best_name = None
+    best_time = None
+
+    for name in _get_available_backend_names():
+        backend = _get_registered_backend(name)
+
+        try:
+            first_use_time = _time_first_use(backend, content)
+
+            if not _self_test(backend, content, expected_crc64):
+                continue
+
+            elapsed = first_use_time + _time_backend(backend, content)
+        except Exception: # pylint: disable=locally-disabled, broad-except
+            # a backend that fails on this host (e.g. a broken optional dependency) is never
+            # selected
+            continue
+
+        if best_time is None or elapsed < best_time:
+            best_name = name
+            best_time = elapsed
+
+    return best_name
+
+
+def _self_test(backend, content=None, expected_crc64=None):
+    """Returns whether the supplied backend reproduces the check CRC-64 and, where content is
+       supplied, the supplied expected CRC-64 of that content.
+    """
+
+    calculator = _Crc64Calculator(_POLYNOMIAL, backend=backend)
+    calculator.update(_CHECK_CONTENT)
+
+    if calculator.crc64 != Crc64Result(_CHECK_CRC64):
+        return False
+
+    if content is None:
+        return True
+
+    calculator = _Crc64Calculator(_POLYNOMIAL, backend=backend)
+    calculator.update(content)
+
+    return calculator.crc64 == expected_crc64
+
+
+def _time_first_use(backend, content):
+    """Returns the number of seconds taken to construct a calculator with the supplied backend and
+       update it with the supplied content, which on the backend's first use in the process
+       includes importing and compiling any optional dependencies it requires.
+    """
+
+    start = default_timer()
+
+    calculator = _Crc64Calculator(_POLYNOMIAL, backend=backend)
+    calculator.update(content)
+
+    return default_timer() - start
+
+
+def _time_backend(backend, content):
+    """Returns the best number of seconds taken by the supplied backend to update a calculator with
+       the supplied content.
+    """
+
+    calculator = _Crc64Calculator(_POLYNOMIAL, backend=backend)
+
+    timings = []
+
+    for _ in range(0, _CALIBRATION_REPEATS):
+        start = default_timer()
+        calculator.update(content)
+        timings.append(default_timer() - start)
+
+    return min(timings)
+
+
+def _get_cache_folder_path():
+    """Returns the path of the folder holding the calibration cache file, which follows the
+       platform's convention for per-user cache folders.
+    """
+
+    if "LOCALAPPDATA" in environ:
+        return join(environ["LOCALAPPDATA"], "pydvdid", "Cache")
+
+    return join(environ.get("XDG_CACHE_HOME") or join(expanduser("~"), ".cache"), "pydvdid")
+
+
+def _get_fingerprint():
+    """Returns a string identifying the interpreter, processor architecture and available backends
+       of this host, under which its selection is held in the calibration cache file.
+    """
+
+    return "{0} {1} {2} {3}".format(python_implementation(), python_version(), machine(),
+                                    ",".join(_get_available_backend_names()))
+
+
+def _read_cached_backend_names():
+    """Returns the dictionary of backend names held in the calibration cache file, keyed by the
+       fingerprint of the host configuration that selected them, or an empty dictionary when the
+       file does not exist or cannot be read.
+    """
+
+    try:
+        with open(join(_get_cache_folder_path(), _CACHE_FILE_NAME), "rb") as cache_file:
+            cache = loads(cache_file.read().decode("utf-8"))
+    except (IOError, OSError, ValueError):
+        return {}
+
+    if not isinstance(cache, dict):
+        return {}
+
+    return cache
+
+
+def _read_cached_backend_name():
+    """Returns the name of the backend held in the calibration cache file for this host
+       configuration, or None when there is none, or when the backend no longer passes its
+       self-test (e.g. an optional dependency it requires has since been broken).
+    """
+
+    name = _read_cached_backend_names().get(_get_fingerprint())
+
+    if name not in _get_available_backend_names():
+        return None
+
+    try:
+        if not _self_test(_get_registered_backend(name)):
+            return None
+    except Exception: # pylint: disable=locally-disabled, broad-except
+        return None
+
+    return name
+
+
+def _write_cached_backend_name(name):
+    """Writes the supplied backend name to the calibration cache file for this host configuration,
+       keeping the names held for other configurations (e.g. of other hosts sharing a home folder),
+       and replacing the file atomically where the platform allows. Failure to write the file is
+       ignored, as calibration is merely repeated by the next process.
+       No return value.
+    """
+
+    cache_folder_path = _get_cache_folder_path()
+    cache_file_path = join(cache_folder_path, _CACHE_FILE_NAME)
+    temporary_file_path = "{0}.{1}".format(cache_file_path, getpid())
+
+    cache = _read_cached_backend_names()
+    cache[_get_fingerprint()] = name
+
+    try:
+        if not isdir(cache_folder_path):
+            makedirs(cache_folder_path)
+
+        with open(temporary_file_path, "wb") as cache_file:
+            cache_file.write(dumps(cache, indent=2, sort_keys=True).encode("utf-8"))
+
+        try:
+            rename(temporary_file_path, cache_file_path)
+        except OSError:
+            # Windows refuses to rename over an existing file
+            remove(cache_file_path)
+            rename(temporary_file_path, cache_file_path)
+    except (IOError, OSError):
+        pass
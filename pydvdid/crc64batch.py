@@ -0,0 +1,39 @@
+"""Implements the public batch CRC-64 function.
+"""
+
+
+from __future__ import absolute_import
+from .crc64backends import _get_crc64_backend
+from .crc64calculator import _Crc64Calculator
+from .crc64numpy import _NumpyCrc64Backend
+from .crc64result import Crc64Result
+
+
+# batches of fewer contents than this are not worth transposing, so are checksummed one at a time
+_MINIMUM_BATCH_SIZE = 0x10
+
+
+def compute_crc64_batch(contents, polynomial=0x92c64265d32139a4, initial_xor=0xffffffffffffffff):
+    """Computes the 64-bit Cyclic Redundancy Check checksum of each of the supplied contents, which
+       may differ in length, in a single vectorised pass where NumPy is installed (e.g. to checksum
+       the IFO files of a library of discs at once). The polynomial and initial XOR default to
+       those used by compute.
+       Returns a list of Crc64Result, in the order of the supplied contents.
+    """
+
+    contents = list(contents)
+
+    if _NumpyCrc64Backend.AVAILABLE and len(contents) >= _MINIMUM_BATCH_SIZE:
+        backend = _NumpyCrc64Backend(polynomial)
+        crc64s = backend.update_batch([initial_xor] * len(contents), contents)
+
+        return [Crc64Result(crc64) for crc64 in crc64s]
+
+    results = []
+
+    for content in contents:
+        calculator = _Crc64Calculator(polynomial, initial_xor, backend=_get_crc64_backend())
+        calculator.update(content)
+        results.append(calculator.crc64)
+
+    return results
@@ -0,0 +1,141 @@
+"""Implements the _BigIntCrc64Backend class.
+"""
+
+
+from __future__ import absolute_import
+from binascii import hexlify
+from struct import (
+    pack, unpack
+)
+from .buffers import _as_byte_view
+from .crc64operators import _shift_crc64
+from .crc64slicing import _SlicingBy8Crc64Backend
+
+
+# maps each byte to the byte with its bits in reverse order
+_REVERSED_BITS = bytes(bytearray(int("{0:08b}".format(byte)[::-1], 2) for byte in range(0, 256)))
+
+_FOLDING_CONSTANTS = {}
+
+
+if hasattr(int, "from_bytes"):
+    def _bytes_to_int(content):
+        """Returns the supplied bytes read as a big-endian unsigned integer.
+        """
+
+        return int.from_bytes(content, "big")
+else:
+    def _bytes_to_int(content):
+        """Returns the supplied bytes read as a big-endian unsigned integer.
+
+           (Function provided to enable running on Python 2 which lacks int.from_bytes()).
+        """
+
+        return int(hexlify(content), 16)
+
+
+class _BigIntCrc64Backend(object): # pylint: disable=locally-disabled, too-few-public-methods
+    """Implements a class that updates a 64-bit Cyclic Redundancy Check checksum by polynomial
+       division on Python's arbitrary-precision integers, whose shifts and XORs run over whole
+       machine words.
+
+       A reflected CRC-64 is the bit-reversed remainder of the content, read as a polynomial whose
+       leading coefficient is the first bit, divided by the generator polynomial. The bits of each
+       byte of content are reversed, the bytes are read as a single big-endian integer, and the
+       integer is repeatedly folded in half by multiplying (carry-less) its upper half by the
+       remainder of x^k, until at most three 64-bit words remain, which are reduced by the
+       slicing-by-8 backend. Content is processed in blocks of at most _BLOCK_SIZE bytes, which
+       bounds the size of the integers, and content shorter than _MINIMUM_SIZE bytes is delegated
+       to the slicing-by-8 backend.
+
+       Class initialiser requires a polynomial to seed the construction of the folding constants.
+    """
+
+    # calculators skip zero runs of at least this many bytes rather than updating with them;
+    # shorter runs are cheaper to divide than to split the content around
+    MINIMUM_ZERO_RUN = 0x4000
+
+    _MINIMUM_SIZE = 0x200
+
+    _BLOCK_SIZE = 0x10000
+
+
+    def __init__(self, polynomial):
+        self._polynomial = polynomial
+        self._fallback_backend = _SlicingBy8Crc64Backend(polynomial)
+
+
+    def update(self, crc64, content):
+        """Updates the supplied CRC-64 with the bytes of the supplied content.
+           Returns the updated CRC-64.
+        """
+
+        content = _as_byte_view(content)
+
+        if len(content) < self._MINIMUM_SIZE:
+            return self._fallback_backend.update(crc64, content)
+
+        for offset in range(0, len(content), self._BLOCK_SIZE):
+            crc64 = self._update_block(crc64, bytes(content[offset:offset + self._BLOCK_SIZE]))
+
+        return crc64
+
+
+    def _update_block(self, crc64, block):
+        """Updates the supplied CRC-64 with the supplied bytes.
+           Returns the updated CRC-64.
+        """
+
+        bit_count = len(block) << 3
+
+        # the dividend is the content followed by 64 zero bits, plus the CRC-64 aligned with the
+        # first 64 bits of the content
+        dividend = (_bytes_to_int(block.translate(_REVERSED_BITS)) << 64) ^ (
+            _reverse_bits(crc64) << bit_count)
+        bit_count += 64
+
+        while bit_count > 192:
+            fold_size = 64
+            while (fold_size << 1) < bit_count - 64:
+                fold_size <<= 1
+
+            upper_half = dividend >> fold_size
+            dividend ^= upper_half << fold_size
+
+            for shift in self._get_folding_constant_bits(fold_size):
+                dividend ^= upper_half << shift
+
+            bit_count = max(fold_size, bit_count - fold_size + 64)
+
+        # the remainder of the upper 128 bits is their reflected CRC-64 from zero, to which the
+        # (reflected) lower 64 bits are added
+        upper_bits = pack(b">QQ", dividend >> 128, (dividend >> 64) & 0xffffffffffffffff)
+        crc64 = self._fallback_backend.update(0, upper_bits.translate(_REVERSED_BITS))
+
+        return crc64 ^ _reverse_bits(dividend & 0xffffffffffffffff)
+
+
+    def _get_folding_constant_bits(self, fold_size):
+        """Returns a list of the positions of the bits that are set in the remainder of x^fold_size
+           divided by the generator polynomial, where 'fold_size' is a multiple of 8.
+        """
+
+        key = (self._polynomial, fold_size)
+        bits = _FOLDING_CONSTANTS.get(key)
+
+        if bits is None:
+            # the reflected remainder of x^(8n) is the reflected remainder of 1 (i.e. bit 63)
+            # advanced over n zero bytes
+            constant = _reverse_bits(_shift_crc64(self._polynomial, 1 << 63, fold_size >> 3))
+
+            bits = [bit for bit in range(0, 64) if (constant >> bit) & 0x1]
+            bits = _FOLDING_CONSTANTS.setdefault(key, bits)
+
+        return bits
+
+
+def _reverse_bits(value):
+    """Returns the supplied unsigned 64-bit integer with its bits in reverse order.
+    """
+
+    return unpack(b">Q", pack(b"<Q", value).translate(_REVERSED_BITS))[0]
@@ -3,20 +3,61 @@
 
 
 from __future__ import absolute_import
+from struct import (
+    calcsize, error as StructError, pack, unpack
+)
+from .buffers import (
+    _as_byte_view, _find_zero_runs
+)
+from .crc64operators import _shift_crc64
 from .crc64result import Crc64Result
+from .crc64tables import (
+    _get_lookup_table, _get_update_function
+)
 
 
 class _Crc64Calculator(object):
     """Implements a class that calculates a 64-bit Cyclic Redundancy Check checksum.
 
-       Class initialiser requires a polynomial to seed the construction of a lookup table and an
-       optional initial XOR value.
+       Class initialiser requires a polynomial to seed the construction of a lookup table, an
+       optional initial XOR value and an optional backend class. When a backend class is supplied,
+       an instance of it is constructed from the polynomial and updates are delegated to it;
+       otherwise the byte-at-a-time reference implementation is used, by way of an update function
+       specialised for the polynomial.
+
+       The state of a calculator (its polynomial, current CRC-64 and the number of bytes it has
+       been updated with) may be forked with copy(), or serialised with snapshot() and later
+       resumed with restore().
+
+       Long runs of zero bytes (e.g. the padding of IFO files and of ISO image sectors) are not
+       enumerated, but are accounted for by advancing the CRC-64 over them in O(log(length)) steps
+       with GF(2) matrix operators. A run must be at least MINIMUM_ZERO_RUN bytes long, which a
+       backend class declares according to its own speed (None disables the detection of runs).
     """
 
-    def __init__(self, polynomial, initial_xor=0xffffffffffffffff):
+    _backend = None
+
+    _length = 0
+
+    # a snapshot is the polynomial, the current CRC-64 and the byte count, as little-endian
+    # unsigned 64-bit integers
+    _SNAPSHOT_FORMAT = b"<QQQ"
+
+    _COALESCE_SIZE = 0x100
+
+    # the minimum zero run for the reference implementation, which is overridden by the backend
+    _minimum_zero_run = 0x100
+
+
+    def __init__(self, polynomial, initial_xor=0xffffffffffffffff, backend=None):
         self._construct_lookup_table(polynomial)
+        self._polynomial = polynomial
         self._crc64 = initial_xor
 
+        if backend is not None:
+            self._backend = backend(polynomial)
+            self._minimum_zero_run = backend.MINIMUM_ZERO_RUN
+
 
     @property
     def crc64(self):
@@ -26,30 +67,119 @@ class _Crc64Calculator(object):
         return Crc64Result(self._crc64)
 
 
+    @property
+    def length(self):
+        """Returns the number of bytes the CRC-64 has been updated with.
+        """
+
+        return self._length
+
+
+    def copy(self):
+        """Returns a new calculator with the same polynomial, backend, CRC-64 and byte count, which
+           may be updated independently of this calculator.
+        """
+
+        calculator = self.__class__.__new__(self.__class__)
+        calculator.__dict__.update(self.__dict__)
+
+        return calculator
+
+
+    def snapshot(self):
+        """Returns the state of the calculator as a compact bytes object, from which an equivalent
+           calculator may be resumed with restore().
+        """
+
+        return pack(self._SNAPSHOT_FORMAT, self._polynomial, self._crc64, self._length)
+
+
+    @classmethod
+    def restore(cls, snapshot, backend=None):
+        """Returns a new calculator resumed from the state in the supplied snapshot, as returned by
+           snapshot(), with an optional backend class.
+        """
+
+        try:
+            polynomial, crc64, length = unpack(cls._SNAPSHOT_FORMAT, snapshot)
+        except StructError:
+            template = "Snapshot must be {0} bytes long."
+            raise ValueError(template.format(calcsize(cls._SNAPSHOT_FORMAT))) # pylint: disable=locally-disabled, raise-missing-from
+
+        calculator = cls(polynomial, crc64, backend)
+        calculator._length = length # pylint: disable=locally-disabled, protected-access
+
+        return calculator
+
+
     def update(self, content):
-        """Enumerates the bytes of the supplied bytearray and updates the CRC-64.
+        """Enumerates the bytes of the supplied content and updates the CRC-64. Content may be any
+           object supporting the buffer protocol, which is read without copying, or a sequence of
+           integers.
            No return value.
         """
 
-        for byte in content:
-            self._crc64 = (self._crc64 >> 8) ^ self._lookup_table[(self._crc64 & 0xff) ^ byte]
+        content = _as_byte_view(content)
+        self._length += len(content)
 
+        if self._minimum_zero_run is None or len(content) < self._minimum_zero_run:
+            self._update_bytes(content)
+            return
 
-    def _construct_lookup_table(self, polynomial):
-        """Precomputes a CRC-64 lookup table seeded from the supplied polynomial.
+        offset = 0
+
+        for run_start, run_end in _find_zero_runs(content, self._minimum_zero_run):
+            self._update_bytes(content[offset:run_start])
+            self._crc64 = _shift_crc64(self._polynomial, self._crc64, run_end - run_start)
+            offset = run_end
+
+        self._update_bytes(content[offset:])
+
+
+    def update_many(self, contents):
+        """Updates the CRC-64 with each of the supplied contents in turn, as if they were
+           concatenated. Contents shorter than _COALESCE_SIZE bytes are gathered into a single
+           buffer before updating, so that a run of small contents pays the cost of one update.
            No return value.
         """
 
-        self._lookup_table = []
+        pending_content = bytearray()
+
+        for content in contents:
+            content = _as_byte_view(content)
+
+            if len(content) < self._COALESCE_SIZE:
+                pending_content += content
+                continue
 
-        for i in range(0, 256):
-            lookup_value = i
+            if pending_content:
+                self.update(pending_content)
+                del pending_content[:]
 
-            for _ in range(0, 8):
-                if lookup_value & 0x1 == 0x1:
-                    lookup_value = (lookup_value >> 1) ^ polynomial
+            self.update(content)
 
-                else:
-                    lookup_value = lookup_value >> 1
+        if pending_content:
+            self.update(pending_content)
+
+
+    def _update_bytes(self, content):
+        """Updates the CRC-64 with the bytes of the supplied byte view, by way of the backend where
+           one was supplied.
+           No return value.
+        """
+
+        if self._backend is not None:
+            self._crc64 = self._backend.update(self._crc64, content)
+            return
+
+        self._crc64 = self._update_function(self._crc64, content)
+
+
+    def _construct_lookup_table(self, polynomial):
+        """Retrieves the shared CRC-64 lookup table seeded from the supplied polynomial, and the
+           update function specialised for it, which are constructed on first use.
+           No return value.
+        """
 
-            self._lookup_table.append(lookup_value)
+        self._lookup_table = _get_lookup_table(polynomial)
+        self._update_function = _get_update_function(polynomial)
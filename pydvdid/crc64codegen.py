@@ -0,0 +1,22 @@
+"""Implements the creation of CRC-64 update functions specialised for a lookup table.
+"""
+
+
+from __future__ import absolute_import
+
+
+def _create_update_function(lookup_table):
+    """Returns a function that updates a CRC-64 with the bytes of a byte view by way of the supplied
+       lookup table, and returns the updated CRC-64.
+
+       The lookup table (as a tuple) is bound as a default argument, so that the loop only ever
+       accesses locals.
+    """
+
+    def _update(crc64, content, lookup_table=tuple(lookup_table)):
+        for byte in content:
+            crc64 = (crc64 >> 8) ^ lookup_table[(crc64 & 0xff) ^ byte]
+
+        return crc64
+
+    return _update
@@ -0,0 +1,35 @@
+"""Implements the public combine function and supporting 'private' functions.
+"""
+
+
+from __future__ import absolute_import
+from .crc64operators import _shift_crc64
+from .crc64result import Crc64Result
+
+
+def combine(crc64_a, crc64_b, length_b, polynomial=0x92c64265d32139a4,
+            initial_xor=0xffffffffffffffff):
+    """Combines the 64-bit Cyclic Redundancy Check checksums of two independently checksummed
+       segments of content into the checksum of their concatenation, in the style of zlib's
+       crc32_combine. The second segment is 'length_b' bytes long; the length of the first segment
+       is not required. Checksums may be supplied either as Crc64Result objects or integers, and the
+       polynomial and initial XOR default to those used by compute.
+    """
+
+    crc64_a = _get_crc64_value(crc64_a)
+    crc64_b = _get_crc64_value(crc64_b)
+
+    # a CRC-64 is linear in its initial value, so the checksum of the concatenation is the
+    # checksum of the first segment advanced over length_b zero bytes, with the contribution that
+    # the initial XOR made to the checksum of the second segment replaced by it
+    return Crc64Result(_shift_crc64(polynomial, crc64_a ^ initial_xor, length_b) ^ crc64_b)
+
+
+def _get_crc64_value(crc64):
+    """Returns the integer value of the supplied CRC-64, which may be a Crc64Result or an integer.
+    """
+
+    if isinstance(crc64, Crc64Result):
+        return crc64._crc64 # pylint: disable=locally-disabled, protected-access
+
+    return crc64
@@ -0,0 +1,73 @@
+"""Implements the Crc64Hash class.
+"""
+
+
+from __future__ import absolute_import
+from __future__ import unicode_literals
+from struct import pack
+from .crc64backends import _get_crc64_backend
+from .crc64calculator import _Crc64Calculator
+
+
+class Crc64Hash(object):
+    """Implements a class that calculates a 64-bit Cyclic Redundancy Check checksum through the same
+       interface as the hash objects of the hashlib module, so that it may be used wherever a hash
+       object is expected.
+
+       Class initialiser accepts optional initial content, and an optional polynomial and initial
+       XOR value, which default to those used by compute. Content may be any object supporting the
+       buffer protocol (e.g. bytes, bytearray, memoryview, mmap and array objects), which is read
+       without copying.
+    """
+
+    name = "crc64"
+
+    digest_size = 8
+
+    block_size = 1
+
+
+    def __init__(self, content=b"", polynomial=0x92c64265d32139a4, initial_xor=0xffffffffffffffff):
+        self._calculator = _Crc64Calculator(polynomial, initial_xor, backend=_get_crc64_backend())
+        self._calculator.update(content)
+
+
+    @property
+    def crc64(self):
+        """Returns the current CRC-64 as a Crc64Result.
+        """
+
+        return self._calculator.crc64
+
+
+    def update(self, content):
+        """Updates the CRC-64 with the supplied content.
+           No return value.
+        """
+
+        self._calculator.update(content)
+
+
+    def digest(self):
+        """Returns the current CRC-64 as 8 big-endian bytes.
+        """
+
+        return pack(b">Q", self._calculator._crc64) # pylint: disable=locally-disabled, protected-access
+
+
+    def hexdigest(self):
+        """Returns the current CRC-64 formatted as a lowercase hex string.
+        """
+
+        return str(self._calculator.crc64)
+
+
+    def copy(self):
+        """Returns a new hash object with the same state, which may be updated independently of this
+           hash object.
+        """
+
+        crc64_hash = self.__class__.__new__(self.__class__)
+        crc64_hash._calculator = self._calculator.copy() # pylint: disable=locally-disabled, protected-access
+
+        return crc64_hash
@@ -0,0 +1,50 @@
+"""Implements the _NumbaCrc64Backend class.
+"""
+
+
+from __future__ import absolute_import
+from .buffers import _as_byte_view
+from .crc64tables import _get_slicing_tables
+from .dependencies import _is_installed
+
+
+class _NumbaCrc64Backend(object): # pylint: disable=locally-disabled, too-few-public-methods
+    """Implements a class that updates a 64-bit Cyclic Redundancy Check checksum using a
+       slicing-by-8 kernel compiled by numba, which reads the content through a NumPy uint8 view
+       (without copying) and releases the GIL, so that several threads may checksum separate
+       content at native speed.
+
+       Class initialiser requires a polynomial to seed the construction of the lookup tables.
+       AVAILABLE is False when numba (or NumPy) is not installed, in which case the class may not be
+       instantiated. numba and NumPy are only imported, and the kernel compiled, when the first
+       instance is initialised (importing numba is slow), and the compiled code is cached on disk
+       where the package folder is writable.
+    """
+
+    AVAILABLE = _is_installed("numba") and _is_installed("numpy")
+
+    # calculators skip zero runs of at least this many bytes rather than updating with them;
+    # shorter runs are cheaper to update with than to split the content around
+    MINIMUM_ZERO_RUN = 0x10000
+
+
+    def __init__(self, polynomial):
+        if not self.AVAILABLE:
+            raise ImportError("numba is required by _NumbaCrc64Backend but is not installed.")
+
+        from . import crc64numbakernel # pylint: disable=locally-disabled, import-outside-toplevel
+
+        self._numpy = crc64numbakernel.numpy
+        self._update_kernel = crc64numbakernel.update_kernel
+        self._lookup_tables = self._numpy.array(_get_slicing_tables(polynomial, 8),
+                                                dtype=self._numpy.uint64)
+
+
+    def update(self, crc64, content):
+        """Updates the supplied CRC-64 with the bytes of the supplied content.
+           Returns the updated CRC-64.
+        """
+
+        content = self._numpy.frombuffer(_as_byte_view(content), dtype=self._numpy.uint8)
+
+        return int(self._update_kernel(self._numpy.uint64(crc64), content, self._lookup_tables))
@@ -0,0 +1,48 @@
+"""Implements the numba-compiled kernel of the _NumbaCrc64Backend class.
+
+   (This module imports numba and NumPy, so is only imported when a _NumbaCrc64Backend instance is
+   first initialised, rather than whenever the package is imported).
+"""
+
+
+from __future__ import absolute_import
+import numba
+import numpy
+
+
+# the kernel's arithmetic is kept in unsigned 64-bit integers throughout, as numba promotes
+# mixed signed and unsigned integer arithmetic to floating point
+_BYTE_MASK = numpy.uint64(0xff)
+
+_SHIFTS = tuple(numpy.uint64(shift) for shift in range(0, 64, 8))
+
+
+@numba.njit(nogil=True, cache=True)
+def update_kernel(crc64, content, lookup_tables): # pragma: no cover
+    """Updates the supplied CRC-64 with the supplied uint8 array by way of the supplied 8x256
+       uint64 array of slicing-by-8 lookup tables, without holding the GIL.
+       Returns the updated CRC-64.
+    """
+
+    sliced_size = content.size - (content.size % 8)
+
+    for offset in range(0, sliced_size, 8):
+        for index in range(0, 8):
+            crc64 ^= numpy.uint64(content[offset + index]) << _SHIFTS[index]
+
+        crc64 = (
+            lookup_tables[7, crc64 & _BYTE_MASK] ^
+            lookup_tables[6, (crc64 >> _SHIFTS[1]) & _BYTE_MASK] ^
+            lookup_tables[5, (crc64 >> _SHIFTS[2]) & _BYTE_MASK] ^
+            lookup_tables[4, (crc64 >> _SHIFTS[3]) & _BYTE_MASK] ^
+            lookup_tables[3, (crc64 >> _SHIFTS[4]) & _BYTE_MASK] ^
+            lookup_tables[2, (crc64 >> _SHIFTS[5]) & _BYTE_MASK] ^
+            lookup_tables[1, (crc64 >> _SHIFTS[6]) & _BYTE_MASK] ^
+            lookup_tables[0, crc64 >> _SHIFTS[7]]
+        )
+
+    for offset in range(sliced_size, content.size):
+        crc64 = (crc64 >> _SHIFTS[1]) ^ lookup_tables[
+            0, (crc64 & _BYTE_MASK) ^ numpy.uint64(content[offset])]
+
+    return crc64
@@ -0,0 +1,287 @@
+"""Implements the _NumpyCrc64Backend class.
+"""
+
+
+from __future__ import absolute_import
+from .buffers import _as_byte_view
+from .crc64operators import (
+    _get_zeros_operator, _shift_crc64
+)
+from .crc64slicing import _SlicingBy8Crc64Backend
+from .crc64tables import _get_lookup_table
+from .dependencies import (
+    _import_numpy, _is_installed
+)
+
+
+# the folding tables, by polynomial and length, which are shared between all backends seeded from
+# the same polynomial
+_FOLDING_TABLES = {}
+
+
+class _NumpyCrc64Backend(object):
+    """Implements a class that updates a 64-bit Cyclic Redundancy Check checksum using NumPy.
+
+       Content is split into lanes of _LANE_SIZE bytes, a table-driven CRC-64 is run across all of
+       the lanes at once, and the lane CRC-64s are then folded together pairwise using GF(2)
+       matrices that advance a CRC-64 over the length of the lanes being folded. Content is
+       processed in blocks of at most _MAXIMUM_LANES lanes, so content of any size (e.g. a whole ISO
+       image) may be supplied. Content too short to fill _MINIMUM_LANES lanes is delegated to the
+       slicing-by-8 backend.
+
+       Many independent contents (e.g. the IFO files of a library of discs) may be updated in a
+       single pass with update_batch(), which runs the lanes of every content at once.
+
+       Class initialiser requires a polynomial to seed the construction of the lookup table.
+       AVAILABLE is False when NumPy is not installed, in which case the class may not be
+       instantiated. NumPy is only imported when the first instance is initialised.
+    """
+
+    AVAILABLE = _is_installed("numpy")
+
+    # calculators skip zero runs of at least this many bytes rather than updating with them;
+    # shorter runs are cheaper to update with than to split the content around
+    MINIMUM_ZERO_RUN = 0x10000
+
+    _LANE_SIZE = 0x80
+
+    _MINIMUM_LANES = 0x10
+
+    _MAXIMUM_LANES = 0x1000
+
+    # batches are split into lanes of _BATCH_LANE_SIZE bytes, and are updated in groups holding at
+    # least _BATCH_GROUP_SIZE bytes, which bounds the memory used to transpose them
+    _BATCH_LANE_SIZE = 0x100
+
+    _BATCH_GROUP_SIZE = 0x1000000
+
+
+    def __init__(self, polynomial):
+        numpy = _import_numpy()
+
+        if numpy is None:
+            raise ImportError("NumPy is required by _NumpyCrc64Backend but is not installed.")
+
+        self._numpy = numpy
+        self._polynomial = polynomial
+        self._lookup_table = numpy.asarray(_get_lookup_table(polynomial), dtype=numpy.uint64)
+        self._fallback_backend = _SlicingBy8Crc64Backend(polynomial)
+
+
+    def update(self, crc64, content):
+        """Updates the supplied CRC-64 with the bytes of the supplied content.
+           Returns the updated CRC-64.
+        """
+
+        numpy = self._numpy
+        content = _as_byte_view(content)
+        minimum_size = self._LANE_SIZE * self._MINIMUM_LANES
+
+        if len(content) < minimum_size:
+            return self._fallback_backend.update(crc64, content)
+
+        content_array = numpy.frombuffer(content, dtype=numpy.uint8)
+
+        offset = 0
+        remaining_size = content_array.size
+
+        while remaining_size >= minimum_size:
+            lane_count = self._MINIMUM_LANES
+            while (lane_count < self._MAXIMUM_LANES and
+                   (lane_count << 1) * self._LANE_SIZE <= remaining_size):
+                lane_count <<= 1
+
+            block_size = lane_count * self._LANE_SIZE
+            crc64 = self._update_block(crc64, content_array[offset:offset + block_size], lane_count)
+
+            offset += block_size
+            remaining_size -= block_size
+
+        return self._fallback_backend.update(crc64, content[offset:])
+
+
+    def update_batch(self, crc64s, contents):
+        """Updates each of the supplied CRC-64s with the bytes of the corresponding supplied
+           content, which may differ in length, advancing many contents in lockstep.
+           Returns a list of the updated CRC-64s.
+        """
+
+        numpy = self._numpy
+        contents = [
+            numpy.frombuffer(_as_byte_view(content), dtype=numpy.uint8) for content in contents
+        ]
+
+        updated_crc64s = []
+        group_start = 0
+        group_size = 0
+
+        for index, content in enumerate(contents):
+            if content.size > self._BATCH_GROUP_SIZE:
+                # content this large gains nothing from batching, so is updated alone
+                updated_crc64s.extend(self._update_batch_group(crc64s[group_start:index],
+                                                               contents[group_start:index]))
+                updated_crc64s.append(self.update(crc64s[index], content))
+                group_start = index + 1
+                group_size = 0
+                continue
+
+            group_size += content.size
+
+            if group_size >= self._BATCH_GROUP_SIZE:
+                updated_crc64s.extend(self._update_batch_group(crc64s[group_start:index + 1],
+                                                               contents[group_start:index + 1]))
+                group_start = index + 1
+                group_size = 0
+
+        updated_crc64s.extend(
+            self._update_batch_group(crc64s[group_start:], contents[group_start:]))
+
+        return updated_crc64s
+
+
+    def _update_batch_group(self, crc64s, contents): # pylint: disable=locally-disabled, too-many-locals
+        """Updates each of the supplied CRC-64s with the corresponding supplied uint8 content.
+
+           Every content is split into segments of _BATCH_LANE_SIZE bytes (the first left-padded
+           with zeros) and a table-driven CRC-64 is run across all segments of all contents at once,
+           starting from zero. Zero bytes leave a zero CRC-64 unchanged, so the padding has no
+           effect. The segment CRC-64s of each content are then folded together pairwise, right
+           aligned in a grid so that all contents are folded at once, and each supplied CRC-64 is
+           finally accounted for by advancing it over the length of its content.
+           Returns a list of the updated CRC-64s.
+        """
+
+        numpy = self._numpy
+
+        if not contents:
+            return []
+
+        lane_size = self._BATCH_LANE_SIZE
+        segment_counts = [-(-content.size // lane_size) for content in contents]
+        segment_total = sum(segment_counts)
+
+        lanes = numpy.zeros(segment_total * lane_size, dtype=numpy.uint8)
+        end = 0
+        for content, segment_count in zip(contents, segment_counts):
+            end += segment_count * lane_size
+            lanes[end - content.size:end] = content
+
+        lane_crc64s = self._update_lanes(
+            numpy.zeros(segment_total, dtype=numpy.uint64),
+            numpy.ascontiguousarray(lanes.reshape(segment_total, lane_size).T))
+
+        grid_width = 1
+        while grid_width < max(segment_counts):
+            grid_width <<= 1
+
+        grid = numpy.zeros((len(contents), grid_width), dtype=numpy.uint64)
+        start = 0
+        for index, segment_count in enumerate(segment_counts):
+            grid[index, grid_width - segment_count:] = lane_crc64s[start:start + segment_count]
+            start += segment_count
+
+        while grid.shape[1] > 1:
+            folding_tables = self._get_folding_tables(lane_size)
+            grid = self._apply_operator(folding_tables, grid[:, 0::2]) ^ grid[:, 1::2]
+            lane_size <<= 1
+
+        shifted_crc64s = {}
+        updated_crc64s = []
+
+        for crc64, content, folded_crc64 in zip(crc64s, contents, grid[:, 0]):
+            key = (crc64, content.size)
+            if key not in shifted_crc64s:
+                shifted_crc64s[key] = _shift_crc64(self._polynomial, crc64, content.size)
+
+            updated_crc64s.append(shifted_crc64s[key] ^ int(folded_crc64))
+
+        return updated_crc64s
+
+
+    def _update_block(self, crc64, block, lane_count):
+        """Updates the supplied CRC-64 with the supplied block of uint8 content, which holds
+           exactly 'lane_count' lanes, where 'lane_count' is a power of two.
+           Returns the updated CRC-64.
+        """
+
+        numpy = self._numpy
+
+        # the first lane continues from the supplied CRC-64, every other lane starts from zero and
+        # is accounted for by linearity when the lanes are folded together
+        lane_crc64s = numpy.zeros(lane_count, dtype=numpy.uint64)
+        lane_crc64s[0] = crc64
+
+        lane_crc64s = self._update_lanes(
+            lane_crc64s, numpy.ascontiguousarray(block.reshape(lane_count, self._LANE_SIZE).T))
+
+        lane_size = self._LANE_SIZE
+
+        while lane_crc64s.size > 1:
+            folding_tables = self._get_folding_tables(lane_size)
+            lane_crc64s = (self._apply_operator(folding_tables, lane_crc64s[0::2]) ^
+                           lane_crc64s[1::2])
+            lane_size <<= 1
+
+        return int(lane_crc64s[0])
+
+
+    def _update_lanes(self, lane_crc64s, rows):
+        """Updates the supplied uint64 array of lane CRC-64s in place with the supplied rows of
+           uint8 content, where each row holds the next byte of every lane.
+           Returns the updated lane CRC-64s.
+        """
+
+        numpy = self._numpy
+        lookup_table = self._lookup_table
+        indices = numpy.empty_like(lane_crc64s)
+        eight = numpy.uint64(8)
+        byte_mask = numpy.uint64(0xff)
+
+        for row in rows:
+            numpy.bitwise_and(lane_crc64s, byte_mask, out=indices)
+            numpy.bitwise_xor(indices, row, out=indices)
+            numpy.right_shift(lane_crc64s, eight, out=lane_crc64s)
+            numpy.bitwise_xor(lane_crc64s, lookup_table.take(indices), out=lane_crc64s)
+
+        return lane_crc64s
+
+
+    def _get_folding_tables(self, length):
+        """Returns the GF(2) matrix that advances a CRC-64 over 'length' zero bytes, as an 8x256
+           uint64 array of lookup tables, where the table at index i holds the product of the matrix
+           and each value of byte i of a vector. The tables are constructed on first use, and shared
+           between all backends seeded from the same polynomial.
+        """
+
+        numpy = self._numpy
+        key = (self._polynomial, length)
+        folding_tables = _FOLDING_TABLES.get(key)
+
+        if folding_tables is None:
+            columns = numpy.array(_get_zeros_operator(self._polynomial, length),
+                                  dtype=numpy.uint64).reshape(8, 8)
+            byte_values = numpy.arange(256, dtype=numpy.uint64)
+
+            folding_tables = numpy.zeros((8, 256), dtype=numpy.uint64)
+            for bit in range(0, 8):
+                bit_set = ((byte_values >> numpy.uint64(bit)) & numpy.uint64(1)).astype(bool)
+                folding_tables[:, bit_set] ^= columns[:, bit, numpy.newaxis]
+
+            folding_tables = _FOLDING_TABLES.setdefault(key, folding_tables)
+
+        return folding_tables
+
+
+    def _apply_operator(self, folding_tables, vectors):
+        """Returns the products of a GF(2) matrix, as returned by _get_folding_tables(), and each of
+           the supplied uint64 vectors.
+        """
+
+        numpy = self._numpy
+        products = folding_tables[0].take(vectors & numpy.uint64(0xff))
+
+        for index in range(1, 8):
+            byte_values = (vectors >> numpy.uint64(index << 3)) & numpy.uint64(0xff)
+            products ^= folding_tables[index].take(byte_values)
+
+        return products
@@ -0,0 +1,153 @@
+"""Implements GF(2) matrix operators that advance a CRC-64 over runs of zero bytes.
+
+   A matrix is represented as a list of 64 integers, where the integer at index i is the image of
+   the vector with only bit i set (i.e. the matrix's ith column).
+"""
+
+
+from __future__ import absolute_import
+from threading import Lock
+from .crc64tables import _get_lookup_table
+
+
+_OPERATORS_LOCK = Lock()
+
+_POWER_OF_TWO_ZEROS_OPERATORS = {}
+
+_POWER_OF_TWO_ZEROS_NIBBLE_TABLES = {}
+
+_ZEROS_OPERATORS = {}
+
+
+def _get_zeros_operator(polynomial, length):
+    """Returns the GF(2) matrix that advances a CRC-64 seeded from the supplied polynomial over
+       'length' zero bytes. Matrices are cached, so callers should request a bounded set of lengths.
+    """
+
+    key = (polynomial, length)
+    operator = _ZEROS_OPERATORS.get(key)
+
+    if operator is None:
+        operator = [1 << bit for bit in range(0, 64)]
+
+        for power_of_two_operator in _get_power_of_two_zeros_operators(polynomial, length):
+            operator = _gf2_matrix_multiply(power_of_two_operator, operator)
+
+        operator = _ZEROS_OPERATORS.setdefault(key, operator)
+
+    return operator
+
+
+def _shift_crc64(polynomial, crc64, length): # pylint: disable=locally-disabled, too-many-locals
+    """Returns the supplied CRC-64 advanced over 'length' zero bytes, for a CRC-64 seeded from the
+       supplied polynomial, in O(log(length)) matrix-vector products.
+    """
+
+    for nibble_tables in _get_power_of_two_zeros_nibble_tables(polynomial, length):
+        (table0, table1, table2, table3, table4, table5, table6, table7, table8, table9, table10,
+         table11, table12, table13, table14, table15) = nibble_tables
+
+        crc64 = (
+            table0[crc64 & 0xf] ^ table1[(crc64 >> 4) & 0xf] ^
+            table2[(crc64 >> 8) & 0xf] ^ table3[(crc64 >> 12) & 0xf] ^
+            table4[(crc64 >> 16) & 0xf] ^ table5[(crc64 >> 20) & 0xf] ^
+            table6[(crc64 >> 24) & 0xf] ^ table7[(crc64 >> 28) & 0xf] ^
+            table8[(crc64 >> 32) & 0xf] ^ table9[(crc64 >> 36) & 0xf] ^
+            table10[(crc64 >> 40) & 0xf] ^ table11[(crc64 >> 44) & 0xf] ^
+            table12[(crc64 >> 48) & 0xf] ^ table13[(crc64 >> 52) & 0xf] ^
+            table14[(crc64 >> 56) & 0xf] ^ table15[crc64 >> 60]
+        )
+
+    return crc64
+
+
+def _get_power_of_two_zeros_nibble_tables(polynomial, length):
+    """Returns a list of the GF(2) matrices returned by _get_power_of_two_zeros_operators(), each
+       as the nibble lookup tables returned by _construct_nibble_tables(), which multiply a vector
+       in 16 lookups rather than up to 64 conditional XORs.
+    """
+
+    all_tables = _POWER_OF_TWO_ZEROS_NIBBLE_TABLES.get(polynomial)
+
+    if all_tables is None or (1 << len(all_tables)) <= length:
+        _get_power_of_two_zeros_operators(polynomial, length)
+
+        with _OPERATORS_LOCK:
+            operators = _POWER_OF_TWO_ZEROS_OPERATORS[polynomial]
+            all_tables = _POWER_OF_TWO_ZEROS_NIBBLE_TABLES.setdefault(polynomial, [])
+
+            while len(all_tables) < len(operators):
+                all_tables.append(_construct_nibble_tables(operators[len(all_tables)]))
+
+    return [tables for bit, tables in enumerate(all_tables) if (length >> bit) & 0x1]
+
+
+def _get_power_of_two_zeros_operators(polynomial, length):
+    """Returns a list of the GF(2) matrices that advance a CRC-64 seeded from the supplied
+       polynomial over 2^k zero bytes, for each bit k that is set in 'length'.
+    """
+
+    operators = _POWER_OF_TWO_ZEROS_OPERATORS.get(polynomial)
+
+    if operators is None or (1 << len(operators)) <= length:
+        with _OPERATORS_LOCK:
+            operators = _POWER_OF_TWO_ZEROS_OPERATORS.setdefault(polynomial, [])
+
+            if not operators:
+                operators.append(_construct_zero_byte_operator(polynomial))
+
+            while (1 << len(operators)) <= length:
+                operators.append(_gf2_matrix_multiply(operators[-1], operators[-1]))
+
+    return [operator for bit, operator in enumerate(operators) if (length >> bit) & 0x1]
+
+
+def _construct_zero_byte_operator(polynomial):
+    """Returns the GF(2) matrix that advances a CRC-64 seeded from the supplied polynomial over a
+       single zero byte.
+    """
+
+    lookup_table = _get_lookup_table(polynomial)
+
+    operator = []
+
+    for bit in range(0, 64):
+        vector = 1 << bit
+        operator.append((vector >> 8) ^ lookup_table[vector & 0xff])
+
+    return operator
+
+
+def _construct_nibble_tables(matrix):
+    """Returns a tuple of 16 lookup tables for the supplied GF(2) matrix, where the table at index i
+       holds the product of the matrix and each value of nibble i of a vector.
+    """
+
+    return tuple(
+        tuple(_gf2_matrix_times(matrix, value << (nibble << 2)) for value in range(0, 16))
+        for nibble in range(0, 16)
+    )
+
+
+def _gf2_matrix_times(matrix, vector):
+    """Returns the product of the supplied GF(2) matrix and vector.
+    """
+
+    product = 0
+    index = 0
+
+    while vector:
+        if vector & 0x1:
+            product ^= matrix[index]
+
+        vector >>= 1
+        index += 1
+
+    return product
+
+
+def _gf2_matrix_multiply(first_matrix, second_matrix):
+    """Returns the GF(2) matrix that applies the second supplied matrix and then the first.
+    """
+
+    return [_gf2_matrix_times(first_matrix, column) for column in second_matrix]
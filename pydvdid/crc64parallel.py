@@ -0,0 +1,231 @@
+"""Implements the public parallel CRC-64 functions and supporting 'private' functions.
+"""
+
+
+from __future__ import absolute_import
+from collections import deque
+from functools import partial
+from os.path import (
+    getsize, isfile
+)
+try:
+    from os import cpu_count
+except ImportError:
+    from multiprocessing import cpu_count
+from .buffers import _as_byte_view
+from .crc64backends import _get_crc64_backend
+from .crc64calculator import _Crc64Calculator
+from .crc64combine import combine
+from .crc64result import Crc64Result
+from .exceptions import (
+    FileContentReadException, PathDoesNotExistException
+)
+
+try:
+    from concurrent.futures import ProcessPoolExecutor
+except ImportError:
+    ProcessPoolExecutor = None
+
+
+# chunks are sized so that each worker receives several of them (which evens out the load when
+# some workers run slower than others), but never fewer than _MINIMUM_CHUNK_SIZE bytes (which
+# amortises the cost of dispatching a chunk to a worker); sizes are rounded up to a multiple of
+# _CHUNK_ALIGNMENT bytes
+_CHUNKS_PER_WORKER = 4
+
+_MINIMUM_CHUNK_SIZE = 0x400000
+
+_CHUNK_ALIGNMENT = 0x10000
+
+_READ_SIZE = 0x100000
+
+
+def compute_crc64_of_files(file_paths, max_workers=None, polynomial=0x92c64265d32139a4,
+                           initial_xor=0xffffffffffffffff):
+    """Computes the 64-bit Cyclic Redundancy Check checksum of the concatenated content of the
+       supplied file paths (e.g. a single ISO image, or a set of VOB files), split across a pool of
+       worker processes which each read and checksum their own byte ranges. The result is
+       identical to checksumming the content sequentially. The polynomial and initial XOR default
+       to those used by compute.
+    """
+
+    file_sizes = []
+
+    for file_path in file_paths:
+        if not isfile(file_path):
+            raise PathDoesNotExistException(file_path)
+
+        file_sizes.append((file_path, getsize(file_path)))
+
+    worker_count = _get_worker_count(max_workers)
+    chunk_size = _get_chunk_size(sum(file_size for _, file_size in file_sizes), worker_count)
+
+    chunks = _split_files_into_chunks(file_sizes, chunk_size)
+    function = partial(_compute_crc64_of_file_ranges, polynomial=polynomial,
+                       initial_xor=initial_xor, backend=_get_crc64_backend())
+
+    return _combine_chunk_crc64s(function, chunks, worker_count, polynomial, initial_xor)
+
+
+def compute_crc64_of_content(content, max_workers=None, polynomial=0x92c64265d32139a4,
+                             initial_xor=0xffffffffffffffff):
+    """Computes the 64-bit Cyclic Redundancy Check checksum of the supplied content, split across a
+       pool of worker processes. The result is identical to checksumming the content sequentially.
+       The polynomial and initial XOR default to those used by compute.
+    """
+
+    content = _as_byte_view(content)
+
+    worker_count = _get_worker_count(max_workers)
+    chunk_size = _get_chunk_size(len(content), worker_count)
+
+    # the chunks are views over the content, which are only copied (to be sent to a worker
+    # process) as they are submitted
+    chunks = [
+        (content[offset:offset + chunk_size], min(chunk_size, len(content) - offset))
+        for offset in range(0, len(content), chunk_size)
+    ]
+    function = partial(_compute_crc64_of_content, polynomial=polynomial, initial_xor=initial_xor,
+                       backend=_get_crc64_backend())
+
+    return _combine_chunk_crc64s(function, chunks, worker_count, polynomial, initial_xor)
+
+
+def _get_worker_count(max_workers):
+    """Returns the number of worker processes to use, defaulting to the number of processors.
+    """
+
+    if max_workers is None:
+        max_workers = cpu_count() or 1
+
+    if max_workers < 1:
+        raise ValueError("max_workers must be greater than 0.")
+
+    return max_workers
+
+
+def _get_chunk_size(content_size, worker_count):
+    """Returns the size of the chunks that content of the supplied size is split into for the
+       supplied number of workers.
+    """
+
+    chunk_count = worker_count * _CHUNKS_PER_WORKER
+    chunk_size = max(-(-content_size // chunk_count), _MINIMUM_CHUNK_SIZE)
+
+    return -(-chunk_size // _CHUNK_ALIGNMENT) * _CHUNK_ALIGNMENT
+
+
+def _split_files_into_chunks(file_sizes, chunk_size):
+    """Returns a list of chunks covering the concatenated content of the supplied (path, size)
+       pairs, where each chunk is a pair of a list of (path, offset, length) file ranges and the
+       total length of those ranges.
+    """
+
+    chunks = []
+    file_ranges = []
+    remaining_chunk_size = chunk_size
+
+    for file_path, file_size in file_sizes:
+        offset = 0
+
+        while offset < file_size:
+            length = min(file_size - offset, remaining_chunk_size)
+            file_ranges.append((file_path, offset, length))
+
+            offset += length
+            remaining_chunk_size -= length
+
+            if remaining_chunk_size == 0:
+                chunks.append((file_ranges, chunk_size))
+                file_ranges = []
+                remaining_chunk_size = chunk_size
+
+    if file_ranges:
+        chunks.append((file_ranges, chunk_size - remaining_chunk_size))
+
+    return chunks
+
+
+def _combine_chunk_crc64s(function, chunks, worker_count, polynomial, initial_xor):
+    """Maps the supplied function over the first element of each supplied chunk, using a pool of
+       worker processes where there is more than one chunk, and combines the resulting CRC-64s in
+       order using the length held in the second element of each chunk.
+       Returns the combined CRC-64 as a Crc64Result.
+    """
+
+    chunk_contents = [chunk_content for chunk_content, _ in chunks]
+
+    if len(chunks) > 1 and worker_count > 1 and ProcessPoolExecutor is not None:
+        worker_count = min(worker_count, len(chunks))
+
+        with ProcessPoolExecutor(max_workers=worker_count) as executor:
+            chunk_crc64s = list(_map_in_order(executor, function, chunk_contents, worker_count + 1))
+    else:
+        chunk_crc64s = [function(chunk_content) for chunk_content in chunk_contents]
+
+    # the CRC-64 of empty content is the initial XOR
+    crc64 = Crc64Result(initial_xor)
+
+    for chunk_crc64, (_, chunk_length) in zip(chunk_crc64s, chunks):
+        crc64 = combine(crc64, chunk_crc64, chunk_length, polynomial, initial_xor)
+
+    return crc64
+
+
+def _map_in_order(executor, function, chunk_contents, max_pending):
+    """Yields the results of the supplied function for each of the supplied chunk contents in
+       order, submitting them to the supplied executor as earlier results are yielded, so that no
+       more than 'max_pending' are pending at once. Memoryview contents (which cannot be sent to a
+       worker process) are copied to bytes as they are submitted, so that the copies held at once
+       are bounded likewise.
+    """
+
+    pending = deque()
+
+    for chunk_content in chunk_contents:
+        if isinstance(chunk_content, memoryview):
+            chunk_content = chunk_content.tobytes()
+
+        pending.append(executor.submit(function, chunk_content))
+
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+
+    while pending:
+        yield pending.popleft().result()
+
+
+def _compute_crc64_of_file_ranges(file_ranges, polynomial, initial_xor, backend):
+    """Returns the CRC-64 of the concatenated content of the supplied (path, offset, length) file
+       ranges as an integer, using the supplied backend. Invoked in a worker process.
+    """
+
+    calculator = _Crc64Calculator(polynomial, initial_xor, backend=backend)
+    view = memoryview(bytearray(_READ_SIZE))
+
+    for file_path, offset, length in file_ranges:
+        with open(file_path, "rb") as file_object:
+            file_object.seek(offset)
+
+            while length > 0:
+                read_size = min(length, _READ_SIZE)
+                content_read = file_object.readinto(view[:read_size])
+
+                if content_read is None or content_read < read_size:
+                    raise FileContentReadException(read_size, content_read)
+
+                calculator.update(view[:read_size])
+                length -= read_size
+
+    return calculator._crc64 # pylint: disable=locally-disabled, protected-access
+
+
+def _compute_crc64_of_content(content, polynomial, initial_xor, backend):
+    """Returns the CRC-64 of the supplied content as an integer, using the supplied backend.
+       Invoked in a worker process.
+    """
+
+    calculator = _Crc64Calculator(polynomial, initial_xor, backend=backend)
+    calculator.update(content)
+
+    return calculator._crc64 # pylint: disable=locally-disabled, protected-access
@@ -3,14 +3,56 @@
 
 
 from __future__ import unicode_literals
+from string import hexdigits
+from struct import (
+    error as StructError, pack, unpack
+)
 
 
 class Crc64Result(object):
     """Implements a class that represents the result of a 64-bit Cyclic Redundancy Check checksum.
+
+       Results are hashable and ordered by the value of their checksum, so that they may be used as
+       dict keys, set members and sort keys. Their attributes are held in slots rather than an
+       instance dict, and the hex string of the checksum is formatted on first use and then cached.
     """
 
+    __slots__ = ("_crc64", "_hex")
+
+    # the checksum as 8 bytes, which is the format returned by to_bytes() and by the digest() of a
+    # Crc64Hash
+    _BYTES_FORMAT = b">Q"
+
+
     def __init__(self, crc64):
         self._crc64 = crc64
+        self._hex = None
+
+
+    @classmethod
+    def from_hex(cls, hex_string):
+        """Returns a Crc64Result from the supplied hex string of up to 16 digits, as returned by
+           str(). Raises a ValueError where the string is not a valid hex string of up to 16 digits.
+        """
+
+        if not 0 < len(hex_string) <= 16 or any(digit not in hexdigits for digit in hex_string):
+            raise ValueError("Hex string must be between 1 and 16 hex digits long.")
+
+        return cls(int(hex_string, 16))
+
+
+    @classmethod
+    def from_bytes(cls, content):
+        """Returns a Crc64Result from the supplied 8 big-endian bytes, as returned by to_bytes().
+           Raises a ValueError where the content is not 8 bytes long.
+        """
+
+        try:
+            crc64, = unpack(cls._BYTES_FORMAT, content)
+        except StructError:
+            raise ValueError("Content must be 8 bytes long.") # pylint: disable=locally-disabled, raise-missing-from
+
+        return cls(crc64)
 
 
     @property
@@ -18,7 +60,7 @@ class Crc64Result(object):
         """Returns the topmost 4 bytes of the checksum formatted as a lowercase hex string.
         """
 
-        return format(self._crc64 >> 32, "08x")
+        return str(self)[:8]
 
 
     @property
@@ -26,16 +68,72 @@ class Crc64Result(object):
         """Returns the bottommost 4 bytes of the checksum formatted as a lowercase hex string.
         """
 
-        return format(self._crc64 & 0xffffffff, "08x")
+        return str(self)[8:]
+
+
+    def to_bytes(self):
+        """Returns the checksum as 8 big-endian bytes.
+        """
+
+        return pack(self._BYTES_FORMAT, self._crc64)
 
 
     def __eq__(self, other):
+        if not isinstance(other, Crc64Result):
+            return NotImplemented
+
         return self._crc64 == other._crc64 # pylint: disable=locally-disabled, protected-access
 
 
     def __ne__(self, other):
-        return not self.__eq__(other)
+        equal = self.__eq__(other)
+
+        return equal if equal is NotImplemented else not equal
+
+
+    def __lt__(self, other):
+        if not isinstance(other, Crc64Result):
+            return NotImplemented
+
+        return self._crc64 < other._crc64 # pylint: disable=locally-disabled, protected-access
+
+
+    def __le__(self, other):
+        if not isinstance(other, Crc64Result):
+            return NotImplemented
+
+        return self._crc64 <= other._crc64 # pylint: disable=locally-disabled, protected-access
+
+
+    def __gt__(self, other):
+        if not isinstance(other, Crc64Result):
+            return NotImplemented
+
+        return self._crc64 > other._crc64 # pylint: disable=locally-disabled, protected-access
+
+
+    def __ge__(self, other):
+        if not isinstance(other, Crc64Result):
+            return NotImplemented
+
+        return self._crc64 >= other._crc64 # pylint: disable=locally-disabled, protected-access
+
+
+    def __hash__(self):
+        return hash(self._crc64)
+
+
+    def __int__(self):
+        return self._crc64
+
+
+    def __reduce__(self):
+        # pickle only the checksum, as slotted instances cannot be pickled with protocols below 2
+        return (self.__class__, (self._crc64,))
 
 
     def __str__(self):
-        return format(self._crc64, "016x")
+        if self._hex is None:
+            self._hex = format(self._crc64, "016x")
+
+        return self._hex
@@ -0,0 +1,330 @@
+"""Implements the Crc64ResultArray class.
+"""
+
+
+from __future__ import absolute_import
+from array import array
+from binascii import (
+    Error as BinasciiError, hexlify, unhexlify
+)
+from bisect import bisect_left
+from sys import (
+    byteorder, modules
+)
+from .crc64combine import _get_crc64_value
+from .crc64result import Crc64Result
+from .dependencies import _import_numpy
+
+
+# checksums are held as an array of unsigned 64-bit integers; older Pythons lack the 'Q' typecode,
+# so fall back to 'L' (which is 64 bits wide on LP64 platforms)
+try:
+    _TYPECODE = "Q"
+    array(_TYPECODE)
+except ValueError:
+    _TYPECODE = "L"
+
+
+class Crc64ResultArray(object):
+    """Implements a class that holds a sequence of 64-bit Cyclic Redundancy Check checksums (e.g.
+       the disc IDs of a catalogue) packed as unsigned 64-bit integers, rather than as a list of
+       Crc64Result objects, at a cost of 8 bytes per checksum.
+
+       Class initialiser accepts an optional iterable of checksums, which may be Crc64Result
+       objects or integers (or a NumPy array of integers). Elements are returned as Crc64Result
+       objects, and checksums may be converted to and from hex strings and big-endian bytes a whole
+       array at a time. Membership tests are binary searches once the array has been sorted with
+       sort(), and set operations return sorted arrays of unique checksums. NumPy is used to sort
+       and to perform set operations where it is installed, and is only imported when first used.
+    """
+
+    def __init__(self, crc64s=()):
+        # a NumPy array can only have been supplied once NumPy is imported, so NumPy is looked up
+        # among the imported modules rather than imported
+        numpy = modules.get("numpy")
+
+        self._sorted = False
+
+        if isinstance(crc64s, Crc64ResultArray):
+            self._crc64s = array(_TYPECODE, crc64s._crc64s) # pylint: disable=locally-disabled, protected-access
+            self._sorted = crc64s._sorted # pylint: disable=locally-disabled, protected-access
+        elif numpy is not None and isinstance(crc64s, numpy.ndarray):
+            self._crc64s = _array_from_bytes(crc64s.astype(numpy.uint64).tobytes())
+        else:
+            self._crc64s = array(_TYPECODE, (_get_crc64_value(crc64) for crc64 in crc64s))
+
+
+    @classmethod
+    def from_hex(cls, hex_strings):
+        """Returns a Crc64ResultArray from the supplied iterable of hex strings of up to 16 digits,
+           as returned by to_hex(). Raises a ValueError where a string is not a valid hex string of
+           up to 16 digits.
+        """
+
+        hex_strings = list(hex_strings)
+
+        if any(not 0 < len(hex_string) <= 16 for hex_string in hex_strings):
+            raise ValueError("Hex strings must be between 1 and 16 hex digits long.")
+
+        try:
+            content = unhexlify("".join(hex_string.rjust(16, "0") for hex_string in hex_strings))
+        except (BinasciiError, TypeError, UnicodeError):
+            raise ValueError("Hex strings must contain only hex digits.") # pylint: disable=locally-disabled, raise-missing-from
+
+        return cls.from_bytes(content)
+
+
+    @classmethod
+    def from_bytes(cls, content):
+        """Returns a Crc64ResultArray from the supplied content of 8 big-endian bytes per checksum,
+           as returned by to_bytes(). Raises a ValueError where the length of the content is not a
+           multiple of 8 bytes.
+        """
+
+        content = bytes(content)
+
+        if len(content) % 8:
+            raise ValueError("Content must be a multiple of 8 bytes long.")
+
+        crc64s = _array_from_bytes(content)
+        if byteorder == "little":
+            crc64s.byteswap()
+
+        return cls._from_array(crc64s)
+
+
+    def to_hex(self):
+        """Returns a list of the checksums, each formatted as a lowercase hex string of 16 digits.
+        """
+
+        hex_digits = hexlify(self.to_bytes()).decode("ascii")
+
+        return [hex_digits[offset:offset + 16] for offset in range(0, len(hex_digits), 16)]
+
+
+    def to_bytes(self):
+        """Returns the checksums as 8 big-endian bytes each.
+        """
+
+        crc64s = self._crc64s
+        if byteorder == "little":
+            crc64s = array(_TYPECODE, crc64s)
+            crc64s.byteswap()
+
+        return _array_to_bytes(crc64s)
+
+
+    def to_numpy(self):
+        """Returns a copy of the checksums as a NumPy uint64 array. Raises an ImportError where
+           NumPy is not installed.
+        """
+
+        if _import_numpy() is None:
+            raise ImportError("NumPy is required by to_numpy() but is not installed.")
+
+        return self._as_vector().copy()
+
+
+    def append(self, crc64):
+        """Appends the supplied checksum, which may be a Crc64Result or an integer.
+           No return value.
+        """
+
+        self._crc64s.append(_get_crc64_value(crc64))
+        self._sorted = False
+
+
+    def extend(self, crc64s):
+        """Appends each of the supplied checksums, which may be Crc64Result objects or integers.
+           No return value.
+        """
+
+        self._crc64s.extend(Crc64ResultArray(crc64s)._crc64s) # pylint: disable=locally-disabled, protected-access
+        self._sorted = False
+
+
+    def sort(self):
+        """Sorts the checksums into ascending order, in place.
+           No return value.
+        """
+
+        if _import_numpy() is not None:
+            self._as_vector().sort()
+        else:
+            self._crc64s = array(_TYPECODE, sorted(self._crc64s))
+
+        self._sorted = True
+
+
+    def searchsorted(self, crc64):
+        """Returns the index at which the supplied checksum, which may be a Crc64Result or an
+           integer, would be inserted to keep the checksums sorted, before any equal checksums.
+           The array must already be sorted.
+        """
+
+        return bisect_left(self._crc64s, _get_crc64_value(crc64))
+
+
+    def unique(self):
+        """Returns a new sorted Crc64ResultArray of the distinct checksums.
+        """
+
+        numpy = _import_numpy()
+
+        if numpy is not None:
+            return self._from_vector(numpy.unique(self._as_vector()))
+
+        return self._from_array(array(_TYPECODE, sorted(set(self._crc64s))), True)
+
+
+    def union(self, other):
+        """Returns a new sorted Crc64ResultArray of the distinct checksums in either this array or
+           the supplied array.
+        """
+
+        numpy = _import_numpy()
+
+        if numpy is not None:
+            return self._from_vector(numpy.union1d(self._as_vector(), other._as_vector())) # pylint: disable=locally-disabled, protected-access
+
+        crc64s = sorted(set(self._crc64s).union(other._crc64s)) # pylint: disable=locally-disabled, protected-access
+
+        return self._from_array(array(_TYPECODE, crc64s), True)
+
+
+    def intersection(self, other):
+        """Returns a new sorted Crc64ResultArray of the distinct checksums in both this array and
+           the supplied array.
+        """
+
+        numpy = _import_numpy()
+
+        if numpy is not None:
+            return self._from_vector(numpy.intersect1d(self._as_vector(), other._as_vector())) # pylint: disable=locally-disabled, protected-access
+
+        crc64s = sorted(set(self._crc64s).intersection(other._crc64s)) # pylint: disable=locally-disabled, protected-access
+
+        return self._from_array(array(_TYPECODE, crc64s), True)
+
+
+    def difference(self, other):
+        """Returns a new sorted Crc64ResultArray of the distinct checksums in this array but not in
+           the supplied array.
+        """
+
+        numpy = _import_numpy()
+
+        if numpy is not None:
+            return self._from_vector(numpy.setdiff1d(self._as_vector(), other._as_vector())) # pylint: disable=locally-disabled, protected-access
+
+        crc64s = sorted(set(self._crc64s).difference(other._crc64s)) # pylint: disable=locally-disabled, protected-access
+
+        return self._from_array(array(_TYPECODE, crc64s), True)
+
+
+    def _as_vector(self):
+        """Returns a NumPy uint64 array over the checksums, without copying.
+        """
+
+        numpy = _import_numpy()
+
+        return numpy.frombuffer(self._crc64s, dtype=numpy.uint64)
+
+
+    @classmethod
+    def _from_vector(cls, vector):
+        """Returns a new sorted Crc64ResultArray of the checksums in the supplied sorted NumPy
+           array.
+        """
+
+        numpy = _import_numpy()
+
+        return cls._from_array(_array_from_bytes(vector.astype(numpy.uint64).tobytes()), True)
+
+
+    @classmethod
+    def _from_array(cls, crc64s, is_sorted=False):
+        """Returns a new Crc64ResultArray that takes ownership of the supplied array of unsigned
+           64-bit integers, without copying, and which is known to be sorted where 'is_sorted' is
+           True.
+        """
+
+        result_array = cls.__new__(cls)
+        result_array._crc64s = crc64s # pylint: disable=locally-disabled, protected-access
+        result_array._sorted = is_sorted # pylint: disable=locally-disabled, protected-access
+
+        return result_array
+
+
+    def __len__(self):
+        return len(self._crc64s)
+
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._from_array(self._crc64s[index], self._sorted and (index.step or 1) > 0)
+
+        return Crc64Result(self._crc64s[index])
+
+
+    def __iter__(self):
+        for crc64 in self._crc64s:
+            yield Crc64Result(crc64)
+
+
+    def __contains__(self, crc64):
+        crc64 = _get_crc64_value(crc64)
+
+        if not self._sorted:
+            return crc64 in self._crc64s
+
+        index = bisect_left(self._crc64s, crc64)
+
+        return index < len(self._crc64s) and self._crc64s[index] == crc64
+
+
+    def __eq__(self, other):
+        if not isinstance(other, Crc64ResultArray):
+            return NotImplemented
+
+        return self._crc64s == other._crc64s # pylint: disable=locally-disabled, protected-access
+
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+
+        return equal if equal is NotImplemented else not equal
+
+
+    __hash__ = None
+
+
+    def __or__(self, other):
+        return self.union(other)
+
+
+    def __and__(self, other):
+        return self.intersection(other)
+
+
+    def __sub__(self, other):
+        return self.difference(other)
+
+
+def _array_from_bytes(content):
+    """Returns an array of unsigned 64-bit integers over the supplied bytes, in native byte order.
+    """
+
+    return array(_TYPECODE, content)
+
+
+def _array_to_bytes(values):
+    """Returns the items of the supplied array as bytes, in native byte order.
+
+       (Arrays on Python 2 lack tobytes(), so tostring() is used instead).
+    """
+
+    if hasattr(values, "tobytes"):
+        return values.tobytes()
+
+    return values.tostring()
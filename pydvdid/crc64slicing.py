@@ -0,0 +1,165 @@
+"""Implements the _SlicingBy8Crc64Backend and _SlicingBy16Crc64Backend classes.
+"""
+
+
+from __future__ import absolute_import
+from struct import unpack_from
+from .buffers import _as_byte_view
+from .crc64tables import _get_indexable_slicing_tables
+
+
+class _SlicingCrc64Backend(object): # pylint: disable=locally-disabled, too-few-public-methods
+    """Implements a base class that updates a 64-bit Cyclic Redundancy Check checksum using the
+       slicing-by-N technique, which consumes N bytes of content per loop iteration by way of N
+       lookup tables rather than one byte per loop iteration by way of a single lookup table.
+
+       Class initialiser requires a polynomial to seed the construction of the lookup tables.
+       Subclasses set _SLICES to the number of bytes consumed per loop iteration.
+    """
+
+    # calculators skip zero runs of at least this many bytes rather than updating with them
+    MINIMUM_ZERO_RUN = 0x100
+
+    _SLICES = None
+
+    # the number of 64-bit words unpacked from the content at a time, which bounds the size of the
+    # intermediate tuple when updating with large content
+    _WORDS_PER_BLOCK = 0x2000
+
+    # content shorter than this many bytes is updated a byte at a time, as unpacking it into words
+    # costs more than the slicing saves
+    _MINIMUM_SLICED_SIZE = 0x80
+
+
+    def __init__(self, polynomial):
+        self._construct_lookup_tables(polynomial)
+
+
+    def update(self, crc64, content):
+        """Updates the supplied CRC-64 with the bytes of the supplied content.
+           Returns the updated CRC-64.
+        """
+
+        content = _as_byte_view(content)
+
+        content_size = len(content)
+
+        if content_size < self._MINIMUM_SLICED_SIZE:
+            sliced_size = 0
+        else:
+            sliced_size = content_size - (content_size % self._SLICES)
+
+        offset = 0
+        while offset < sliced_size:
+            word_count = min((sliced_size - offset) >> 3, self._WORDS_PER_BLOCK)
+            words = unpack_from("<{0}Q".format(word_count), content, offset)
+            crc64 = self._update_words(crc64, words)
+            offset += word_count << 3
+
+        lookup_table = self._lookup_tables[0]
+        for byte in bytearray(content[sliced_size:]):
+            crc64 = (crc64 >> 8) ^ lookup_table[(crc64 & 0xff) ^ byte]
+
+        return crc64
+
+
+    def _update_words(self, crc64, words):
+        """Updates the supplied CRC-64 with the supplied sequence of little-endian 64-bit words,
+           whose length is a multiple of _SLICES / 8, folding _SLICES / 8 words per loop iteration.
+           Returns the updated CRC-64.
+
+           (Subclasses override this with loops unrolled for their number of slices, which index
+           the lookup tables by way of locals and are considerably faster).
+        """
+
+        lookup_tables = self._lookup_tables
+        words_per_iteration = self._SLICES >> 3
+
+        for offset in range(0, len(words), words_per_iteration):
+            folded_crc64 = 0
+
+            for word_index in range(0, words_per_iteration):
+                word = words[offset + word_index]
+
+                if word_index == 0:
+                    word ^= crc64
+
+                table_index = self._SLICES - 1 - (word_index << 3)
+
+                for byte_index in range(0, 8):
+                    lookup_table = lookup_tables[table_index - byte_index]
+                    folded_crc64 ^= lookup_table[(word >> (byte_index << 3)) & 0xff]
+
+            crc64 = folded_crc64
+
+        return crc64
+
+
+    def _construct_lookup_tables(self, polynomial):
+        """Retrieves the _SLICES shared CRC-64 lookup tables seeded from the supplied polynomial,
+           which are constructed on first use.
+           No return value.
+        """
+
+        self._lookup_tables = _get_indexable_slicing_tables(polynomial, self._SLICES)
+
+
+class _SlicingBy8Crc64Backend(_SlicingCrc64Backend): # pylint: disable=locally-disabled, too-few-public-methods
+    """Implements a class that updates a 64-bit Cyclic Redundancy Check checksum 8 bytes at a time.
+    """
+
+    _SLICES = 8
+
+
+    def _update_words(self, crc64, words):
+        """Updates the supplied CRC-64 with the supplied sequence of little-endian 64-bit words.
+           Returns the updated CRC-64.
+        """
+
+        table0, table1, table2, table3, table4, table5, table6, table7 = self._lookup_tables
+
+        for word in words:
+            crc64 ^= word
+            crc64 = (
+                table7[crc64 & 0xff] ^ table6[(crc64 >> 8) & 0xff] ^
+                table5[(crc64 >> 16) & 0xff] ^ table4[(crc64 >> 24) & 0xff] ^
+                table3[(crc64 >> 32) & 0xff] ^ table2[(crc64 >> 40) & 0xff] ^
+                table1[(crc64 >> 48) & 0xff] ^ table0[crc64 >> 56]
+            )
+
+        return crc64
+
+
+class _SlicingBy16Crc64Backend(_SlicingCrc64Backend): # pylint: disable=locally-disabled, too-few-public-methods
+    """Implements a class that updates a 64-bit Cyclic Redundancy Check checksum 16 bytes at a
+       time.
+    """
+
+    _SLICES = 16
+
+
+    def _update_words(self, crc64, words): # pylint: disable=locally-disabled, too-many-locals
+        """Updates the supplied CRC-64 with the supplied sequence of little-endian 64-bit words,
+           which must be of even length.
+           Returns the updated CRC-64.
+        """
+
+        (table0, table1, table2, table3, table4, table5, table6, table7, table8, table9, table10,
+         table11, table12, table13, table14, table15) = self._lookup_tables
+
+        iterator = iter(words)
+        for word in iterator:
+            crc64 ^= word
+            word = next(iterator)
+            crc64 = (
+                table15[crc64 & 0xff] ^ table14[(crc64 >> 8) & 0xff] ^
+                table13[(crc64 >> 16) & 0xff] ^ table12[(crc64 >> 24) & 0xff] ^
+                table11[(crc64 >> 32) & 0xff] ^ table10[(crc64 >> 40) & 0xff] ^
+                table9[(crc64 >> 48) & 0xff] ^ table8[crc64 >> 56] ^
+                table7[word & 0xff] ^ table6[(word >> 8) & 0xff] ^
+                table5[(word >> 16) & 0xff] ^ table4[(word >> 24) & 0xff] ^
+                table3[(word >> 32) & 0xff] ^ table2[(word >> 40) & 0xff] ^
+                table1[(word >> 48) & 0xff] ^ table0[word >> 56]
+            )
+
+        return crc64
@@ -0,0 +1,202 @@
+"""Implements the CrcModel and CrcEngine classes, and the CRC_MODELS catalogue of named models.
+"""
+
+
+from __future__ import absolute_import
+from __future__ import unicode_literals
+from .buffers import _as_byte_view
+from .crc64backends import _get_crc64_backend
+from .crc64bigint import (
+    _REVERSED_BITS, _reverse_bits
+)
+from .crc64calculator import _Crc64Calculator
+
+
+class CrcModel(object): # pylint: disable=locally-disabled, too-few-public-methods, too-many-instance-attributes
+    """Implements a class that describes a Cyclic Redundancy Check by the parameters of the Rocksoft
+       model (http://www.ross.net/crc/crcpaper.html): its width in bits, its polynomial (in normal,
+       i.e. non-reflected, form with the leading term omitted), the initial value of its register,
+       whether each input byte and the final register are reflected, the value XORed with the final
+       register, and (optionally) the check value, which is the CRC of the ASCII string
+       "123456789".
+
+       Class initialiser raises a ValueError when the width is not between 1 and 64, or when a
+       value does not fit within the width.
+    """
+
+    def __init__(self, name, width, polynomial, initial, reflect_input, reflect_output, final_xor, # pylint: disable=locally-disabled, too-many-arguments, too-many-positional-arguments
+                 check=None):
+        if not 1 <= width <= 64:
+            raise ValueError("CRC width must be between 1 and 64 bits, not {0}.".format(width))
+
+        for description, value in [("polynomial", polynomial), ("initial value", initial),
+                                   ("final XOR value", final_xor), ("check value", check)]:
+            if value is not None and not 0 <= value < (1 << width):
+                template = "CRC {0} 0x{1:x} does not fit within {2} bits."
+                raise ValueError(template.format(description, value, width))
+
+        self.name = name
+        self.width = width
+        self.polynomial = polynomial
+        self.initial = initial
+        self.reflect_input = reflect_input
+        self.reflect_output = reflect_output
+        self.final_xor = final_xor
+        self.check = check
+
+
+    def __repr__(self):
+        template = ("CrcModel({0!r}, width={1}, polynomial=0x{2:x}, initial=0x{3:x}, "
+                    "reflect_input={4}, reflect_output={5}, final_xor=0x{6:x})")
+
+        return template.format(self.name, self.width, self.polynomial, self.initial,
+                               self.reflect_input, self.reflect_output, self.final_xor)
+
+
+# the catalogue of named models, whose parameters and check values are taken from the catalogue of
+# parametrised CRC algorithms (http://reveng.sourceforge.net/crc-catalogue/)
+CRC_MODELS = dict((model.name, model) for model in [
+    CrcModel("CRC-32/ISCSI", 32, 0x1edc6f41, 0xffffffff, True, True, 0xffffffff, 0xe3069283),
+    CrcModel("CRC-32/ISO-HDLC", 32, 0x04c11db7, 0xffffffff, True, True, 0xffffffff, 0xcbf43926),
+    CrcModel("CRC-64/ECMA-182", 64, 0x42f0e1eba9ea3693, 0x0, False, False, 0x0,
+             0x6c40df5f0b497347),
+    CrcModel("CRC-64/GETDISCID", 64, 0x259c84cba6426349, 0xffffffffffffffff, True, True, 0x0,
+             0x75d4b74f024eceea),
+    CrcModel("CRC-64/GO-ISO", 64, 0x000000000000001b, 0xffffffffffffffff, True, True,
+             0xffffffffffffffff, 0xb90956c775a41001),
+    CrcModel("CRC-64/XZ", 64, 0x42f0e1eba9ea3693, 0xffffffffffffffff, True, True,
+             0xffffffffffffffff, 0x995dc9bbdf1939fa)
+])
+
+# common aliases of the named models
+CRC_MODELS["CRC-32"] = CRC_MODELS["CRC-32/ISO-HDLC"]
+CRC_MODELS["CRC-32C"] = CRC_MODELS["CRC-32/ISCSI"]
+
+
+class CrcEngine(object):
+    """Implements a class that calculates the Cyclic Redundancy Check described by a CrcModel (or by
+       the name of one in CRC_MODELS), through the same interface as the hash objects of the hashlib
+       module.
+
+       Every model is calculated by the same reflected (i.e. right-shifting) engine as the CRC-64
+       used by compute, so that all models share its lookup table registry and its backends: the
+       polynomial and initial value are reflected, the bits of each input byte are reversed where
+       the model does not reflect its input, and the final register is reflected where the model
+       does not reflect its output.
+
+       Class initialiser requires a model, and accepts optional initial content, and raises a
+       ValueError when the model is named but is not in CRC_MODELS.
+    """
+
+    block_size = 1
+
+    # content of models that do not reflect their input is bit-reversed in blocks of this many
+    # bytes, which bounds the memory used to reverse large content
+    _REVERSE_BLOCK_SIZE = 0x100000
+
+
+    def __init__(self, model, content=b""):
+        if not isinstance(model, CrcModel):
+            try:
+                model = CRC_MODELS[model]
+            except KeyError:
+                template = "Unknown CRC model '{0}'; expected one of: {1}."
+                raise ValueError(template.format(model, ", ".join(sorted(CRC_MODELS)))) # pylint: disable=locally-disabled, raise-missing-from
+
+        self._model = model
+        self._calculator = _Crc64Calculator(_reflect(model.polynomial, model.width),
+                                            _reflect(model.initial, model.width),
+                                            backend=_get_crc64_backend())
+        self.update(content)
+
+
+    @property
+    def model(self):
+        """Returns the CrcModel calculated by the engine.
+        """
+
+        return self._model
+
+
+    @property
+    def name(self):
+        """Returns the name of the model calculated by the engine, in lowercase.
+        """
+
+        return self._model.name.lower()
+
+
+    @property
+    def digest_size(self):
+        """Returns the number of bytes in a digest, which is the model's width rounded up to a whole
+           number of bytes.
+        """
+
+        return (self._model.width + 7) >> 3
+
+
+    @property
+    def crc(self):
+        """Returns the current CRC as an integer.
+        """
+
+        register = self._calculator._crc64 # pylint: disable=locally-disabled, protected-access
+
+        if not self._model.reflect_output:
+            register = _reflect(register, self._model.width)
+
+        return register ^ self._model.final_xor
+
+
+    def update(self, content):
+        """Updates the CRC with the supplied content, which may be any object supporting the buffer
+           protocol, or a sequence of integers.
+           No return value.
+        """
+
+        if self._model.reflect_input:
+            self._calculator.update(content)
+            return
+
+        content = _as_byte_view(content)
+
+        for offset in range(0, len(content), self._REVERSE_BLOCK_SIZE):
+            block = bytes(content[offset:offset + self._REVERSE_BLOCK_SIZE])
+            self._calculator.update(block.translate(_REVERSED_BITS))
+
+
+    def digest(self):
+        """Returns the current CRC as digest_size big-endian bytes.
+        """
+
+        crc = self.crc
+
+        return bytes(bytearray(
+            (crc >> shift) & 0xff for shift in range((self.digest_size - 1) << 3, -1, -8)
+        ))
+
+
+    def hexdigest(self):
+        """Returns the current CRC formatted as a lowercase hex string of digest_size * 2 digits.
+        """
+
+        return format(self.crc, "0{0}x".format(self.digest_size << 1))
+
+
+    def copy(self):
+        """Returns a new engine with the same model and state, which may be updated independently of
+           this engine.
+        """
+
+        engine = self.__class__.__new__(self.__class__)
+        engine._model = self._model # pylint: disable=locally-disabled, protected-access
+        engine._calculator = self._calculator.copy() # pylint: disable=locally-disabled, protected-access
+
+        return engine
+
+
+def _reflect(value, width):
+    """Returns the bottommost 'width' bits of the supplied value in reverse order.
+    """
+
+    return _reverse_bits(value) >> (64 - width)
@@ -0,0 +1,49 @@
+"""Implements supporting 'private' functions for detecting and importing optional dependencies.
+"""
+
+
+from __future__ import absolute_import
+
+try:
+    from importlib.util import find_spec
+except ImportError:
+    find_spec = None
+
+
+def _is_installed(module_name):
+    """Returns whether the module of the supplied name is installed, without importing it.
+    """
+
+    try:
+        if find_spec is not None:
+            return find_spec(module_name) is not None
+
+        from imp import find_module # pylint: disable=locally-disabled, deprecated-module, import-outside-toplevel
+
+        find_module(module_name)
+    except (ImportError, ValueError):
+        return False
+
+    return True
+
+
+def _import_numpy():
+    """Returns the numpy module, importing it on first use, or None where NumPy is not installed
+       (or cannot be imported).
+
+       (Importing NumPy is slow, so it is only imported by the code that uses it, rather than when
+       the package is imported).
+    """
+
+    if not _NUMPY_INSTALLED:
+        return None
+
+    try:
+        import numpy # pylint: disable=locally-disabled, import-outside-toplevel
+    except ImportError:
+        return None
+
+    return numpy
+
+
+_NUMPY_INSTALLED = _is_installed("numpy")
@@ -11,11 +11,26 @@ class PydvdidException(Exception):
        exception that originates from the package.
     """
 
+    # the arguments the exception was constructed with, which are set by __new__()
+    _arguments = ()
+
+
     def __new__(cls, *args, **kwargs):
         if cls is PydvdidException:
             raise TypeError("PydvdidException may not be directly instantiated.")
 
-        return Exception.__new__(cls, *args, **kwargs)
+        exception = Exception.__new__(cls, *args, **kwargs)
+
+        # the arguments are replaced by the formatted message when the subclass initialises the base
+        # class, so are retained for reconstructing the exception when it is unpickled (e.g. when it
+        # is returned from a worker process)
+        exception._arguments = args
+
+        return exception
+
+
+    def __reduce__(self):
+        return (self.__class__, self._arguments, self.__dict__)
 
 
 class FileContentReadException(PydvdidException):
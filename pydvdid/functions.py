@@ -5,22 +5,57 @@
 from __future__ import absolute_import
 from __future__ import unicode_literals
 from datetime import datetime
-from os import listdir
+from os import (
+    fstat, listdir, stat
+)
+try:
+    from os import scandir
+except ImportError:
+    scandir = None
 from os.path import (
-    basename, getctime, getsize, isdir, isfile, join
+    basename, getsize, isdir, isfile, join
 )
+from stat import S_ISREG
 from struct import pack_into
+from sys import version_info
+from .crc64backends import _get_crc64_backend
 from .crc64calculator import _Crc64Calculator
 from .exceptions import (
     FileContentReadException, FileTimeOutOfRangeException, PathDoesNotExistException
 )
 
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:
+    ThreadPoolExecutor = None
+
+try:
+    from mmap import (
+        ACCESS_READ, mmap
+    )
+except ImportError:
+    mmap = None
 
-def compute(dvd_path):
+
+def compute(dvd_path, max_concurrent_reads=None, use_mmap=False):
     """Computes a Windows API IDvdInfo2::GetDiscID-compatible 64-bit Cyclic Redundancy Check
        checksum from the DVD .vob, .ifo and .bup files found in the supplied DVD path.
+
+       By default, the files are stat'ed and read one after another. Where 'max_concurrent_reads'
+       is greater than 1, the stat calls and the reads of the two .ifo files are issued
+       concurrently on up to that many threads, so that on a high-latency (e.g. SMB or NFS) mount
+       the time taken is roughly that of the slowest round trip rather than the sum of them all.
+
+       Where 'use_mmap' is True, the two .ifo files are memory-mapped rather than read into
+       buffers, which saves a copy on local disks and tmpfs mounts. It should not be used for
+       network (e.g. SMB or NFS) mounts, or for files that may be truncated while they are
+       checksummed, as accessing a mapping beyond the end of a truncated file terminates the process
+       (rather than raising a FileContentReadException).
     """
 
+    if max_concurrent_reads is not None and max_concurrent_reads < 1:
+        raise ValueError("max_concurrent_reads must be greater than 0.")
+
     _check_dvd_path_exists(dvd_path)
 
     _check_video_ts_path_exists(dvd_path)
@@ -28,19 +63,59 @@ def compute(dvd_path):
     # the polynomial used for this CRC-64 checksum is:
     # x^63 + x^60 + x^57 + x^55 + x^54 + x^50 + x^49 + x^46 + x^41 + x^38 + x^37 + x^34 + x^32 +
     # x^31 + x^30 + x^28 + x^25 + x^24 + x^21 + x^16 + x^13 + x^12 + x^11 + x^8 + x^7 + x^5 + x^2
-    calculator = _Crc64Calculator(0x92c64265d32139a4)
-
-    for video_ts_file_path in _get_video_ts_file_paths(dvd_path):
-        calculator.update(_get_file_creation_time(video_ts_file_path))
-        calculator.update(_get_file_size(video_ts_file_path))
-        calculator.update(_get_file_name(video_ts_file_path))
+    calculator = _Crc64Calculator(0x92c64265d32139a4, backend=_get_crc64_backend())
 
-    calculator.update(_get_vmgi_file_content(dvd_path))
-    calculator.update(_get_vts01i_file_content(dvd_path))
+    if max_concurrent_reads is None or max_concurrent_reads < 2 or ThreadPoolExecutor is None:
+        calculator.update_many(_get_contents(dvd_path, use_mmap))
+    else:
+        calculator.update_many(_get_contents_concurrently(dvd_path, max_concurrent_reads,
+                                                          use_mmap))
 
     return calculator.crc64
 
 
+def _get_contents(dvd_path, use_mmap=False):
+    """Returns a list of the contents checksummed for the specified DVD path, in order: the file
+       records of the files in its VIDEO_TS folder, then the first 64Kb of the VIDEO_TS.IFO and
+       VTS_01_0.IFO files (memory-mapped where 'use_mmap' is True).
+    """
+
+    # each file is stat'ed once, and its stat result reused for its record and (for the two .ifo
+    # files read) the size of the content read
+    video_ts_file_entries = _get_video_ts_file_entries(dvd_path)
+    file_sizes = dict(
+        (basename(file_path), file_stat.st_size) for file_path, file_stat in video_ts_file_entries
+    )
+
+    return [
+        _get_file_records(video_ts_file_entries),
+        _get_vmgi_file_content(dvd_path, file_sizes.get("VIDEO_TS.IFO"), use_mmap),
+        _get_vts01i_file_content(dvd_path, file_sizes.get("VTS_01_0.IFO"), use_mmap)
+    ]
+
+
+def _get_contents_concurrently(dvd_path, max_concurrent_reads, use_mmap=False):
+    """Returns the same list of contents as _get_contents(), issuing the stat calls and the reads
+       of the two .ifo files concurrently on a pool of 'max_concurrent_reads' threads.
+    """
+
+    with ThreadPoolExecutor(max_workers=max_concurrent_reads) as executor:
+        # the .ifo files are read without waiting for their sizes from the stat calls of the folder
+        # entries (at the cost of stat'ing them again), so that the reads overlap the stat calls
+        vmgi_file_content = executor.submit(_get_vmgi_file_content, dvd_path, None, use_mmap)
+        vts01i_file_content = executor.submit(_get_vts01i_file_content, dvd_path, None, use_mmap)
+
+        # executor.map() returns the stat results in the order of the entries, however they
+        # complete, so the records are still written in sorted order
+        video_ts_file_entries = _get_video_ts_file_entries(dvd_path, executor.map)
+
+        return [
+            _get_file_records(video_ts_file_entries),
+            vmgi_file_content.result(),
+            vts01i_file_content.result()
+        ]
+
+
 def _check_dvd_path_exists(dvd_path):
     """Raises an exception if the specified DVD path does not exist.
     """
@@ -59,31 +134,98 @@ def _check_video_ts_path_exists(dvd_path):
         raise PathDoesNotExistException(video_ts_folder_path)
 
 
-def _get_video_ts_file_paths(dvd_path):
-    """Returns a sorted list of paths for files contained in th VIDEO_TS folder of the specified
-       DVD path.
+def _get_video_ts_file_entries(dvd_path, map_function=map):
+    """Returns a list of (file_path, stat_result) pairs for files contained in the VIDEO_TS folder
+       of the specified DVD path, sorted by path.
+
+       Each file is stat'ed once; scandir is used where available (Python 3.5+), as it filters out
+       directories without a stat call, and otherwise each entry of listdir is stat'ed directly.
+       The stat calls are issued through the supplied map function (e.g. the map() method of an
+       executor, to issue them concurrently).
     """
 
     video_ts_folder_path = join(dvd_path, "VIDEO_TS")
 
-    video_ts_file_paths = []
+    if scandir is not None:
+        video_ts_folder_entries = [
+            video_ts_folder_entry for video_ts_folder_entry in scandir(video_ts_folder_path)
+            if video_ts_folder_entry.is_file()
+        ]
+
+        video_ts_file_entries = list(zip(
+            [
+                join(video_ts_folder_path, video_ts_folder_entry.name)
+                for video_ts_folder_entry in video_ts_folder_entries
+            ],
+            map_function(_stat_directory_entry, video_ts_folder_entries)
+        ))
+    else:
+        video_ts_folder_content_paths = [
+            join(video_ts_folder_path, video_ts_folder_content_name)
+            for video_ts_folder_content_name in listdir(video_ts_folder_path)
+        ]
+
+        video_ts_file_entries = [
+            (video_ts_folder_content_path, video_ts_folder_content_stat)
+            for video_ts_folder_content_path, video_ts_folder_content_stat in zip(
+                video_ts_folder_content_paths,
+                map_function(_stat_or_none, video_ts_folder_content_paths)
+            )
+            if video_ts_folder_content_stat is not None
+            and S_ISREG(video_ts_folder_content_stat.st_mode)
+        ]
+
+    return sorted(video_ts_file_entries, key=lambda file_entry: file_entry[0])
+
+
+def _stat_directory_entry(directory_entry):
+    """Returns the stat result of the supplied scandir directory entry.
+    """
 
-    for video_ts_folder_content_name in listdir(video_ts_folder_path):
-        video_ts_folder_content_path = join(video_ts_folder_path, video_ts_folder_content_name)
+    return directory_entry.stat()
 
-        if isfile(video_ts_folder_content_path):
-            video_ts_file_paths.append(video_ts_folder_content_path)
 
-    return sorted(video_ts_file_paths)
+def _stat_or_none(file_path):
+    """Returns the stat result of the specified path, or None if it cannot be stat'ed (e.g. a
+       broken symbolic link).
+    """
 
+    try:
+        return stat(file_path)
+    except OSError:
+        return None
 
-def _get_file_creation_time(file_path):
-    """Returns the creation time of the file at the specified file path in Microsoft FILETIME
-       structure format (https://msdn.microsoft.com/en-us/library/windows/desktop/ms724284.aspx),
-       formatted as a 8-byte unsigned integer bytearray.
+
+def _get_file_records(file_entries):
+    """Returns a bytearray holding a record for each of the specified (file_path, stat_result)
+       pairs, which is the file's creation time, in Microsoft FILETIME structure format
+       (https://msdn.microsoft.com/en-us/library/windows/desktop/ms724284.aspx) as an 8-byte
+       unsigned integer, followed by its size as a 4-byte unsigned integer (both taken from the
+       supplied stat result), and its name, formatted as by _get_file_name().
+
+       The bytearray is allocated once at its final size, and each record is packed into it in a
+       single call.
     """
 
-    ctime = getctime(file_path)
+    file_names = [_get_file_name(file_path) for file_path, _ in file_entries]
+
+    file_records = bytearray(sum(12 + len(file_name) for file_name in file_names))
+    offset = 0
+
+    for (_, file_stat), file_name in zip(file_entries, file_names):
+        record_format = "=QI{0}s".format(len(file_name)).encode("ascii")
+        pack_into(record_format, file_records, offset,
+                  _convert_ctime_to_filetime(file_stat.st_ctime), file_stat.st_size,
+                  bytes(file_name))
+        offset += 12 + len(file_name)
+
+    return file_records
+
+
+def _convert_ctime_to_filetime(ctime):
+    """Returns the supplied file creation time, in seconds since the Unix epoch, in Microsoft
+       FILETIME structure format, as an integer.
+    """
 
     if ctime < -11644473600 or ctime >= 253402300800:
         raise FileTimeOutOfRangeException(ctime)
@@ -94,12 +236,7 @@ def _get_file_creation_time(file_path):
 
     creation_time_secs_from_epoch = _convert_timedelta_to_seconds(creation_time_epoch_offset)
 
-    creation_time_filetime = int(creation_time_secs_from_epoch * (10 ** 7))
-
-    file_creation_time = bytearray(8)
-    pack_into(b"Q", file_creation_time, 0, creation_time_filetime)
-
-    return file_creation_time
+    return int(creation_time_secs_from_epoch * (10 ** 7))
 
 
 def _convert_timedelta_to_seconds(timedelta):
@@ -112,19 +249,6 @@ def _convert_timedelta_to_seconds(timedelta):
     return int((timedelta.microseconds + (timedelta.seconds + days_in_seconds) * 10 ** 6) / 10 ** 6)
 
 
-def _get_file_size(file_path):
-    """Returns the size of the file at the specified file path, formatted as a 4-byte unsigned
-       integer bytearray.
-    """
-
-    size = getsize(file_path)
-
-    file_size = bytearray(4)
-    pack_into(b"I", file_size, 0, size)
-
-    return file_size
-
-
 def _get_file_name(file_path):
     """Returns the name of the file at the specified file path, formatted as a UTF-8 bytearray
        terminated with a null character.
@@ -138,35 +262,89 @@ def _get_file_name(file_path):
     return utf8_file_name
 
 
-def _get_vmgi_file_content(dvd_path):
+def _get_vmgi_file_content(dvd_path, file_size=None, use_mmap=False):
     """Returns the first 65536 bytes (or the file size, whichever is smaller) of the VIDEO_TS.IFO
-       file in the VIDEO_TS folder of the specified DVD path, as a bytearray.
+       file in the VIDEO_TS folder of the specified DVD path, as returned by
+       _get_first_64k_content() (or by _map_first_64k_content() where 'use_mmap' is True).
     """
 
     vmgi_file_path = join(dvd_path, "VIDEO_TS", "VIDEO_TS.IFO")
 
-    return _get_first_64k_content(vmgi_file_path)
+    if use_mmap:
+        return _map_first_64k_content(vmgi_file_path, file_size)
+
+    return _get_first_64k_content(vmgi_file_path, file_size)
 
 
-def _get_vts01i_file_content(dvd_path):
+def _get_vts01i_file_content(dvd_path, file_size=None, use_mmap=False):
     """Returns the first 65536 (or the file size, whichever is smaller) bytes of the VTS_01_0.IFO
-       file in the VIDEO_TS folder of the specified DVD path, as a bytearray.
+       file in the VIDEO_TS folder of the specified DVD path, as returned by
+       _get_first_64k_content() (or by _map_first_64k_content() where 'use_mmap' is True).
     """
 
     vts01i_file_path = join(dvd_path, "VIDEO_TS", "VTS_01_0.IFO")
 
-    return _get_first_64k_content(vts01i_file_path)
+    if use_mmap:
+        return _map_first_64k_content(vts01i_file_path, file_size)
 
+    return _get_first_64k_content(vts01i_file_path, file_size)
 
-def _get_first_64k_content(file_path):
+
+def _map_first_64k_content(file_path, file_size=None):
+    """Returns the first 65536 (or the file size, whichever is smaller) bytes of the file at the
+       specified file path, as a read-only memoryview over the file mapped into memory, so that the
+       content is not read into a buffer before it is checksummed. The mapping is released when
+       the memoryview is.
+
+       Where mmap is not available (or on Python 2, whose mmap objects do not support memoryviews),
+       the file is empty (which cannot be mapped), or the file's filesystem cannot be mapped (e.g.
+       some FUSE, SMB and optical mounts), the content is read as by _get_first_64k_content(). The
+       file size may be supplied as for _get_first_64k_content().
+    """
+
+    if mmap is None or version_info[0] < 3:
+        return _get_first_64k_content(file_path, file_size)
+
+    if file_size is None:
+        if not isfile(file_path):
+            raise PathDoesNotExistException(file_path)
+
+        file_size = getsize(file_path)
+
+    content_size = min(file_size, 0x10000)
+
+    if content_size == 0:
+        return bytearray()
+
+    with open(file_path, "rb") as file_object:
+        try:
+            content = mmap(file_object.fileno(), content_size, access=ACCESS_READ)
+        except ValueError:
+            # the file is shorter than its size when stat'ed (e.g. it was truncated since)
+            raise FileContentReadException(content_size, fstat(file_object.fileno()).st_size) # pylint: disable=locally-disabled, raise-missing-from
+        except OSError:
+            content = None
+
+    if content is None:
+        return _get_first_64k_content(file_path, file_size)
+
+    # the mapping is independent of the file once created, so the file need not be kept open
+    return memoryview(content)
+
+
+def _get_first_64k_content(file_path, file_size=None):
     """Returns the first 65536 (or the file size, whichever is smaller) bytes of the file at the
        specified file path, as a bytearray.
+
+       Where the size of the file is already known (from the stat result of the file's entry in its
+       folder), it may be supplied, so that the file is not stat'ed again.
     """
 
-    if not isfile(file_path):
-        raise PathDoesNotExistException(file_path)
+    if file_size is None:
+        if not isfile(file_path):
+            raise PathDoesNotExistException(file_path)
 
-    file_size = getsize(file_path)
+        file_size = getsize(file_path)
 
     content_size = min(file_size, 0x10000)
 
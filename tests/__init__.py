@@ -0,0 +1,44 @@
+"""Implements the package-level fixture of the tests, which pins the CRC-64 backend to the reference
+   implementation and redirects the calibration cache folder to a temporary folder, so that the
+   tests neither depend on the backend calibrated on the host nor write to the user's cache folder.
+"""
+
+
+from __future__ import absolute_import
+from os import environ
+from shutil import rmtree
+from tempfile import mkdtemp
+from mock import patch
+from pydvdid.crc64backends import set_crc64_backend
+
+
+_FIXTURE = {}
+
+
+def setup_package():
+    """Pins the CRC-64 backend and redirects the calibration cache folder before any test runs.
+    """
+
+    _FIXTURE["cache_folder_path"] = mkdtemp()
+    _FIXTURE["patches"] = [
+        patch.dict(environ, {"PYDVDID_CRC64_BACKEND": "reference"}),
+        patch("pydvdid.crc64backends._get_cache_folder_path",
+              return_value=_FIXTURE["cache_folder_path"])
+    ]
+
+    for patcher in _FIXTURE["patches"]:
+        patcher.start()
+
+    set_crc64_backend(None)
+
+
+def teardown_package():
+    """Restores the CRC-64 backend selection and the calibration cache folder after every test has
+       run.
+    """
+
+    for patcher in reversed(_FIXTURE.pop("patches")):
+        patcher.stop()
+
+    set_crc64_backend(None)
+    rmtree(_FIXTURE.pop("cache_folder_path"))
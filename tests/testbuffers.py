@@ -0,0 +1,132 @@
+"""Implements tests for the pydvdid.buffers module.
+"""
+
+
+from __future__ import absolute_import
+from array import array
+from mmap import mmap
+from sys import version_info
+from nose.plugins.skip import SkipTest
+from nose.tools import (
+    eq_, istest, ok_
+)
+from parameterized import (
+    parameterized, param
+)
+from mock import (
+    call, MagicMock, patch
+)
+from pydvdid.buffers import (
+    _as_byte_view, _find_zero_runs
+)
+
+
+@istest
+@parameterized([
+    param("bytes", lambda: b"\x01\x02\x03"),
+    param("bytearray", lambda: bytearray([0x01, 0x02, 0x03])),
+    param("memoryview", lambda: memoryview(b"\x01\x02\x03"))
+])
+def _as_byte_view_returns_a_view_without_copying(description, factory): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of _as_byte_view() with content supporting the buffer protocol returns
+       a memoryview of unsigned bytes over the content.
+
+       (This is a Nose generator test which receives a set of data provided by parameterized).
+    """
+
+    if version_info[0] < 3:
+        raise SkipTest("memoryviews are not used on Python 2.")
+
+    view = _as_byte_view(factory())
+
+    ok_(isinstance(view, memoryview), "Test case '{0}' failed.".format(description))
+    eq_([0x01, 0x02, 0x03], list(view), "Test case '{0}' failed.".format(description))
+
+
+@istest
+def _as_byte_view_casts_arrays_of_wider_items_to_bytes(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of _as_byte_view() with an array of 16-bit items returns a view over
+       all of the array's bytes, which shares memory with the array.
+    """
+
+    if version_info[0] < 3:
+        raise SkipTest("memoryviews are not used on Python 2.")
+
+    content = array("H", [0x0102, 0x0304])
+
+    view = _as_byte_view(content)
+
+    eq_(4, len(view))
+    eq_(bytearray(content.tobytes()), bytearray(view))
+
+    content[0] = 0xffff
+
+    eq_(0xff, view[0])
+
+
+@istest
+def _as_byte_view_reads_mmap_objects(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of _as_byte_view() with an mmap object returns its content.
+    """
+
+    content = mmap(-1, 4)
+    content.write(b"\x0a\x0b\x0c\x0d")
+
+    eq_([0x0a, 0x0b, 0x0c, 0x0d], list(bytearray(_as_byte_view(content))))
+
+
+@istest
+def _as_byte_view_copies_sequences_of_integers(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of _as_byte_view() with a list of integers returns their bytes.
+    """
+
+    eq_([0x10, 0x20], list(bytearray(_as_byte_view([0x10, 0x20]))))
+
+
+@istest
+@parameterized([
+    param("No zero runs", b"\x01\x02\x03\x04", []),
+    param("Runs shorter than the minimum", b"\x00\x00\x00\x01\x00\x00\x00", []),
+    param("A run of exactly the minimum", b"\x01\x00\x00\x00\x00\x01", [(1, 5)]),
+    param("Runs at the start and end", b"\x00" * 9 + b"\x01" + b"\x00" * 6, [(0, 9), (10, 16)]),
+    param("A run spanning the whole content", b"\x00" * 100, [(0, 100)])
+])
+def _find_zero_runs_yields_each_run_of_at_least_the_minimum_length(description, content, # pylint: disable=locally-disabled, invalid-name
+                                                                   expected_runs):
+    """Tests that invocation of _find_zero_runs() yields the start and end offsets of every run of
+       zero bytes at least as long as the supplied minimum length.
+
+       (This is a Nose generator test which receives a set of data provided by parameterized).
+    """
+
+    eq_(expected_runs, list(_find_zero_runs(_as_byte_view(content), 4)),
+        "Test case '{0}' failed.".format(description))
+
+
+@istest
+@patch("pydvdid.buffers._ZERO_RUN_MAXIMUM_STEP", 8)
+@patch("pydvdid.buffers._ZERO_RUN_INITIAL_STEP", 2)
+def _find_zero_runs_finds_the_extent_of_runs_longer_than_a_step(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of _find_zero_runs() yields the whole of each run of zero bytes which
+       is longer than the bytes examined at a time, however its start and end align with the
+       offsets examined.
+    """
+
+    content = b"\x01\x01\x01" + b"\x00" * 37 + b"\x01" + b"\x00" * 3 + b"\x01" + b"\x00" * 21
+
+    eq_([(3, 40), (45, 66)], list(_find_zero_runs(_as_byte_view(content), 4)))
+
+
+@istest
+def _find_zero_runs_does_not_copy_content_without_zero_bytes_at_the_offsets_examined(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of _find_zero_runs() only reads the bytes at offsets which are
+       multiples of the minimum length from content holding no zero byte at those offsets.
+    """
+
+    content = MagicMock()
+    content.__len__.return_value = 0x10000
+    content.__getitem__.return_value = 0x01
+
+    eq_([], list(_find_zero_runs(content, 0x100)))
+
+    eq_([call(offset) for offset in range(0, 0x10000, 0x100)], content.__getitem__.call_args_list)
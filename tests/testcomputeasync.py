@@ -0,0 +1,245 @@
+"""Implements tests for the pydvdid.computeasync module.
+"""
+
+
+from __future__ import absolute_import
+from __future__ import unicode_literals
+from threading import Event
+from mock import patch
+from nose.plugins.skip import SkipTest
+from nose.tools import (
+    eq_, istest, ok_
+)
+from pydvdid.computeasync import (
+    compute_async, iter_compute_async
+)
+from pydvdid.crc64result import Crc64Result
+from pydvdid.exceptions import PathDoesNotExistException
+
+try:
+    import asyncio
+except ImportError:
+    asyncio = None
+
+
+def _compute(dvd_path):
+    """Returns a checksum derived from the supplied DVD path, or raises an exception for the paths
+       that name bad discs. Substituted for compute.
+    """
+
+    if dvd_path.startswith("BAD_DVD_PATH"):
+        raise PathDoesNotExistException(dvd_path)
+
+    return Crc64Result(int(dvd_path.rsplit("_", 1)[1]))
+
+
+def _run(loop, function, *args):
+    """Invokes the supplied function with the supplied arguments from within the supplied running
+       event loop, and returns the result of awaiting the awaitable it returns.
+    """
+
+    outer_future = loop.create_future()
+
+    def _complete(inner_future):
+        if inner_future.cancelled():
+            outer_future.cancel()
+        elif inner_future.exception() is not None:
+            outer_future.set_exception(inner_future.exception())
+        else:
+            outer_future.set_result(inner_future.result())
+
+    def _start():
+        try:
+            asyncio.ensure_future(function(*args)).add_done_callback(_complete)
+        except Exception as exception: # pylint: disable=locally-disabled, broad-except
+            outer_future.set_exception(exception)
+
+    loop.call_soon(_start)
+
+    return loop.run_until_complete(outer_future)
+
+
+def _collect(loop, async_iterator):
+    """Returns a list of the items yielded by the supplied asynchronous iterator, as an 'async for'
+       loop running in the supplied event loop would receive them.
+    """
+
+    items = []
+
+    while True:
+        try:
+            items.append(_run(loop, async_iterator.__anext__))
+        except StopAsyncIteration: # pylint: disable=locally-disabled, undefined-variable
+            return items
+
+
+def _create_event_loop():
+    """Returns a new event loop, or raises a SkipTest exception where asyncio is not available.
+    """
+
+    if asyncio is None:
+        raise SkipTest("asyncio is not available.")
+
+    return asyncio.new_event_loop()
+
+
+@istest
+@patch("pydvdid.computeasync.compute")
+def compute_async_resolves_to_the_result_of_compute(mock_compute): # pylint: disable=locally-disabled, invalid-name
+    """Tests that the awaitable returned by compute_async() resolves to the result of compute, or
+       raises the exception raised by compute.
+    """
+
+    loop = _create_event_loop()
+    mock_compute.side_effect = _compute
+
+    try:
+        eq_(Crc64Result(7), _run(loop, compute_async, "DVD_PATH_7"))
+
+        try:
+            _run(loop, compute_async, "BAD_DVD_PATH_8")
+        except PathDoesNotExistException:
+            pass
+        except Exception as exception: # pylint: disable=locally-disabled, broad-except
+            ok_(False, "An unexpected {0} exception was raised.".format(type(exception).__name__))
+        else:
+            ok_(False, "An exception was expected but was not raised.")
+    finally:
+        loop.close()
+
+
+@istest
+@patch("pydvdid.computeasync.compute")
+def compute_async_raises_timeouterror_when_the_timeout_expires(mock_compute): # pylint: disable=locally-disabled, invalid-name
+    """Tests that the awaitable returned by compute_async() raises an asyncio.TimeoutError exception
+       when compute does not complete within the supplied timeout.
+    """
+
+    loop = _create_event_loop()
+    compute_released = Event()
+    mock_compute.side_effect = lambda dvd_path: compute_released.wait(10)
+
+    try:
+        _run(loop, compute_async, "DVD_PATH_0", 0.01)
+    except asyncio.TimeoutError:
+        pass
+    except Exception as exception: # pylint: disable=locally-disabled, broad-except
+        ok_(False, "An unexpected {0} exception was raised.".format(type(exception).__name__))
+    else:
+        ok_(False, "An exception was expected but was not raised.")
+    finally:
+        compute_released.set()
+        loop.close()
+
+
+@istest
+@patch("pydvdid.computeasync.compute")
+def iter_compute_async_yields_results_and_exceptions_for_every_path(mock_compute): # pylint: disable=locally-disabled, invalid-name
+    """Tests that the asynchronous iterator returned by iter_compute_async() yields a (path, result)
+       pair for each path, where the result of a path that could not be computed is the exception
+       raised, reading no further ahead of the results consumed than 'max_in_flight' paths.
+    """
+
+    loop = _create_event_loop()
+    mock_compute.side_effect = _compute
+
+    paths_read = []
+
+    def _generate_dvd_paths():
+        for index in range(0, 10):
+            paths_read.append(index)
+            yield "BAD_DVD_PATH_3" if index == 3 else "DVD_PATH_{0}".format(index)
+
+    try:
+        async_iterator = iter_compute_async(_generate_dvd_paths(), max_in_flight=2)
+
+        eq_([], paths_read)
+
+        first_result = _run(loop, async_iterator.__anext__)
+
+        ok_(len(paths_read) <= 2 + 1)
+
+        results = dict([first_result] + _collect(loop, async_iterator))
+    finally:
+        loop.close()
+
+    eq_(10, len(results))
+    ok_(isinstance(results.pop("BAD_DVD_PATH_3"), PathDoesNotExistException))
+    eq_(set(Crc64Result(index) for index in range(0, 10) if index != 3), set(results.values()))
+
+
+@istest
+@patch("pydvdid.computeasync.compute")
+def iter_compute_async_supports_async_for(mock_compute): # pylint: disable=locally-disabled, invalid-name
+    """Tests that the asynchronous iterator returned by iter_compute_async() may be consumed by an
+       'async for' loop.
+    """
+
+    loop = _create_event_loop()
+    mock_compute.side_effect = _compute
+
+    # the async keyword is a syntax error on Python 2, so the coroutine is compiled at run time
+    namespace = {"iter_compute_async": iter_compute_async}
+    exec(compile( # pylint: disable=locally-disabled, exec-used
+        "async def consume(dvd_paths):\n"
+        "    return [pair async for pair in iter_compute_async(dvd_paths, timeout=10)]\n",
+        "<test>", "exec"), namespace)
+
+    try:
+        results = loop.run_until_complete(namespace["consume"](["DVD_PATH_1", "DVD_PATH_2"]))
+    finally:
+        loop.close()
+
+    eq_([("DVD_PATH_1", Crc64Result(1)), ("DVD_PATH_2", Crc64Result(2))], sorted(results))
+
+
+@istest
+@patch("pydvdid.computeasync.compute")
+def iter_compute_async_cancel_cancels_the_paths_in_progress(mock_compute): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of cancel() on the asynchronous iterator returned by
+       iter_compute_async() stops reading paths, and yields the paths in progress with an
+       asyncio.CancelledError exception.
+    """
+
+    loop = _create_event_loop()
+    compute_released = Event()
+    mock_compute.side_effect = lambda dvd_path: compute_released.wait(10)
+
+    try:
+        async_iterator = iter_compute_async(
+            ("DVD_PATH_{0}".format(index) for index in range(0, 100)), max_in_flight=3
+        )
+
+        def _start_and_cancel():
+            future = async_iterator.__anext__() # pylint: disable=locally-disabled, unnecessary-dunder-call
+            async_iterator.cancel()
+
+            return future
+
+        first_result = _run(loop, _start_and_cancel)
+        results = [first_result] + _collect(loop, async_iterator)
+    finally:
+        compute_released.set()
+        loop.close()
+
+    eq_(3, len(results))
+    ok_(all(isinstance(result, asyncio.CancelledError) for _, result in results))
+
+
+@istest
+def iter_compute_async_raises_valueerror_when_max_in_flight_is_less_than_1(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of iter_compute_async() with 'max_in_flight' less than 1 raises a
+       ValueError exception.
+    """
+
+    if asyncio is None:
+        raise SkipTest("asyncio is not available.")
+
+    try:
+        iter_compute_async(["DVD_PATH_0"], max_in_flight=0)
+    except ValueError:
+        pass
+    except Exception as exception: # pylint: disable=locally-disabled, broad-except
+        ok_(False, "An unexpected {0} exception was raised.".format(type(exception).__name__))
+    else:
+        ok_(False, "An exception was expected but was not raised.")
@@ -0,0 +1,210 @@
+"""Implements tests for the pydvdid.computemany module.
+"""
+
+
+from __future__ import absolute_import
+from __future__ import unicode_literals
+from itertools import (
+    count, islice
+)
+from threading import (
+    current_thread, Event
+)
+from mock import patch
+from nose.tools import (
+    eq_, istest, ok_
+)
+from parameterized import (
+    parameterized, param
+)
+from pydvdid.computemany import (
+    compute_many, iter_compute, _get_thread_count
+)
+from pydvdid.crc64result import Crc64Result
+from pydvdid.exceptions import PathDoesNotExistException
+
+
+def _compute(dvd_path):
+    """Returns a checksum derived from the supplied DVD path, or raises an exception for the paths
+       that name bad discs. Substituted for compute.
+    """
+
+    if dvd_path.startswith("BAD_DVD_PATH"):
+        raise PathDoesNotExistException(dvd_path)
+
+    return Crc64Result(int(dvd_path.rsplit("_", 1)[1]))
+
+
+@istest
+@parameterized([
+    param("Thread pool", 4, None),
+    param("Single thread", 1, None),
+    param("No concurrent.futures", 4, "pydvdid.computemany.ThreadPoolExecutor")
+])
+@patch("pydvdid.computemany.compute") # pylint: disable=locally-disabled, invalid-name
+def compute_many_returns_results_and_exceptions_in_input_order(description, max_workers,
+                                                               patch_target, mock_compute):
+    """Tests that invocation of compute_many() returns a (path, result) pair for each path in the
+       order supplied, where the result of a path that could not be computed is the exception
+       raised, without aborting the other paths.
+
+       (This is a Nose generator test which receives a set of data provided by parameterized).
+    """
+
+    mock_compute.side_effect = _compute
+
+    dvd_paths = ["DVD_PATH_{0}".format(index) for index in range(0, 10)]
+    dvd_paths[3] = "BAD_DVD_PATH_3"
+
+    if patch_target is None:
+        results = compute_many(iter(dvd_paths), max_workers=max_workers)
+    else:
+        with patch(patch_target, None):
+            results = compute_many(iter(dvd_paths), max_workers=max_workers)
+
+    eq_(dvd_paths, [dvd_path for dvd_path, _ in results],
+        "Test case '{0}' failed.".format(description))
+
+    for index, (dvd_path, result) in enumerate(results):
+        if index == 3:
+            ok_(isinstance(result, PathDoesNotExistException),
+                "Test case '{0}' failed.".format(description))
+            ok_(dvd_path in str(result), "Test case '{0}' failed.".format(description))
+        else:
+            eq_(Crc64Result(index), result, "Test case '{0}' failed.".format(description))
+
+
+@istest
+@patch("pydvdid.computemany.compute")
+def compute_many_returns_every_result_when_unordered(mock_compute): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of compute_many() with 'ordered' False returns a (path, result) pair
+       for each path supplied, computed on worker threads.
+    """
+
+    thread_names = set()
+
+    def _compute_on_worker(dvd_path):
+        thread_names.add(current_thread().name)
+
+        return _compute(dvd_path)
+
+    mock_compute.side_effect = _compute_on_worker
+
+    dvd_paths = ["DVD_PATH_{0}".format(index) for index in range(0, 10)]
+
+    results = compute_many(dvd_paths, max_workers=3, ordered=False)
+
+    eq_(sorted(dvd_paths), sorted(dvd_path for dvd_path, _ in results))
+    eq_(set(Crc64Result(index) for index in range(0, 10)), set(result for _, result in results))
+    ok_(current_thread().name not in thread_names)
+
+
+@istest
+@patch("pydvdid.computemany.compute")
+def iter_compute_yields_each_result_as_it_completes(mock_compute): # pylint: disable=locally-disabled, invalid-name
+    """Tests that the generator returned by iter_compute() yields the result of a path as soon as it
+       completes, ahead of a slower path supplied before it.
+    """
+
+    second_path_yielded = Event()
+
+    def _compute_slow_first_path(dvd_path):
+        if dvd_path == "DVD_PATH_0":
+            second_path_yielded.wait(10)
+
+        return _compute(dvd_path)
+
+    mock_compute.side_effect = _compute_slow_first_path
+
+    results = iter_compute(["DVD_PATH_0", "DVD_PATH_1"], max_workers=2)
+
+    eq_(("DVD_PATH_1", Crc64Result(1)), next(results))
+
+    second_path_yielded.set()
+
+    eq_([("DVD_PATH_0", Crc64Result(0))], list(results))
+
+
+@istest
+@patch("pydvdid.computemany.compute")
+def iter_compute_reads_no_further_ahead_than_max_in_flight(mock_compute): # pylint: disable=locally-disabled, invalid-name
+    """Tests that the generator returned by iter_compute() reads paths from an unbounded iterable
+       no further ahead of the results consumed than 'max_in_flight' paths, and that it may be
+       closed before the iterable is exhausted.
+    """
+
+    mock_compute.side_effect = _compute
+
+    paths_read = []
+
+    def _generate_dvd_paths():
+        for index in count():
+            paths_read.append(index)
+            yield "DVD_PATH_{0}".format(index)
+
+    results = iter_compute(_generate_dvd_paths(), max_workers=2, max_in_flight=3)
+
+    eq_(5, len(list(islice(results, 5))))
+    ok_(len(paths_read) <= 5 + 3)
+
+    results.close()
+
+    ok_(mock_compute.call_count <= len(paths_read))
+
+
+@istest
+@patch("pydvdid.computemany.ThreadPoolExecutor", None)
+@patch("pydvdid.computemany.compute") # pylint: disable=locally-disabled, invalid-name
+def iter_compute_computes_sequentially_without_concurrent_futures(mock_compute):
+    """Tests that the generator returned by iter_compute() computes the paths in order where
+       concurrent.futures is not available, capturing exceptions.
+    """
+
+    mock_compute.side_effect = _compute
+
+    results = list(iter_compute(["DVD_PATH_0", "BAD_DVD_PATH_1", "DVD_PATH_2"], max_workers=4))
+
+    eq_(["DVD_PATH_0", "BAD_DVD_PATH_1", "DVD_PATH_2"], [dvd_path for dvd_path, _ in results])
+    ok_(isinstance(results[1][1], PathDoesNotExistException))
+    eq_(Crc64Result(2), results[2][1])
+
+
+@istest
+def iter_compute_raises_valueerror_when_max_in_flight_is_less_than_1(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of iter_compute() with 'max_in_flight' less than 1 raises a ValueError
+       exception before any path is computed.
+    """
+
+    try:
+        iter_compute(["DVD_PATH_0"], max_workers=2, max_in_flight=0)
+    except ValueError:
+        pass
+    except Exception as exception: # pylint: disable=locally-disabled, broad-except
+        ok_(False, "An unexpected {0} exception was raised.".format(type(exception).__name__))
+    else:
+        ok_(False, "An exception was expected but was not raised.")
+
+
+@istest
+def _get_thread_count_validates_and_defaults_max_workers(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of _get_thread_count() returns the supplied number of workers, defaults
+       to more workers than processors (but no more than 32), and raises a ValueError exception for
+       fewer than 1 worker.
+    """
+
+    eq_(7, _get_thread_count(7))
+
+    with patch("pydvdid.computemany.cpu_count", return_value=2):
+        eq_(6, _get_thread_count(None))
+
+    with patch("pydvdid.computemany.cpu_count", return_value=64):
+        eq_(32, _get_thread_count(None))
+
+    try:
+        _get_thread_count(0)
+    except ValueError:
+        pass
+    except Exception as exception: # pylint: disable=locally-disabled, broad-except
+        ok_(False, "An unexpected {0} exception was raised.".format(type(exception).__name__))
+    else:
+        ok_(False, "An exception was expected but was not raised.")
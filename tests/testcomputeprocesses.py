@@ -0,0 +1,89 @@
+"""Implements tests for the pydvdid.computeprocesses module.
+"""
+
+
+from __future__ import absolute_import
+from __future__ import unicode_literals
+from os import mkdir
+from os.path import join
+from shutil import rmtree
+from tempfile import mkdtemp
+from nose.tools import (
+    eq_, istest, ok_
+)
+from parameterized import (
+    parameterized, param
+)
+from pydvdid.computeprocesses import (
+    compute_many_in_processes, _get_paths_per_chunk
+)
+from pydvdid.exceptions import PathDoesNotExistException
+from pydvdid.functions import compute
+
+
+def _create_dvd_paths(root_path, count):
+    """Creates the supplied number of DVD folders under the supplied root path, each with a VIDEO_TS
+       folder holding distinct IFO files, and returns their paths.
+    """
+
+    dvd_paths = []
+
+    for index in range(0, count):
+        dvd_path = join(root_path, "DVD_{0}".format(index))
+        mkdir(dvd_path)
+        mkdir(join(dvd_path, "VIDEO_TS"))
+
+        for file_name, size in [("VIDEO_TS.IFO", 0x3000 + index), ("VTS_01_0.IFO", 0x800)]:
+            with open(join(dvd_path, "VIDEO_TS", file_name), "wb") as file_object:
+                file_object.write(bytearray((i * (index + 3)) & 0xff for i in range(0, size)))
+
+        dvd_paths.append(dvd_path)
+
+    return dvd_paths
+
+
+@istest
+@parameterized([
+    param("Worker processes", 2, 2),
+    param("Single process", 1, None)
+])
+def compute_many_in_processes_matches_compute_and_captures_exceptions(description, max_workers, # pylint: disable=locally-disabled, invalid-name
+                                                                      chunk_size):
+    """Tests that invocation of compute_many_in_processes() returns the checksum that compute
+       returns for each path, in the order supplied, and the exception raised for each path whose
+       checksum could not be computed.
+
+       (This is a Nose generator test which receives a set of data provided by parameterized).
+    """
+
+    root_path = mkdtemp()
+
+    try:
+        dvd_paths = _create_dvd_paths(root_path, 5)
+        dvd_paths.insert(2, join(root_path, "MISSING_DVD"))
+
+        crc64s, exceptions = compute_many_in_processes(dvd_paths, max_workers, chunk_size)
+
+        expected_crc64s = [compute(dvd_path) for dvd_path in dvd_paths if "MISSING" not in dvd_path]
+    finally:
+        rmtree(root_path)
+
+    eq_(expected_crc64s, list(crc64s[:2]) + list(crc64s[3:]),
+        "Test case '{0}' failed.".format(description))
+    eq_(0x0, int(crc64s[2]), "Test case '{0}' failed.".format(description))
+    eq_([2], list(exceptions), "Test case '{0}' failed.".format(description))
+    ok_(isinstance(exceptions[2], PathDoesNotExistException),
+        "Test case '{0}' failed.".format(description))
+    ok_("MISSING_DVD" in str(exceptions[2]), "Test case '{0}' failed.".format(description))
+
+
+@istest
+def _get_paths_per_chunk_adapts_to_the_worker_count(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of _get_paths_per_chunk() returns a chunk size that gives each worker
+       several chunks, but never fewer than 1 or more than the maximum paths per chunk.
+    """
+
+    eq_(1, _get_paths_per_chunk(0, 4))
+    eq_(1, _get_paths_per_chunk(10, 4))
+    eq_(63, _get_paths_per_chunk(1000, 4))
+    eq_(256, _get_paths_per_chunk(50000, 4))
@@ -0,0 +1,238 @@
+"""Implements tests for the pydvdid.crc64backends module.
+"""
+
+
+from __future__ import absolute_import
+from __future__ import unicode_literals
+from os import environ
+from shutil import rmtree
+from tempfile import mkdtemp
+from warnings import (
+    catch_warnings, simplefilter
+)
+from mock import (
+    MagicMock, patch
+)
+from nose.tools import (
+    eq_, istest, ok_
+)
+from parameterized import (
+    parameterized, param
+)
+from pydvdid.crc64backends import (
+    get_crc64_backend, set_crc64_backend, _calibrate, _get_crc64_backend, _read_cached_backend_name,
+    _select_backend, _write_cached_backend_name
+)
+from pydvdid.crc64slicing import (
+    _SlicingBy8Crc64Backend, _SlicingBy16Crc64Backend
+)
+
+
+@istest
+@parameterized([
+    param("Reference implementation", "reference", None),
+    param("Slicing-by-8", "slicing-by-8", _SlicingBy8Crc64Backend),
+    param("Slicing-by-16", "slicing-by-16", _SlicingBy16Crc64Backend)
+])
+def set_crc64_backend_overrides_the_selected_backend(description, name, backend): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of set_crc64_backend() with a registered backend name selects that
+       backend, without calibrating.
+
+       (This is a Nose generator test which receives a set of data provided by parameterized).
+    """
+
+    try:
+        with patch("pydvdid.crc64backends._calibrate") as mock_calibrate:
+            set_crc64_backend(name)
+
+            eq_(name, get_crc64_backend(), "Test case '{0}' failed.".format(description))
+            eq_(backend, _get_crc64_backend(), "Test case '{0}' failed.".format(description))
+            eq_(0, mock_calibrate.call_count, "Test case '{0}' failed.".format(description))
+    finally:
+        set_crc64_backend(None)
+
+
+@istest
+def set_crc64_backend_raises_valueerror_for_an_unknown_backend(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of set_crc64_backend() with a name that is not registered raises a
+       ValueError.
+    """
+
+    try:
+        set_crc64_backend("unknown")
+    except ValueError:
+        pass
+    except Exception as exception: # pylint: disable=locally-disabled, broad-except
+        ok_(False, "An unexpected {0} exception was raised.".format(type(exception).__name__))
+    else:
+        ok_(False, "An exception was expected but was not raised.")
+
+
+@istest
+@patch("pydvdid.crc64backends._calibrate")
+def select_backend_honours_the_environment_variable(mock_calibrate): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of _select_backend() selects the backend named by the
+       PYDVDID_CRC64_BACKEND environment variable, without calibrating.
+    """
+
+    set_crc64_backend(None)
+
+    try:
+        with patch.dict(environ, {"PYDVDID_CRC64_BACKEND": "Slicing-By-16"}):
+            eq_(("slicing-by-16", _SlicingBy16Crc64Backend), _select_backend())
+
+        eq_(0, mock_calibrate.call_count)
+    finally:
+        set_crc64_backend(None)
+
+
+@istest
+@patch("pydvdid.crc64backends._read_cached_backend_name")
+def select_backend_warns_and_falls_back_for_an_unknown_environment_variable(mock_read_cached_backend_name): # pylint: disable=locally-disabled, invalid-name, line-too-long
+    """Tests that invocation of _select_backend() where the PYDVDID_CRC64_BACKEND environment
+       variable names an unknown backend raises a RuntimeWarning and selects the backend held in the
+       calibration cache file, rather than raising an exception.
+    """
+
+    mock_read_cached_backend_name.return_value = "slicing-by-8"
+
+    set_crc64_backend(None)
+
+    try:
+        with patch.dict(environ, {"PYDVDID_CRC64_BACKEND": "unknown"}), \
+             catch_warnings(record=True) as caught_warnings:
+            simplefilter("always")
+
+            eq_(("slicing-by-8", _SlicingBy8Crc64Backend), _select_backend())
+
+        eq_([RuntimeWarning], [caught_warning.category for caught_warning in caught_warnings])
+        ok_("unknown" in str(caught_warnings[0].message))
+    finally:
+        set_crc64_backend(None)
+
+
+@istest
+def select_backend_calibrates_once_and_caches_the_selection(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of _select_backend() with no environment variable and an empty cache
+       folder calibrates and writes the selection to the cache file, which later selections read
+       instead of calibrating.
+    """
+
+    cache_folder_path = mkdtemp()
+
+    try:
+        with patch("pydvdid.crc64backends._get_cache_folder_path") as mock_get_cache_folder_path, \
+             patch("pydvdid.crc64backends._calibrate") as mock_calibrate, \
+             patch.dict(environ, {"PYDVDID_CRC64_BACKEND": "auto"}):
+            mock_get_cache_folder_path.return_value = cache_folder_path
+            mock_calibrate.return_value = "slicing-by-16"
+
+            set_crc64_backend(None)
+            eq_("slicing-by-16", get_crc64_backend())
+            eq_("slicing-by-16", _read_cached_backend_name())
+
+            set_crc64_backend(None)
+            eq_("slicing-by-16", get_crc64_backend())
+
+            eq_(1, mock_calibrate.call_count)
+    finally:
+        set_crc64_backend(None)
+        rmtree(cache_folder_path)
+
+
+@istest
+def read_cached_backend_name_ignores_other_host_configurations(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of _read_cached_backend_name() ignores a selection cached for a
+       different host configuration, and that writing a selection keeps those of other
+       configurations.
+    """
+
+    cache_folder_path = mkdtemp()
+
+    try:
+        with patch("pydvdid.crc64backends._get_cache_folder_path") as mock_get_cache_folder_path, \
+             patch("pydvdid.crc64backends._get_fingerprint") as mock_get_fingerprint:
+            mock_get_cache_folder_path.return_value = cache_folder_path
+
+            mock_get_fingerprint.return_value = "first host"
+            _write_cached_backend_name("slicing-by-8")
+
+            mock_get_fingerprint.return_value = "second host"
+            eq_(None, _read_cached_backend_name())
+            _write_cached_backend_name("reference")
+
+            mock_get_fingerprint.return_value = "first host"
+            eq_("slicing-by-8", _read_cached_backend_name())
+    finally:
+        rmtree(cache_folder_path)
+
+
+@istest
+@patch("pydvdid.crc64backends._BACKENDS")
+def calibrate_never_selects_an_incorrect_or_failing_backend(mock_backends): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of _calibrate() skips backends that compute an incorrect CRC-64 or
+       raise an exception, however fast they are.
+    """
+
+    incorrect_backend_class = MagicMock()
+    incorrect_backend_class.MINIMUM_ZERO_RUN = None
+    incorrect_backend_class.return_value.update.return_value = 0x1234
+
+    failing_backend_class = MagicMock()
+    failing_backend_class.MINIMUM_ZERO_RUN = None
+    failing_backend_class.return_value.update.side_effect = RuntimeError
+
+    mock_backends.__iter__.return_value = [
+        ("incorrect", incorrect_backend_class),
+        ("failing", failing_backend_class),
+        ("slicing-by-8", _SlicingBy8Crc64Backend)
+    ]
+
+    eq_("slicing-by-8", _calibrate())
+
+
+@istest
+@patch("pydvdid.crc64backends._BACKENDS")
+@patch("pydvdid.crc64backends._time_first_use")
+@patch("pydvdid.crc64backends._time_backend")
+def calibrate_counts_the_first_use_of_each_backend(mock_time_backend, mock_time_first_use, # pylint: disable=locally-disabled, invalid-name
+                                                   mock_backends):
+    """Tests that invocation of _calibrate() counts the time taken by the first use of a backend
+       (e.g. importing and compiling its dependencies), so that a backend that is faster once
+       loaded but slow to load is not selected.
+    """
+
+    mock_backends.__iter__.return_value = [
+        ("slicing-by-8", _SlicingBy8Crc64Backend),
+        ("slicing-by-16", _SlicingBy16Crc64Backend)
+    ]
+
+    first_use_times = {_SlicingBy8Crc64Backend: 0.01, _SlicingBy16Crc64Backend: 1.0}
+    mock_time_first_use.side_effect = lambda backend, content: first_use_times[backend]
+
+    times = {_SlicingBy8Crc64Backend: 0.01, _SlicingBy16Crc64Backend: 0.001}
+    mock_time_backend.side_effect = lambda backend, content: times[backend]
+
+    eq_("slicing-by-8", _calibrate())
+
+
+@istest
+def read_cached_backend_name_ignores_a_backend_that_fails_its_self_test(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of _read_cached_backend_name() ignores a cached backend that raises an
+       exception when it is self-tested (e.g. because an optional dependency it requires has since
+       been broken), so that the backend is selected again by calibration.
+    """
+
+    cache_folder_path = mkdtemp()
+
+    try:
+        with patch("pydvdid.crc64backends._get_cache_folder_path") as mock_get_cache_folder_path:
+            mock_get_cache_folder_path.return_value = cache_folder_path
+
+            _write_cached_backend_name("slicing-by-16")
+            eq_("slicing-by-16", _read_cached_backend_name())
+
+            with patch.object(_SlicingBy16Crc64Backend, "__init__", side_effect=ImportError):
+                eq_(None, _read_cached_backend_name())
+    finally:
+        rmtree(cache_folder_path)
@@ -0,0 +1,86 @@
+"""Implements tests for the pydvdid.crc64batch module.
+"""
+
+
+from __future__ import absolute_import
+from mock import patch
+from nose.tools import (
+    eq_, istest
+)
+from parameterized import (
+    parameterized, param
+)
+from pydvdid.crc64batch import compute_crc64_batch
+from pydvdid.crc64calculator import _Crc64Calculator
+
+
+def _get_contents(content_sizes):
+    """Returns a list of contents of the supplied sizes, each with distinct bytes.
+    """
+
+    return [
+        bytearray((i * 37 + index * 11 + (i >> 8)) & 0xff for i in range(0, content_size))
+        for index, content_size in enumerate(content_sizes)
+    ]
+
+
+@istest
+@parameterized([
+    param("Contents fewer than the minimum batch size", [0, 1, 5, 4096]),
+    param("Contents of ragged lengths", [0, 1, 4095, 4096, 4097, 10000, 5, 0x3000] * 3),
+    param("Contents of equal lengths", [0x1000] * 20)
+])
+def compute_crc64_batch_returns_the_crc64_of_each_content(description, content_sizes): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of compute_crc64_batch() returns the CRC-64 of each of the supplied
+       contents, in order, identical to that computed by the byte-at-a-time reference
+       implementation.
+
+       (This is a Nose generator test which receives a set of data provided by parameterized).
+    """
+
+    contents = _get_contents(content_sizes)
+
+    expected_crc64s = []
+    for content in contents:
+        calculator = _Crc64Calculator(0x92c64265d32139a4)
+        calculator.update(content)
+        expected_crc64s.append(calculator.crc64)
+
+    eq_(expected_crc64s, compute_crc64_batch(contents),
+        "Test case '{0}' failed.".format(description))
+
+
+@istest
+def compute_crc64_batch_splits_large_batches_into_groups(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of compute_crc64_batch() with a batch larger than the group size
+       returns the same CRC-64s as the reference implementation, including for a content larger
+       than the group size.
+    """
+
+    contents = _get_contents([100, 3000, 20000, 7, 0, 5000] * 4)
+
+    expected_crc64s = []
+    for content in contents:
+        calculator = _Crc64Calculator(0x92c64265d32139a4)
+        calculator.update(content)
+        expected_crc64s.append(calculator.crc64)
+
+    with patch("pydvdid.crc64numpy._NumpyCrc64Backend._BATCH_GROUP_SIZE", 0x2000):
+        eq_(expected_crc64s, compute_crc64_batch(contents))
+
+
+@istest
+def compute_crc64_batch_honours_alternative_parameters(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of compute_crc64_batch() honours a supplied polynomial and initial
+       XOR.
+    """
+
+    contents = _get_contents([10, 300, 0, 4500] * 5)
+
+    expected_crc64s = []
+    for content in contents:
+        calculator = _Crc64Calculator(0xc96c5795d7870f42, 0x0)
+        calculator.update(content)
+        expected_crc64s.append(calculator.crc64)
+
+    eq_(expected_crc64s, compute_crc64_batch(contents, 0xc96c5795d7870f42, 0x0))
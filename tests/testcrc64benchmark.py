@@ -0,0 +1,44 @@
+"""Implements tests for the benchmarks.crc64benchmark module.
+"""
+
+
+from __future__ import absolute_import
+from json import (
+    dumps, loads
+)
+from nose.tools import (
+    eq_, istest, ok_
+)
+from benchmarks.crc64benchmark import run_benchmarks
+
+
+@istest
+def run_benchmarks_returns_json_serialisable_results(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of run_benchmarks() returns a throughput measurement for every content
+       size of every requested backend, plus a table construction and memory measurement for every
+       requested backend, all of which may be serialised as JSON.
+    """
+
+    results = loads(dumps(run_benchmarks([0x10, 0x1000], ["reference", "slicing-by-8"], 0.0, 1)))
+
+    eq_([("reference", 0x10), ("reference", 0x1000), ("slicing-by-8", 0x10),
+         ("slicing-by-8", 0x1000)],
+        [(result["backend"], result["content_size"]) for result in results["throughput"]])
+    eq_(["reference", "slicing-by-8"],
+        [result["backend"] for result in results["table_construction"]])
+    eq_(["reference", "slicing-by-8"], [result["backend"] for result in results["memory"]])
+
+
+@istest
+def run_benchmarks_raises_valueerror_for_an_unknown_backend(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of run_benchmarks() with an unknown backend name raises a ValueError.
+    """
+
+    try:
+        run_benchmarks([0x10], ["unknown"], 0.0, 1)
+    except ValueError:
+        pass
+    except Exception as exception: # pylint: disable=locally-disabled, broad-except
+        ok_(False, "An unexpected {0} exception was raised.".format(type(exception).__name__))
+    else:
+        ok_(False, "An exception was expected but was not raised.")
@@ -0,0 +1,54 @@
+"""Implements tests for the pydvdid.crc64bigint module.
+"""
+
+
+from __future__ import absolute_import
+from nose.tools import (
+    eq_, istest
+)
+from parameterized import (
+    parameterized, param
+)
+from pydvdid.crc64bigint import _BigIntCrc64Backend
+from pydvdid.crc64calculator import _Crc64Calculator
+
+
+@istest
+@parameterized([
+    param("Content delegated to the fallback backend", 0x92c64265d32139a4, 0xffffffffffffffff, 100),
+    param("Content of the minimum size", 0x92c64265d32139a4, 0xffffffffffffffff, 0x200),
+    param("Content of an odd size", 0x92c64265d32139a4, 0xffffffffffffffff, 0x1235),
+    param("Content spanning several blocks", 0x92c64265d32139a4, 0xffffffffffffffff, 0x24567),
+    param("Alternative polynomial and initial XOR", 0xc96c5795d7870f42, 0x0, 0x4321)
+])
+def bigintcrc64backend_update_matches_the_reference_implementation(description, polynomial, # pylint: disable=locally-disabled, invalid-name
+                                                                   initial_xor, content_size):
+    """Tests that invocation of update() on a _BigIntCrc64Backend instance computes a CRC-64 that
+       is identical to that computed by the byte-at-a-time reference implementation.
+
+       (This is a Nose generator test which receives a set of data provided by parameterized).
+    """
+
+    content = bytearray((i * 29 + (i >> 8)) & 0xff for i in range(0, content_size))
+
+    reference_calculator = _Crc64Calculator(polynomial, initial_xor)
+    reference_calculator.update(content)
+
+    calculator = _Crc64Calculator(polynomial, initial_xor, backend=_BigIntCrc64Backend)
+    calculator.update(content)
+
+    eq_(reference_calculator.crc64, calculator.crc64, "Test case '{0}' failed.".format(description))
+
+
+@istest
+def bigintcrc64backend_update_accepts_a_list_of_integers(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of update() on a _BigIntCrc64Backend instance with a list of integers
+       computes the same CRC-64 as with the equivalent bytearray.
+    """
+
+    content = [(i * 7) & 0xff for i in range(0, 0x2345)]
+
+    backend = _BigIntCrc64Backend(0x92c64265d32139a4)
+
+    eq_(backend.update(0xffffffffffffffff, bytearray(content)),
+        backend.update(0xffffffffffffffff, content))
@@ -3,12 +3,20 @@
 
 
 from __future__ import absolute_import
-from mock import patch
+from mock import (
+    MagicMock, patch
+)
 from nose.tools import (
-    eq_, istest
+    eq_, istest, ok_
+)
+from parameterized import (
+    parameterized, param
 )
+from pydvdid.crc64bigint import _BigIntCrc64Backend
 from pydvdid.crc64calculator import _Crc64Calculator
+from pydvdid.crc64codegen import _create_update_function
 from pydvdid.crc64result import Crc64Result
+from pydvdid.crc64slicing import _SlicingBy8Crc64Backend
 
 
 @istest
@@ -68,6 +76,7 @@ def crc64calculator_update_correctly_updates_the__crc64_attribute(mock_init): #
     calculator = _Crc64Calculator(0x1010)
     calculator._crc64 = 0xffffffffffffffff # pylint: disable=locally-disabled, protected-access
     calculator._lookup_table = [0xffffffffffffffff] # pylint: disable=locally-disabled, protected-access
+    calculator._update_function = _create_update_function(calculator._lookup_table) # pylint: disable=locally-disabled, protected-access
     calculator.update(bytearray([0xff]))
 
     eq_(0xff00000000000000, calculator._crc64) # pylint: disable=locally-disabled, protected-access
@@ -75,10 +84,31 @@ def crc64calculator_update_correctly_updates_the__crc64_attribute(mock_init): #
     mock_init.assert_called_once_with(0x1010)
 
 
+@istest
+@patch("pydvdid.crc64calculator._Crc64Calculator._construct_lookup_table")
+def crc64calculator_update_delegates_to_the_supplied_backend(mock_construct_lookup_table): # pylint: disable=locally-disabled, invalid-name
+    """Tests that initialisation of a _Crc64Calculator instance with a backend class constructs the
+       backend from the supplied polynomial, and that invocation of update() delegates to it.
+    """
+
+    mock_backend_class = MagicMock()
+    mock_backend_class.MINIMUM_ZERO_RUN = None
+    mock_backend_class.return_value.update.return_value = 0xbadc0ffee0ddf00d
+
+    calculator = _Crc64Calculator(0x2468, 0x1357, backend=mock_backend_class)
+    calculator.update(bytearray([0x01, 0x02]))
+
+    eq_(0xbadc0ffee0ddf00d, calculator._crc64) # pylint: disable=locally-disabled, protected-access
+
+    mock_construct_lookup_table.assert_called_once_with(0x2468)
+    mock_backend_class.assert_called_once_with(0x2468)
+    mock_backend_class.return_value.update.assert_called_once_with(0x1357, bytearray([0x01, 0x02]))
+
+
 @istest
 @patch("pydvdid.crc64calculator._Crc64Calculator.__init__")
 def crc64calculator__construct_lookup_table_correctly_builds__lookup_table_attribute(mock_init): # pylint: disable=locally-disabled, invalid-name
-    """Tests that invocation of _construct_lookup_table() correctly computes the 'private'
+    """Tests that invocation of _construct_lookup_table() correctly retrieves the 'private'
        CRC-64 lookup table.
     """
 
@@ -157,6 +187,139 @@ def crc64calculator__construct_lookup_table_correctly_builds__lookup_table_attri
         0x1fe29e79c9cf3d63, 0x17eb76db5f5b6c8a, 0x0ff14f3ce4e79eb1, 0x07f8a79e7273cf58
     ]
 
-    eq_(expected_lookup_table, calculator._lookup_table) # pylint: disable=locally-disabled, protected-access
+    eq_(expected_lookup_table, list(calculator._lookup_table)) # pylint: disable=locally-disabled, protected-access
 
     mock_init.assert_called_once_with(0x8642)
+
+
+@istest
+@parameterized([
+    param("Reference implementation", None),
+    param("Slicing-by-8 backend", _SlicingBy8Crc64Backend),
+    param("Big-integer backend", _BigIntCrc64Backend)
+])
+def crc64calculator_update_skips_zero_runs_without_changing_the_crc64(description, backend): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of update() with content holding long runs of zero bytes (which are
+       skipped rather than enumerated) computes the same CRC-64 as enumerating every byte.
+
+       (This is a Nose generator test which receives a set of data provided by parameterized).
+    """
+
+    content = bytearray()
+    for index, zero_run_length in enumerate([0x10, 0x100, 0x4000, 0x12345, 0x1, 0x7fff]):
+        content.extend((i * 13 + index) & 0xff or 0x1 for i in range(0, 0x30 * index))
+        content.extend(bytearray(zero_run_length))
+
+    calculator = _Crc64Calculator(0x92c64265d32139a4, backend=backend)
+    calculator.update(content)
+
+    expected_crc64 = 0xffffffffffffffff
+    lookup_table = calculator._lookup_table # pylint: disable=locally-disabled, protected-access
+    for byte in content:
+        expected_crc64 = (expected_crc64 >> 8) ^ lookup_table[(expected_crc64 & 0xff) ^ byte]
+
+    eq_(Crc64Result(expected_crc64), calculator.crc64,
+        "Test case '{0}' failed.".format(description))
+    eq_(len(content), calculator.length, "Test case '{0}' failed.".format(description))
+
+
+@istest
+def crc64calculator__construct_lookup_table_shares__lookup_table_between_instances(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that _Crc64Calculator instances seeded from the same polynomial share a single
+       'private' CRC-64 lookup table.
+    """
+
+    calculator_one = _Crc64Calculator(0x92c64265d32139a4)
+    calculator_two = _Crc64Calculator(0x92c64265d32139a4, 0x0)
+
+    ok_(calculator_one._lookup_table is calculator_two._lookup_table) # pylint: disable=locally-disabled, protected-access
+
+
+@istest
+def crc64calculator_copy_returns_an_independent_calculator(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of copy() returns a calculator with the same state, and that updating
+       the copy does not affect the original.
+    """
+
+    calculator = _Crc64Calculator(0x92c64265d32139a4)
+    calculator.update(bytearray([0x01, 0x02, 0x03]))
+
+    calculator_copy = calculator.copy()
+
+    eq_(calculator.crc64, calculator_copy.crc64)
+    eq_(3, calculator_copy.length)
+
+    calculator_copy.update(bytearray([0x04]))
+
+    reference_calculator = _Crc64Calculator(0x92c64265d32139a4)
+    reference_calculator.update(bytearray([0x01, 0x02, 0x03, 0x04]))
+
+    eq_(reference_calculator.crc64, calculator_copy.crc64)
+    eq_(4, calculator_copy.length)
+    eq_(3, calculator.length)
+    ok_(calculator.crc64 != calculator_copy.crc64)
+
+
+@istest
+def crc64calculator_snapshot_and_restore_resume_the_calculation(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that a calculator restored from a snapshot resumes the calculation with the same
+       polynomial, CRC-64 and byte count.
+    """
+
+    calculator = _Crc64Calculator(0x92c64265d32139a4)
+    calculator.update(bytearray(range(0, 100)))
+
+    snapshot = calculator.snapshot()
+
+    eq_(24, len(snapshot))
+
+    restored_calculator = _Crc64Calculator.restore(snapshot)
+    restored_calculator.update(bytearray(range(100, 200)))
+
+    calculator.update(bytearray(range(100, 200)))
+
+    eq_(calculator.crc64, restored_calculator.crc64)
+    eq_(200, restored_calculator.length)
+
+
+@istest
+def crc64calculator_restore_raises_exception_when_snapshot_is_invalid(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of restore() with a snapshot of the wrong length raises a ValueError
+       exception.
+    """
+
+    try:
+        _Crc64Calculator.restore(b"\x00" * 23)
+    except ValueError:
+        pass
+    except Exception as exception: # pylint: disable=locally-disabled, broad-except
+        ok_(False, "An unexpected {0} exception was raised.".format(type(exception).__name__))
+    else:
+        ok_(False, "An exception was expected but was not raised.")
+
+
+@istest
+@parameterized([
+    param("No contents", []),
+    param("Small contents only", [bytearray([0x01]), b"\x02\x03", bytearray(range(0, 0xff))]),
+    param("Large contents only", [bytearray(range(0, 0x100)) * 4, bytearray(0x1000)]),
+    param("Small and large contents", [b"\x01", bytearray(range(0, 0x100)) * 2, b"", b"\x02" * 10,
+                                       memoryview(bytearray(range(0, 0x100))), [0x03, 0x04]])
+])
+def crc64calculator_update_many_matches_update_with_the_concatenated_contents(description, # pylint: disable=locally-disabled, invalid-name
+                                                                              contents):
+    """Tests that invocation of update_many() computes the same CRC-64 and byte count as invoking
+       update() with the contents concatenated.
+
+       (This is a Nose generator test which receives a set of data provided by parameterized).
+    """
+
+    calculator = _Crc64Calculator(0x92c64265d32139a4)
+    calculator.update_many(contents)
+
+    reference_calculator = _Crc64Calculator(0x92c64265d32139a4)
+    reference_calculator.update(b"".join(bytes(bytearray(content)) for content in contents))
+
+    eq_(reference_calculator.crc64, calculator.crc64, "Test case '{0}' failed.".format(description))
+    eq_(reference_calculator.length, calculator.length,
+        "Test case '{0}' failed.".format(description))
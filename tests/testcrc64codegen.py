@@ -0,0 +1,40 @@
+"""Implements tests for the pydvdid.crc64codegen module.
+"""
+
+
+from __future__ import absolute_import
+from nose.tools import (
+    eq_, istest
+)
+from parameterized import (
+    parameterized, param
+)
+from pydvdid.crc64codegen import _create_update_function
+from pydvdid.crc64tables import _get_lookup_table
+
+
+@istest
+@parameterized([
+    param("Empty content", 0),
+    param("Short content", 7),
+    param("Long content", 0x1003)
+])
+def _create_update_function_returns_a_function_matching_the_reference_implementation(description, # pylint: disable=locally-disabled, invalid-name
+                                                                                     content_size):
+    """Tests that the function returned by invocation of _create_update_function() computes a
+       CRC-64 that is identical to that computed by the byte-at-a-time reference implementation.
+
+       (This is a Nose generator test which receives a set of data provided by parameterized).
+    """
+
+    lookup_table = _get_lookup_table(0x92c64265d32139a4)
+    content = bytearray((i * 41 + (i >> 8)) & 0xff for i in range(0, content_size))
+
+    expected_crc64 = 0xffffffffffffffff
+    for byte in content:
+        expected_crc64 = (expected_crc64 >> 8) ^ lookup_table[(expected_crc64 & 0xff) ^ byte]
+
+    update_function = _create_update_function(lookup_table)
+
+    eq_(expected_crc64, update_function(0xffffffffffffffff, content),
+        "Test case '{0}' failed.".format(description))
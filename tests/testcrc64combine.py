@@ -0,0 +1,68 @@
+"""Implements tests for the pydvdid.crc64combine module.
+"""
+
+
+from __future__ import absolute_import
+from nose.tools import (
+    eq_, istest
+)
+from parameterized import (
+    parameterized, param
+)
+from pydvdid.crc64calculator import _Crc64Calculator
+from pydvdid.crc64combine import combine
+from pydvdid.crc64result import Crc64Result
+
+
+@istest
+@parameterized([
+    param("Empty second segment", 100, 0),
+    param("Empty first segment", 0, 100),
+    param("Short segments", 3, 5),
+    param("Long segments", 0x10000, 0x12345)
+])
+def combine_returns_the_crc64_of_the_concatenated_segments(description, length_a, length_b): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of combine() with the CRC-64s of two independently checksummed
+       segments returns the CRC-64 of their concatenation.
+
+       (This is a Nose generator test which receives a set of data provided by parameterized).
+    """
+
+    content = bytearray((i * 131 + (i >> 7)) & 0xff for i in range(0, length_a + length_b))
+
+    calculator = _Crc64Calculator(0x92c64265d32139a4)
+    calculator.update(content)
+
+    calculator_a = _Crc64Calculator(0x92c64265d32139a4)
+    calculator_a.update(content[:length_a])
+
+    calculator_b = _Crc64Calculator(0x92c64265d32139a4)
+    calculator_b.update(content[length_a:])
+
+    combined_crc64 = combine(calculator_a.crc64, calculator_b.crc64, length_b)
+
+    eq_(calculator.crc64, combined_crc64, "Test case '{0}' failed.".format(description))
+
+
+@istest
+def combine_accepts_integers_and_alternative_parameters(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of combine() accepts integer CRC-64s and honours a supplied polynomial
+       and initial XOR.
+    """
+
+    content = bytearray(range(0, 256)) * 3
+
+    calculator = _Crc64Calculator(0xc96c5795d7870f42, 0x0)
+    calculator.update(content)
+
+    calculator_a = _Crc64Calculator(0xc96c5795d7870f42, 0x0)
+    calculator_a.update(content[:500])
+
+    calculator_b = _Crc64Calculator(0xc96c5795d7870f42, 0x0)
+    calculator_b.update(content[500:])
+
+    combined_crc64 = combine(int(str(calculator_a.crc64), 16), int(str(calculator_b.crc64), 16),
+                             268, polynomial=0xc96c5795d7870f42, initial_xor=0x0)
+
+    eq_(calculator.crc64, combined_crc64)
+    eq_(Crc64Result, type(combined_crc64))
@@ -0,0 +1,78 @@
+"""Implements tests for the pydvdid.crc64hash module.
+"""
+
+
+from __future__ import absolute_import
+from __future__ import unicode_literals
+from array import array
+from binascii import hexlify
+from sys import version_info
+from nose.plugins.skip import SkipTest
+from nose.tools import (
+    eq_, istest
+)
+from pydvdid.crc64calculator import _Crc64Calculator
+from pydvdid.crc64hash import Crc64Hash
+
+
+@istest
+def crc64hash_exposes_the_hashlib_attributes(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that a Crc64Hash instance exposes the name, digest_size and block_size attributes of a
+       hashlib hash object.
+    """
+
+    crc64_hash = Crc64Hash()
+
+    eq_("crc64", crc64_hash.name)
+    eq_(8, crc64_hash.digest_size)
+    eq_(1, crc64_hash.block_size)
+
+
+@istest
+def crc64hash_digest_and_hexdigest_return_the_crc64(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of digest() and hexdigest() return the CRC-64 of the content supplied
+       to the initialiser and to update(), as 8 big-endian bytes and as a lowercase hex string.
+    """
+
+    calculator = _Crc64Calculator(0x92c64265d32139a4)
+    calculator.update(bytearray(b"pydvdid"))
+
+    crc64_hash = Crc64Hash(b"py")
+    crc64_hash.update(bytearray(b"dv"))
+    crc64_hash.update(memoryview(b"did"))
+
+    eq_(str(calculator.crc64), crc64_hash.hexdigest())
+    eq_(str(calculator.crc64), hexlify(crc64_hash.digest()).decode("ascii"))
+    eq_(calculator.crc64, crc64_hash.crc64)
+
+
+@istest
+def crc64hash_update_accepts_arrays(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of update() with an array of 32-bit items checksums all of the array's
+       bytes.
+    """
+
+    if version_info[0] < 3:
+        raise SkipTest("arrays are copied as sequences of integers on Python 2.")
+
+    content = array("I", [0x01020304, 0x05060708])
+
+    crc64_hash = Crc64Hash()
+    crc64_hash.update(content)
+
+    eq_(Crc64Hash(content.tobytes()).hexdigest(), crc64_hash.hexdigest())
+
+
+@istest
+def crc64hash_copy_returns_an_independent_hash_object(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of copy() returns a hash object with the same state, and that updating
+       the copy does not affect the original.
+    """
+
+    crc64_hash = Crc64Hash(b"shared prefix")
+
+    crc64_hash_copy = crc64_hash.copy()
+    crc64_hash_copy.update(b" and suffix")
+
+    eq_(Crc64Hash(b"shared prefix").hexdigest(), crc64_hash.hexdigest())
+    eq_(Crc64Hash(b"shared prefix and suffix").hexdigest(), crc64_hash_copy.hexdigest())
@@ -0,0 +1,60 @@
+"""Implements tests for the pydvdid.crc64numba module.
+"""
+
+
+from __future__ import absolute_import
+from mock import patch
+from nose.plugins.skip import SkipTest
+from nose.tools import (
+    eq_, istest, ok_
+)
+from parameterized import (
+    parameterized, param
+)
+from pydvdid.crc64calculator import _Crc64Calculator
+from pydvdid.crc64numba import _NumbaCrc64Backend
+
+
+@istest
+@parameterized([
+    param("Empty content", 0),
+    param("Content shorter than a word", 7),
+    param("Content of whole words", 0x1000),
+    param("Content of whole words with a tail", 0x12345)
+])
+def numbacrc64backend_update_matches_the_reference_implementation(description, content_size): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of update() on a _NumbaCrc64Backend instance computes a CRC-64 that is
+       identical to that computed by the byte-at-a-time reference implementation.
+
+       (This is a Nose generator test which receives a set of data provided by parameterized).
+    """
+
+    if not _NumbaCrc64Backend.AVAILABLE:
+        raise SkipTest("numba is not installed.")
+
+    content = bytearray((i * 23 + (i >> 8)) & 0xff for i in range(0, content_size))
+
+    reference_calculator = _Crc64Calculator(0x92c64265d32139a4)
+    reference_calculator.update(content)
+
+    calculator = _Crc64Calculator(0x92c64265d32139a4, backend=_NumbaCrc64Backend)
+    calculator.update(content)
+
+    eq_(reference_calculator.crc64, calculator.crc64, "Test case '{0}' failed.".format(description))
+
+
+@istest
+@patch("pydvdid.crc64numba._NumbaCrc64Backend.AVAILABLE", False)
+def numbacrc64backend___init___raises_importerror_when_numba_is_not_installed(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that initialisation of a _NumbaCrc64Backend instance raises an ImportError when numba
+       is not installed.
+    """
+
+    try:
+        _NumbaCrc64Backend(0x92c64265d32139a4)
+    except ImportError:
+        pass
+    except Exception as exception: # pylint: disable=locally-disabled, broad-except
+        ok_(False, "An unexpected {0} exception was raised.".format(type(exception).__name__))
+    else:
+        ok_(False, "An exception was expected but was not raised.")
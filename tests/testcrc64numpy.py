@@ -0,0 +1,93 @@
+"""Implements tests for the pydvdid.crc64numpy module.
+"""
+
+
+from __future__ import absolute_import
+from nose.plugins.skip import SkipTest
+from nose.tools import (
+    eq_, istest, ok_
+)
+from parameterized import (
+    parameterized, param
+)
+from pydvdid.crc64calculator import _Crc64Calculator
+from pydvdid.crc64numpy import _NumpyCrc64Backend
+
+
+@istest
+@parameterized([
+    param("Content delegated to the fallback backend", 100),
+    param("Content filling the minimum number of lanes", 0x800),
+    param("Content filling a single block with a tail", 0x10000 + 77),
+    param("Content spanning several blocks", 0x180000 + 0x1234)
+])
+def numpycrc64backend_update_matches_the_reference_implementation(description, content_size): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of update() on a _NumpyCrc64Backend instance computes a CRC-64 that is
+       identical to that computed by the byte-at-a-time reference implementation.
+
+       (This is a Nose generator test which receives a set of data provided by parameterized).
+    """
+
+    if not _NumpyCrc64Backend.AVAILABLE:
+        raise SkipTest("NumPy is not installed.")
+
+    content = bytearray((i * 31 + (i >> 8)) & 0xff for i in range(0, content_size))
+
+    reference_calculator = _Crc64Calculator(0x92c64265d32139a4)
+    reference_calculator.update(content)
+
+    calculator = _Crc64Calculator(0x92c64265d32139a4, backend=_NumpyCrc64Backend)
+    calculator.update(content)
+
+    eq_(reference_calculator.crc64, calculator.crc64, "Test case '{0}' failed.".format(description))
+
+
+@istest
+def numpycrc64backend_update_accepts_a_list_of_integers(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of update() on a _NumpyCrc64Backend instance with a list of integers
+       computes the same CRC-64 as with the equivalent bytearray.
+    """
+
+    if not _NumpyCrc64Backend.AVAILABLE:
+        raise SkipTest("NumPy is not installed.")
+
+    content = [(i * 7) & 0xff for i in range(0, 0x2345)]
+
+    backend = _NumpyCrc64Backend(0x92c64265d32139a4)
+
+    eq_(backend.update(0xffffffffffffffff, bytearray(content)),
+        backend.update(0xffffffffffffffff, content))
+
+
+@istest
+def numpycrc64backend_update_batch_continues_each_supplied_crc64(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of update_batch() on a _NumpyCrc64Backend instance continues each of
+       the supplied CRC-64s, returning the same CRC-64s as invoking update() on each content.
+    """
+
+    if not _NumpyCrc64Backend.AVAILABLE:
+        raise SkipTest("NumPy is not installed.")
+
+    contents = [bytearray((i * 13 + size) & 0xff for i in range(0, size))
+                for size in (0, 1, 255, 256, 257, 0x2345)]
+    crc64s = [0xffffffffffffffff, 0x0, 0x1234, 0xbadc0ffee0ddf00d, 0x0, 0xffffffffffffffff]
+
+    backend = _NumpyCrc64Backend(0x92c64265d32139a4)
+
+    eq_([backend.update(crc64, content) for crc64, content in zip(crc64s, contents)],
+        backend.update_batch(crc64s, contents))
+
+
+@istest
+def numpycrc64backend__get_folding_tables_shares_tables_between_instances(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of _get_folding_tables() on two _NumpyCrc64Backend instances seeded
+       from the same polynomial returns the same shared tables.
+    """
+
+    if not _NumpyCrc64Backend.AVAILABLE:
+        raise SkipTest("NumPy is not installed.")
+
+    first_backend = _NumpyCrc64Backend(0x92c64265d32139a4)
+    second_backend = _NumpyCrc64Backend(0x92c64265d32139a4)
+
+    ok_(first_backend._get_folding_tables(0x80) is second_backend._get_folding_tables(0x80)) # pylint: disable=locally-disabled, protected-access
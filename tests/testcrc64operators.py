@@ -0,0 +1,63 @@
+"""Implements tests for the pydvdid.crc64operators module.
+"""
+
+
+from __future__ import absolute_import
+from nose.tools import (
+    eq_, istest
+)
+from parameterized import (
+    parameterized, param
+)
+from pydvdid.crc64calculator import _Crc64Calculator
+from pydvdid.crc64operators import (
+    _get_zeros_operator, _gf2_matrix_multiply, _gf2_matrix_times, _shift_crc64
+)
+
+
+@istest
+@parameterized([
+    param("No zero bytes", 0),
+    param("One zero byte", 1),
+    param("Power of two zero bytes", 64),
+    param("Arbitrary number of zero bytes", 1001)
+])
+def _shift_crc64_matches_updating_with_zero_bytes(description, length): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of _shift_crc64() returns the same CRC-64 as updating a calculator
+       with the equivalent number of zero bytes.
+
+       (This is a Nose generator test which receives a set of data provided by parameterized).
+    """
+
+    calculator = _Crc64Calculator(0x92c64265d32139a4, 0x0123456789abcdef)
+    calculator.update(bytearray(length))
+
+    shifted_crc64 = _shift_crc64(0x92c64265d32139a4, 0x0123456789abcdef, length)
+
+    eq_(str(calculator.crc64), format(shifted_crc64, "016x"),
+        "Test case '{0}' failed.".format(description))
+
+
+@istest
+def _get_zeros_operator_matches__shift_crc64(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that the matrix returned by _get_zeros_operator() advances a CRC-64 identically to
+       _shift_crc64().
+    """
+
+    operator = _get_zeros_operator(0x92c64265d32139a4, 777)
+
+    eq_(_shift_crc64(0x92c64265d32139a4, 0xfedcba9876543210, 777),
+        _gf2_matrix_times(operator, 0xfedcba9876543210))
+
+
+@istest
+def _gf2_matrix_multiply_composes_matrices(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of _gf2_matrix_multiply() returns a matrix that applies the second
+       matrix and then the first.
+    """
+
+    first_matrix = _get_zeros_operator(0x92c64265d32139a4, 3)
+    second_matrix = _get_zeros_operator(0x92c64265d32139a4, 5)
+
+    eq_(_get_zeros_operator(0x92c64265d32139a4, 8),
+        _gf2_matrix_multiply(first_matrix, second_matrix))
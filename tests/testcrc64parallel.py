@@ -0,0 +1,150 @@
+"""Implements tests for the pydvdid.crc64parallel module.
+"""
+
+
+from __future__ import absolute_import
+from concurrent.futures import Future
+from os import (
+    fdopen, remove
+)
+from tempfile import mkstemp
+from mock import (
+    MagicMock, patch
+)
+from nose.tools import (
+    eq_, istest, ok_
+)
+from pydvdid.crc64calculator import _Crc64Calculator
+from pydvdid.crc64parallel import (
+    compute_crc64_of_content, compute_crc64_of_files, _get_chunk_size, _map_in_order,
+    _split_files_into_chunks
+)
+from pydvdid.exceptions import PathDoesNotExistException
+
+
+@istest
+@patch("pydvdid.crc64parallel._MINIMUM_CHUNK_SIZE", 0x10000)
+def _get_chunk_size_adapts_to_the_worker_count(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of _get_chunk_size() returns a chunk size that gives each worker
+       several aligned chunks, but never less than the minimum chunk size.
+    """
+
+    eq_(0x100000, _get_chunk_size(0x4000000, 16))
+    eq_(0x800000, _get_chunk_size(0x4000000, 2))
+    eq_(0x10000, _get_chunk_size(0x1000, 32))
+
+
+@istest
+def _split_files_into_chunks_spans_file_boundaries(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of _split_files_into_chunks() covers the concatenated files with
+       chunks of the requested size, splitting files across chunks where required.
+    """
+
+    chunks = _split_files_into_chunks([("A", 5), ("B", 0), ("C", 12)], 8)
+
+    eq_([
+        ([("A", 0, 5), ("C", 0, 3)], 8),
+        ([("C", 3, 8)], 8),
+        ([("C", 11, 1)], 1)
+    ], chunks)
+
+
+@istest
+@patch("pydvdid.crc64parallel._CHUNK_ALIGNMENT", 0x1000)
+@patch("pydvdid.crc64parallel._MINIMUM_CHUNK_SIZE", 0x1000)
+def compute_crc64_of_content_matches_the_sequential_crc64(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of compute_crc64_of_content() across several worker processes returns
+       the same CRC-64 as a sequential calculator.
+    """
+
+    content = bytearray((i * 17 + (i >> 9)) & 0xff for i in range(0, 0x5432))
+
+    calculator = _Crc64Calculator(0x92c64265d32139a4)
+    calculator.update(content)
+
+    eq_(calculator.crc64, compute_crc64_of_content(content, max_workers=2))
+    eq_(calculator.crc64, compute_crc64_of_content(content, max_workers=1))
+
+
+@istest
+@patch("pydvdid.crc64parallel._READ_SIZE", 0x800)
+@patch("pydvdid.crc64parallel._CHUNK_ALIGNMENT", 0x1000)
+@patch("pydvdid.crc64parallel._MINIMUM_CHUNK_SIZE", 0x1000)
+def compute_crc64_of_files_matches_the_sequential_crc64(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of compute_crc64_of_files() across several worker processes returns
+       the same CRC-64 as a sequential calculator over the concatenated file content.
+    """
+
+    contents = [
+        bytearray((i * 3) & 0xff for i in range(0, 0x1801)),
+        bytearray(0),
+        bytearray((i * 5 + 1) & 0xff for i in range(0, 0x2345))
+    ]
+    file_paths = []
+
+    try:
+        for content in contents:
+            file_descriptor, file_path = mkstemp()
+            file_paths.append(file_path)
+
+            with fdopen(file_descriptor, "wb") as file_object:
+                file_object.write(content)
+
+        calculator = _Crc64Calculator(0x92c64265d32139a4)
+        for content in contents:
+            calculator.update(content)
+
+        eq_(calculator.crc64, compute_crc64_of_files(file_paths, max_workers=2))
+    finally:
+        for file_path in file_paths:
+            remove(file_path)
+
+
+@istest
+def compute_crc64_of_files_raises_exception_when_path_does_not_exist(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of compute_crc64_of_files() with a path that does not exist raises a
+       PathDoesNotExistException exception.
+    """
+
+    try:
+        compute_crc64_of_files(["DVD_PATH/VIDEO_TS/VTS_01_1.VOB"])
+    except PathDoesNotExistException:
+        pass
+    except Exception as exception: # pylint: disable=locally-disabled, broad-except
+        ok_(False, "An unexpected {0} exception was raised.".format(type(exception).__name__))
+    else:
+        ok_(False, "An exception was expected but was not raised.")
+
+
+@istest
+def _map_in_order_bounds_the_pending_chunks_and_copies_views_as_they_are_submitted(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of _map_in_order() yields the results in order, never has more than
+       'max_pending' chunks pending, and copies memoryview chunks to bytes only as each is
+       submitted.
+    """
+
+    content = memoryview(bytearray(range(0, 10)))
+    chunk_contents = [content[offset:offset + 2] for offset in range(0, 10, 2)]
+
+    submitted_contents = []
+    pending_counts = []
+
+    def _submit(function, chunk_content):
+        submitted_contents.append(chunk_content)
+        pending_counts.append(len(submitted_contents) - len(results))
+
+        future = Future()
+        future.set_result(function(chunk_content))
+
+        return future
+
+    executor = MagicMock()
+    executor.submit.side_effect = _submit
+
+    results = []
+    for result in _map_in_order(executor, sum, chunk_contents, 2):
+        results.append(result)
+
+    eq_([1, 5, 9, 13, 17], results)
+    eq_([bytes(bytearray([index, index + 1])) for index in range(0, 10, 2)], submitted_contents)
+    eq_(2, max(pending_counts))
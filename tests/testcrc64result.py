@@ -4,11 +4,14 @@
 
 from __future__ import absolute_import
 from __future__ import unicode_literals
+from pickle import (
+    dumps, loads
+)
 from mock import (
     call, patch
 )
 from nose.tools import (
-    eq_, istest
+    eq_, istest, ok_
 )
 from parameterized import (
     parameterized, param
@@ -38,6 +41,7 @@ def crc64result_high_bytes_returns_correct_value(mock_init): # pylint: disable=l
 
     result = Crc64Result(0x3af1)
     result._crc64 = 2246800662182009355 # pylint: disable=locally-disabled, protected-access
+    result._hex = None # pylint: disable=locally-disabled, protected-access
 
     eq_("1f2e3d4c", result.high_bytes)
 
@@ -55,6 +59,7 @@ def crc64result_low_bytes_returns_correct_value(mock_init): # pylint: disable=lo
 
     result = Crc64Result(0x88889999)
     result._crc64 = 2246800662182009355 # pylint: disable=locally-disabled, protected-access
+    result._hex = None # pylint: disable=locally-disabled, protected-access
 
     eq_("56789a0b", result.low_bytes)
 
@@ -116,7 +121,132 @@ def crc64result___str___returns_correct_value(mock_init): # pylint: disable=loca
 
     result = Crc64Result(0xd00d)
     result._crc64 = 2246800662182009355 # pylint: disable=locally-disabled, protected-access
+    result._hex = None # pylint: disable=locally-disabled, protected-access
 
     eq_("1f2e3d4c56789a0b", str(result))
 
     mock_init.assert_called_once_with(0xd00d)
+
+
+@istest
+def crc64result_is_hashable_and_hashes_equal_results_equally(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that Crc64Result instances with equal checksums have equal hashes, so that they may be
+       used as dict keys and set members, and that instances have no instance dict.
+    """
+
+    results = set([Crc64Result(0x1f2e3d4c56789a0b), Crc64Result(0x1f2e3d4c56789a0b),
+                   Crc64Result(0x0)])
+
+    eq_(2, len(results))
+    eq_("found", {Crc64Result(0x0): "found"}[Crc64Result(0x0)])
+    ok_(not hasattr(Crc64Result(0x0), "__dict__"))
+
+
+@istest
+@parameterized([
+    param("a < b is True", 1001, 2001, "<", True),
+    param("a < b is False", 2001, 2001, "<", False),
+    param("a <= b is True", 2001, 2001, "<=", True),
+    param("a <= b is False", 4001, 2001, "<=", False),
+    param("a > b is True", 0xffffffffffffffff, 2001, ">", True),
+    param("a > b is False", 2001, 2001, ">", False),
+    param("a >= b is True", 2001, 2001, ">=", True),
+    param("a >= b is False", 1001, 2001, ">=", False)
+])
+def crc64result_ordering_comparisons_return_correctly(description, crc64_one, crc64_two, # pylint: disable=locally-disabled, invalid-name
+                                                       comparison_function_name, expected):
+    """Tests that invocation of <, <=, > and >= ordering comparisons return correctly.
+
+       (This is a Nose generator test which receives a set of data provided by parameterized).
+    """
+
+    comparison_functions = {
+        "<": lambda first, second: first < second,
+        "<=": lambda first, second: first <= second,
+        ">": lambda first, second: first > second,
+        ">=": lambda first, second: first >= second
+    }
+
+    comparison_value = comparison_functions[comparison_function_name](Crc64Result(crc64_one),
+                                                                      Crc64Result(crc64_two))
+    assert_message = "Unexpected result '{0}' for test '{1}'".format(comparison_value, description)
+    eq_(expected, comparison_value, assert_message)
+
+
+@istest
+def crc64result_does_not_equal_other_types(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that a Crc64Result does not equal an object of another type, including its integer
+       value, rather than raising an exception.
+    """
+
+    eq_(False, Crc64Result(0x1f2e) == 0x1f2e)
+    ok_(Crc64Result(0x1f2e) != "1f2e")
+
+
+@istest
+def crc64result_int_and_to_bytes_return_correct_values(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of int() and to_bytes() return the checksum as an integer and as 8
+       big-endian bytes.
+    """
+
+    result = Crc64Result(0x1f2e3d4c56789a0b)
+
+    eq_(0x1f2e3d4c56789a0b, int(result))
+    eq_(b"\x1f\x2e\x3d\x4c\x56\x78\x9a\x0b", result.to_bytes())
+
+
+@istest
+def crc64result_from_bytes_and_from_hex_construct_correctly(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of from_bytes() and from_hex() construct the Crc64Result whose
+       to_bytes() and str() they were supplied.
+    """
+
+    result = Crc64Result(0x000e3d4c56789a0b)
+
+    eq_(result, Crc64Result.from_bytes(result.to_bytes()))
+    eq_(result, Crc64Result.from_hex(str(result)))
+    eq_(result, Crc64Result.from_hex("E3D4C56789A0B"))
+
+
+@istest
+@parameterized([
+    param("Empty hex string", "from_hex", ""),
+    param("Hex string of 17 digits", "from_hex", "01f2e3d4c56789a0b"),
+    param("Hex string with a prefix", "from_hex", "0x1f2e"),
+    param("Hex string with a sign", "from_hex", "-1f2e"),
+    param("Hex string with whitespace", "from_hex", " 1f2e"),
+    param("Hex string with non-hex digits", "from_hex", "1f2g"),
+    param("Content of 7 bytes", "from_bytes", b"\x00" * 7),
+    param("Content of 9 bytes", "from_bytes", b"\x00" * 9)
+])
+def crc64result_constructors_raise_valueerror_for_invalid_values(description, constructor_name, # pylint: disable=locally-disabled, invalid-name
+                                                                 value):
+    """Tests that invocation of from_hex() and from_bytes() with an invalid value raises a
+       ValueError exception.
+
+       (This is a Nose generator test which receives a set of data provided by parameterized).
+    """
+
+    try:
+        getattr(Crc64Result, constructor_name)(value)
+    except ValueError:
+        pass
+    except Exception as exception: # pylint: disable=locally-disabled, broad-except
+        ok_(False, "Test case '{0}' failed: an unexpected {1} exception was raised.".format(
+            description, type(exception).__name__))
+    else:
+        ok_(False, "Test case '{0}' failed: an exception was expected.".format(description))
+
+
+@istest
+def crc64result_survives_pickling(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that a Crc64Result may be pickled and unpickled with each of the pickle protocols
+       available on Python 2, so that results may be passed between worker processes.
+    """
+
+    result = Crc64Result(0x1f2e3d4c56789a0b)
+    str(result)
+
+    for protocol in range(0, 3):
+        eq_(result, loads(dumps(result, protocol)))
+        eq_("1f2e3d4c56789a0b", str(loads(dumps(result, protocol))))
@@ -0,0 +1,179 @@
+"""Implements tests for the pydvdid.crc64resultarray module.
+"""
+
+
+from __future__ import absolute_import
+from __future__ import unicode_literals
+from mock import patch
+from nose.plugins.skip import SkipTest
+from nose.tools import (
+    eq_, istest, ok_
+)
+from parameterized import (
+    parameterized, param
+)
+from pydvdid.crc64result import Crc64Result
+from pydvdid.crc64resultarray import Crc64ResultArray
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+@istest
+def crc64resultarray_holds_crc64results_and_integers_as_crc64results(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that a Crc64ResultArray initialised and extended with Crc64Result objects and integers
+       returns each element as a Crc64Result, by index, by slice and by iteration.
+    """
+
+    result_array = Crc64ResultArray([Crc64Result(0x1f2e3d4c56789a0b), 0x3])
+    result_array.append(0xffffffffffffffff)
+    result_array.extend([Crc64Result(0x0), 0x2])
+
+    eq_(5, len(result_array))
+    eq_(Crc64Result(0x1f2e3d4c56789a0b), result_array[0])
+    eq_(Crc64Result(0x2), result_array[-1])
+    eq_([Crc64Result(0x3), Crc64Result(0x0)], list(result_array[1::2]))
+    eq_([Crc64Result(0x1f2e3d4c56789a0b), Crc64Result(0x3), Crc64Result(0xffffffffffffffff),
+         Crc64Result(0x0), Crc64Result(0x2)], list(result_array))
+    eq_(result_array, Crc64ResultArray(result_array))
+
+
+@istest
+def crc64resultarray_converts_to_and_from_hex_strings_and_bytes(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that to_hex() and to_bytes() format every checksum as str() and to_bytes() of a
+       Crc64Result do, and that from_hex() and from_bytes() parse them back.
+    """
+
+    crc64s = [Crc64Result(0x1f2e3d4c56789a0b), Crc64Result(0x3), Crc64Result(0xffffffffffffffff)]
+    result_array = Crc64ResultArray(crc64s)
+
+    eq_([str(crc64) for crc64 in crc64s], result_array.to_hex())
+    eq_(b"".join(crc64.to_bytes() for crc64 in crc64s), result_array.to_bytes())
+    eq_(result_array, Crc64ResultArray.from_hex(result_array.to_hex()))
+    eq_(result_array, Crc64ResultArray.from_hex(["1F2E3D4C56789A0B", "3", "ffffffffffffffff"]))
+    eq_(result_array, Crc64ResultArray.from_bytes(result_array.to_bytes()))
+
+
+@istest
+@parameterized([
+    param("Empty hex string", "from_hex", [""]),
+    param("Hex string of 17 digits", "from_hex", ["01f2e3d4c56789a0b"]),
+    param("Hex string with a prefix", "from_hex", ["0x1f2e"]),
+    param("Hex string with non-hex digits", "from_hex", ["1f2e", "1f2g"]),
+    param("Content of 7 bytes", "from_bytes", b"\x00" * 7),
+    param("Content of 9 bytes", "from_bytes", b"\x00" * 9)
+])
+def crc64resultarray_constructors_raise_valueerror_for_invalid_values(description, # pylint: disable=locally-disabled, invalid-name
+                                                                      constructor_name, value):
+    """Tests that invocation of from_hex() and from_bytes() with an invalid value raises a
+       ValueError exception.
+
+       (This is a Nose generator test which receives a set of data provided by parameterized).
+    """
+
+    try:
+        getattr(Crc64ResultArray, constructor_name)(value)
+    except ValueError:
+        pass
+    except Exception as exception: # pylint: disable=locally-disabled, broad-except
+        ok_(False, "Test case '{0}' failed: an unexpected {1} exception was raised.".format(
+            description, type(exception).__name__))
+    else:
+        ok_(False, "Test case '{0}' failed: an exception was expected.".format(description))
+
+
+@istest
+@parameterized([
+    param("With NumPy", True),
+    param("Without NumPy", False)
+])
+def crc64resultarray_sorts_and_searches_sorted_checksums(description, use_numpy): # pylint: disable=locally-disabled, invalid-name
+    """Tests that sort() sorts the checksums in place, after which searchsorted() and membership
+       tests find checksums by binary search.
+
+       (This is a Nose generator test which receives a set of data provided by parameterized).
+    """
+
+    if use_numpy and numpy is None:
+        raise SkipTest("NumPy is not installed.")
+
+    with patch("pydvdid.crc64resultarray._import_numpy", return_value=numpy if use_numpy else None):
+        result_array = Crc64ResultArray([0xffffffffffffffff, 0x5, 0x1f2e3d4c56789a0b, 0x5, 0x0])
+
+        ok_(Crc64Result(0x5) in result_array, "Test case '{0}' failed.".format(description))
+
+        result_array.sort()
+
+    eq_(Crc64ResultArray([0x0, 0x5, 0x5, 0x1f2e3d4c56789a0b, 0xffffffffffffffff]), result_array,
+        "Test case '{0}' failed.".format(description))
+    eq_(1, result_array.searchsorted(Crc64Result(0x5)),
+        "Test case '{0}' failed.".format(description))
+    eq_(5, result_array.searchsorted(0xffffffffffffffff + 1),
+        "Test case '{0}' failed.".format(description))
+
+    for crc64 in [0x0, 0x5, 0x1f2e3d4c56789a0b, 0xffffffffffffffff]:
+        ok_(crc64 in result_array, "Test case '{0}' failed.".format(description))
+        ok_(Crc64Result(crc64) in result_array, "Test case '{0}' failed.".format(description))
+
+    for crc64 in [0x1, 0x1f2e3d4c56789a0c]:
+        ok_(crc64 not in result_array, "Test case '{0}' failed.".format(description))
+        ok_(crc64 not in result_array[:4], "Test case '{0}' failed.".format(description))
+        ok_(crc64 not in result_array[::-1], "Test case '{0}' failed.".format(description))
+
+
+@istest
+@parameterized([
+    param("With NumPy", True),
+    param("Without NumPy", False)
+])
+def crc64resultarray_set_operations_return_sorted_distinct_checksums(description, use_numpy): # pylint: disable=locally-disabled, invalid-name
+    """Tests that unique(), union(), intersection() and difference() (and the |, & and - operators)
+       return sorted arrays of distinct checksums.
+
+       (This is a Nose generator test which receives a set of data provided by parameterized).
+    """
+
+    if use_numpy and numpy is None:
+        raise SkipTest("NumPy is not installed.")
+
+    first_array = Crc64ResultArray([0xffffffffffffffff, 0x3, 0x1, 0x3])
+    second_array = Crc64ResultArray([0x2, 0x3, 0xffffffffffffffff])
+
+    with patch("pydvdid.crc64resultarray._import_numpy", return_value=numpy if use_numpy else None):
+        unique_array = first_array.unique()
+        union_array = first_array | second_array
+        intersection_array = first_array & second_array
+        difference_array = first_array - second_array
+
+    eq_(Crc64ResultArray([0x1, 0x3, 0xffffffffffffffff]), unique_array,
+        "Test case '{0}' failed.".format(description))
+    eq_(Crc64ResultArray([0x1, 0x2, 0x3, 0xffffffffffffffff]), union_array,
+        "Test case '{0}' failed.".format(description))
+    eq_(Crc64ResultArray([0x3, 0xffffffffffffffff]), intersection_array,
+        "Test case '{0}' failed.".format(description))
+    eq_(Crc64ResultArray([0x1]), difference_array, "Test case '{0}' failed.".format(description))
+    ok_(0x3 in union_array and 0x4 not in union_array,
+        "Test case '{0}' failed.".format(description))
+
+
+@istest
+def crc64resultarray_converts_to_and_from_numpy_arrays(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that a Crc64ResultArray may be initialised from a NumPy array, and that to_numpy()
+       returns a copy of the checksums as a NumPy uint64 array.
+    """
+
+    if numpy is None:
+        raise SkipTest("NumPy is not installed.")
+
+    vector = numpy.array([0x1f2e3d4c56789a0b, 0x3, 0xffffffffffffffff], dtype=numpy.uint64)
+    result_array = Crc64ResultArray(vector)
+
+    eq_(Crc64ResultArray([0x1f2e3d4c56789a0b, 0x3, 0xffffffffffffffff]), result_array)
+
+    copied_vector = result_array.to_numpy()
+    copied_vector[0] = 0x0
+
+    eq_(numpy.uint64, copied_vector.dtype)
+    eq_(Crc64Result(0x1f2e3d4c56789a0b), result_array[0])
@@ -0,0 +1,110 @@
+"""Implements tests for the pydvdid.crc64slicing module.
+"""
+
+
+from __future__ import absolute_import
+from nose.tools import (
+    eq_, istest
+)
+from parameterized import (
+    parameterized, param
+)
+from pydvdid.crc64calculator import _Crc64Calculator
+from pydvdid.crc64slicing import (
+    _SlicingCrc64Backend, _SlicingBy8Crc64Backend, _SlicingBy16Crc64Backend
+)
+
+
+@istest
+@parameterized([
+    param("Slicing-by-8", _SlicingBy8Crc64Backend, 8),
+    param("Slicing-by-16", _SlicingBy16Crc64Backend, 16)
+])
+def slicingcrc64backend__construct_lookup_tables_builds_the_correct_number_of_tables(description, # pylint: disable=locally-disabled, invalid-name
+                                                                                   backend_class,
+                                                                                   slices):
+    """Tests that initialisation of a slicing backend constructs one lookup table per slice, the
+       first of which is the conventional byte-at-a-time lookup table.
+
+       (This is a Nose generator test which receives a set of data provided by parameterized).
+    """
+
+    backend = backend_class(0x92c64265d32139a4)
+    calculator = _Crc64Calculator(0x92c64265d32139a4)
+
+    lookup_tables = backend._lookup_tables # pylint: disable=locally-disabled, protected-access
+
+    eq_(slices, len(lookup_tables), "Test case '{0}' failed.".format(description))
+    eq_(list(calculator._lookup_table), list(lookup_tables[0]), # pylint: disable=locally-disabled, protected-access
+        "Test case '{0}' failed.".format(description))
+
+
+@istest
+@parameterized([
+    param("Slicing-by-8, empty content", _SlicingBy8Crc64Backend, 0),
+    param("Slicing-by-8, tail only", _SlicingBy8Crc64Backend, 7),
+    param("Slicing-by-8, one word", _SlicingBy8Crc64Backend, 8),
+    param("Slicing-by-8, shorter than sliced", _SlicingBy8Crc64Backend, 0x80 - 1),
+    param("Slicing-by-8, shortest sliced", _SlicingBy8Crc64Backend, 0x80),
+    param("Slicing-by-8, words and tail", _SlicingBy8Crc64Backend, 1001),
+    param("Slicing-by-8, multiple blocks", _SlicingBy8Crc64Backend, 0x10000 + 3),
+    param("Slicing-by-16, empty content", _SlicingBy16Crc64Backend, 0),
+    param("Slicing-by-16, tail only", _SlicingBy16Crc64Backend, 15),
+    param("Slicing-by-16, one slice", _SlicingBy16Crc64Backend, 16),
+    param("Slicing-by-16, shorter than sliced", _SlicingBy16Crc64Backend, 0x80 - 1),
+    param("Slicing-by-16, shortest sliced", _SlicingBy16Crc64Backend, 0x80),
+    param("Slicing-by-16, slices and tail", _SlicingBy16Crc64Backend, 1001),
+    param("Slicing-by-16, multiple blocks", _SlicingBy16Crc64Backend, 0x10000 + 3)
+])
+def slicingcrc64backend_update_matches_the_reference_implementation(description, backend_class, # pylint: disable=locally-disabled, invalid-name
+                                                                    content_size):
+    """Tests that invocation of update() on a slicing backend computes a CRC-64 that is identical
+       to that computed by the byte-at-a-time reference implementation.
+
+       (This is a Nose generator test which receives a set of data provided by parameterized).
+    """
+
+    content = bytearray((i * 31 + (i >> 8)) & 0xff for i in range(0, content_size))
+
+    reference_calculator = _Crc64Calculator(0x92c64265d32139a4)
+    reference_calculator.update(content)
+
+    calculator = _Crc64Calculator(0x92c64265d32139a4, backend=backend_class)
+    calculator.update(content)
+
+    eq_(reference_calculator.crc64, calculator.crc64, "Test case '{0}' failed.".format(description))
+
+
+@istest
+def slicingcrc64backend_update_accepts_a_list_of_integers(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of update() on a slicing backend with a list of integers computes the
+       same CRC-64 as with the equivalent bytearray.
+    """
+
+    content = [(i * 7) & 0xff for i in range(0, 777)]
+
+    backend = _SlicingBy8Crc64Backend(0x92c64265d32139a4)
+
+    eq_(backend.update(0xffffffffffffffff, bytearray(content)),
+        backend.update(0xffffffffffffffff, content))
+
+
+@istest
+@parameterized([
+    param("Slicing-by-8", _SlicingBy8Crc64Backend),
+    param("Slicing-by-16", _SlicingBy16Crc64Backend)
+])
+def slicingcrc64backend__update_words_matches_the_unrolled_overrides(description, backend_class): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of the base _update_words() on a slicing backend computes the same
+       CRC-64 as the backend's unrolled override.
+
+       (This is a Nose generator test which receives a set of data provided by parameterized).
+    """
+
+    words = [(i * 0x9e3779b97f4a7c15) & 0xffffffffffffffff for i in range(0, 32)]
+
+    backend = backend_class(0x92c64265d32139a4)
+
+    eq_(backend._update_words(0xffffffffffffffff, words), # pylint: disable=locally-disabled, protected-access
+        _SlicingCrc64Backend._update_words(backend, 0xffffffffffffffff, words), # pylint: disable=locally-disabled, protected-access
+        "Test case '{0}' failed.".format(description))
@@ -0,0 +1,83 @@
+"""Implements tests for the pydvdid.crc64tables module.
+"""
+
+
+from __future__ import absolute_import
+from array import array
+from mock import patch
+from nose.tools import (
+    eq_, istest, ok_
+)
+from pydvdid.crc64tables import (
+    _construct_lookup_table, _get_indexable_slicing_tables, _get_lookup_table,
+    _get_slicing_tables, _get_update_function, _PRECOMPUTED_LOOKUP_TABLES
+)
+
+
+@istest
+def _get_lookup_table_returns_the_same_table_for_the_same_polynomial(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that repeated invocation of _get_lookup_table() with the same polynomial returns the
+       same compact table instance.
+    """
+
+    lookup_table = _get_lookup_table(0x42f0e1eba9ea3693)
+
+    ok_(isinstance(lookup_table, array))
+    eq_(256, len(lookup_table))
+    ok_(lookup_table is _get_lookup_table(0x42f0e1eba9ea3693))
+
+
+@istest
+def _get_slicing_tables_extends_the_shared_tables_on_demand(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of _get_slicing_tables() returns the shared lookup table as its first
+       table, and that requesting more slices reuses the tables already constructed.
+    """
+
+    slicing_tables_8 = _get_slicing_tables(0xc96c5795d7870f42, 8)
+    slicing_tables_16 = _get_slicing_tables(0xc96c5795d7870f42, 16)
+
+    eq_(8, len(slicing_tables_8))
+    eq_(16, len(slicing_tables_16))
+    ok_(slicing_tables_8[0] is _get_lookup_table(0xc96c5795d7870f42))
+
+    for index, slicing_table in enumerate(slicing_tables_8):
+        ok_(slicing_table is slicing_tables_16[index])
+
+
+@istest
+def _get_indexable_slicing_tables_returns_tuples_equal_to_the_shared_tables(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of _get_indexable_slicing_tables() returns shared tuples with the same
+       content as the compact slicing tables.
+    """
+
+    indexable_slicing_tables = _get_indexable_slicing_tables(0x92c64265d32139a4, 8)
+
+    eq_([list(table) for table in _get_slicing_tables(0x92c64265d32139a4, 8)],
+        [list(table) for table in indexable_slicing_tables])
+    ok_(isinstance(indexable_slicing_tables[0], tuple))
+    ok_(indexable_slicing_tables is _get_indexable_slicing_tables(0x92c64265d32139a4, 8))
+
+
+@istest
+def _construct_lookup_table_precomputed_table_matches_the_computed_table(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that the precomputed lookup table shipped for the GetDiscID polynomial is identical to
+       the lookup table computed from that polynomial.
+    """
+
+    precomputed_lookup_table = _construct_lookup_table(0x92c64265d32139a4)
+
+    with patch.dict("pydvdid.crc64tables._PRECOMPUTED_LOOKUP_TABLES", clear=True):
+        computed_lookup_table = _construct_lookup_table(0x92c64265d32139a4)
+
+    eq_(list(computed_lookup_table), list(precomputed_lookup_table))
+    eq_(list(_PRECOMPUTED_LOOKUP_TABLES[0x92c64265d32139a4]), list(precomputed_lookup_table))
+
+
+@istest
+def _get_update_function_returns_a_shared_function_per_polynomial(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of _get_update_function() returns the same function for the same
+       polynomial, and a different function for a different polynomial.
+    """
+
+    ok_(_get_update_function(0x92c64265d32139a4) is _get_update_function(0x92c64265d32139a4))
+    ok_(_get_update_function(0x92c64265d32139a4) is not _get_update_function(0xc96c5795d7870f42))
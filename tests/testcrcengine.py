@@ -0,0 +1,165 @@
+"""Implements tests for the pydvdid.crcengine module.
+"""
+
+
+from __future__ import absolute_import
+from __future__ import unicode_literals
+from binascii import hexlify
+from zlib import crc32
+from mock import patch
+from nose.tools import (
+    eq_, istest, ok_
+)
+from parameterized import (
+    parameterized, param
+)
+from pydvdid.crc64backends import _BACKENDS
+from pydvdid.crc64calculator import _Crc64Calculator
+from pydvdid.crcengine import (
+    CRC_MODELS, CrcEngine, CrcModel
+)
+
+
+@istest
+@parameterized([
+    param("{0} with the {1} backend".format(model_name, backend_name), model_name, backend)
+    for model_name in sorted(CRC_MODELS)
+    for backend_name, backend in _BACKENDS
+    if getattr(backend, "AVAILABLE", True)
+])
+def crcengine_computes_the_check_value_of_every_catalogued_model(description, model_name, backend): # pylint: disable=locally-disabled, invalid-name
+    """Tests that a CrcEngine computes the check value of each model in CRC_MODELS with each of the
+       available backends.
+
+       (This is a Nose generator test which receives a set of data provided by parameterized).
+    """
+
+    with patch("pydvdid.crcengine._get_crc64_backend", return_value=backend):
+        engine = CrcEngine(model_name, b"1234")
+        engine.update(bytearray(b"56789"))
+
+    eq_(CRC_MODELS[model_name].check, engine.crc, "Test case '{0}' failed.".format(description))
+
+
+@istest
+@parameterized([
+    param("CRC-3/GSM (non-reflected)", CrcModel("CRC-3/GSM", 3, 0x3, 0x0, False, False, 0x7, 0x4)),
+    param("CRC-5/USB (reflected)", CrcModel("CRC-5/USB", 5, 0x05, 0x1f, True, True, 0x1f, 0x19)),
+    param("CRC-8/SMBUS (non-reflected)",
+          CrcModel("CRC-8/SMBUS", 8, 0x07, 0x0, False, False, 0x0, 0xf4)),
+    param("CRC-16/IBM-3740 (non-reflected)",
+          CrcModel("CRC-16/IBM-3740", 16, 0x1021, 0xffff, False, False, 0x0, 0x29b1)),
+    param("CRC-16/KERMIT (reflected)",
+          CrcModel("CRC-16/KERMIT", 16, 0x1021, 0x0, True, True, 0x0, 0x2189))
+])
+def crcengine_computes_the_check_value_of_uncatalogued_models(description, model): # pylint: disable=locally-disabled, invalid-name
+    """Tests that a CrcEngine computes the check value of models of widths other than 32 and 64
+       bits.
+
+       (This is a Nose generator test which receives a set of data provided by parameterized).
+    """
+
+    eq_(model.check, CrcEngine(model, b"123456789").crc,
+        "Test case '{0}' failed.".format(description))
+
+
+@istest
+def crcengine_matches_zlib_crc32_and_the_getdiscid_crc64(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that the CRC-32 model matches zlib.crc32(), and that the CRC-64/GETDISCID model
+       matches the CRC-64 used by compute, for content holding long runs of zero bytes.
+    """
+
+    content = bytearray(range(0, 256)) * 0x300 + bytearray(0x12345) + bytearray(b"pydvdid")
+
+    eq_(crc32(bytes(content)) & 0xffffffff, CrcEngine("CRC-32", content).crc)
+
+    calculator = _Crc64Calculator(0x92c64265d32139a4)
+    calculator.update(content)
+
+    eq_(str(calculator.crc64), CrcEngine("CRC-64/GETDISCID", content).hexdigest())
+
+
+@istest
+def crcengine_updates_non_reflected_models_across_reverse_blocks(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that a CrcEngine computes the same CRC for a non-reflected model whether content is
+       supplied at once (and bit-reversed in several blocks) or a byte at a time.
+    """
+
+    content = bytearray((index * 7) & 0xff for index in range(0, 0x50))
+
+    engine = CrcEngine("CRC-64/ECMA-182")
+    with patch.object(engine, "_REVERSE_BLOCK_SIZE", 0x10):
+        engine.update(content)
+
+    byte_engine = CrcEngine("CRC-64/ECMA-182")
+    for byte in content:
+        byte_engine.update(bytearray([byte]))
+
+    eq_(byte_engine.crc, engine.crc)
+
+
+@istest
+def crcengine_exposes_the_hashlib_interface(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that a CrcEngine exposes the name, digest_size and block_size attributes of a hashlib
+       hash object, and that digest(), hexdigest() and copy() behave as theirs do.
+    """
+
+    engine = CrcEngine("CRC-32C", b"12345")
+
+    eq_("crc-32/iscsi", engine.name)
+    eq_(4, engine.digest_size)
+    eq_(1, engine.block_size)
+    ok_(engine.model is CRC_MODELS["CRC-32/ISCSI"])
+
+    engine_copy = engine.copy()
+    engine_copy.update(b"6789")
+
+    eq_("e3069283", engine_copy.hexdigest())
+    eq_(engine_copy.hexdigest(), hexlify(engine_copy.digest()).decode("ascii"))
+    ok_(engine.crc != engine_copy.crc)
+
+    eq_("04", CrcEngine(CrcModel("CRC-3/GSM", 3, 0x3, 0x0, False, False, 0x7),
+                        b"123456789").hexdigest())
+
+
+@istest
+def crcengine_raises_valueerror_for_an_unknown_model(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that initialisation of a CrcEngine with a model name that is not in CRC_MODELS raises a
+       ValueError exception.
+    """
+
+    try:
+        CrcEngine("CRC-64/UNKNOWN")
+    except ValueError:
+        pass
+    except Exception as exception: # pylint: disable=locally-disabled, broad-except
+        ok_(False, "An unexpected {0} exception was raised.".format(type(exception).__name__))
+    else:
+        ok_(False, "An exception was expected but was not raised.")
+
+
+@istest
+@parameterized([
+    param("Width of zero", 0, 0x1, 0x0, 0x0),
+    param("Width of 65 bits", 65, 0x1, 0x0, 0x0),
+    param("Polynomial wider than the width", 8, 0x107, 0x0, 0x0),
+    param("Initial value wider than the width", 8, 0x07, 0x100, 0x0),
+    param("Final XOR value wider than the width", 8, 0x07, 0x0, -0x1)
+])
+def crcmodel_raises_valueerror_for_invalid_parameters(description, width, polynomial, initial, # pylint: disable=locally-disabled, invalid-name, too-many-arguments
+                                                      final_xor):
+    """Tests that initialisation of a CrcModel with a width outside 1 to 64 bits, or with a value
+       that does not fit within the width, raises a ValueError exception.
+
+       (This is a Nose generator test which receives a set of data provided by parameterized).
+    """
+
+    try:
+        CrcModel("CRC-TEST", width, polynomial, initial, True, True, final_xor)
+    except ValueError:
+        pass
+    except Exception as exception: # pylint: disable=locally-disabled, broad-except
+        ok_(False, "Test case '{0}' failed: an unexpected {1} exception was raised.".format(
+            description, type(exception).__name__))
+    else:
+        ok_(False, "Test case '{0}' failed: an exception was expected.".format(description))
@@ -0,0 +1,38 @@
+"""Implements tests for the pydvdid.dependencies module.
+"""
+
+
+from __future__ import absolute_import
+from mock import patch
+from nose.tools import (
+    eq_, istest
+)
+from parameterized import (
+    parameterized, param
+)
+from pydvdid.dependencies import (
+    _import_numpy, _is_installed
+)
+
+
+@istest
+@parameterized([
+    param("Installed module", "json", True),
+    param("Missing module", "pydvdid_missing_module", False)
+])
+def _is_installed_returns_whether_the_module_is_installed(description, module_name, expected): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of _is_installed() returns whether the named module is installed.
+
+       (This is a Nose generator test which receives a set of data provided by parameterized).
+    """
+
+    eq_(expected, _is_installed(module_name), "Test case '{0}' failed.".format(description))
+
+
+@istest
+@patch("pydvdid.dependencies._NUMPY_INSTALLED", False)
+def _import_numpy_returns_none_when_numpy_is_not_installed(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of _import_numpy() where NumPy is not installed returns None.
+    """
+
+    eq_(None, _import_numpy())
@@ -7,6 +7,9 @@ from __future__ import unicode_literals
 from inspect import (
     getmembers, isclass
 )
+from pickle import (
+    dumps, loads
+)
 from mock import patch
 from parameterized import (
     parameterized, param
@@ -103,3 +106,24 @@ def all_package_defined_exceptions_derive_from_pydvdidexception(): # pylint: dis
 
         if isclass(member) and issubclass(member, Exception) and member != PydvdidException:
             yield _assert_exception_type_is_subclass_of_pydvdidexception, member
+
+
+@istest
+@parameterized([
+    param("FileContentReadException", FileContentReadException(20, 12)),
+    param("FileTimeOutOfRangeException", FileTimeOutOfRangeException(-11644473601)),
+    param("PathDoesNotExistException", PathDoesNotExistException("DVD_PATH"))
+])
+def pydvdidexception_subclasses_survive_pickling(description, exception): # pylint: disable=locally-disabled, invalid-name
+    """Tests that instances of the PydvdidException subclasses may be pickled and unpickled with
+       their message intact, so that they may be returned from worker processes.
+
+       (This is a Nose generator test which receives a set of data provided by parameterized).
+    """
+
+    for protocol in range(0, 3):
+        unpickled_exception = loads(dumps(exception, protocol))
+
+        eq_(type(exception), type(unpickled_exception),
+            "Test case '{0}' failed.".format(description))
+        eq_(str(exception), str(unpickled_exception), "Test case '{0}' failed.".format(description))
@@ -7,9 +7,13 @@
 from __future__ import absolute_import
 from __future__ import unicode_literals
 from binascii import hexlify
+from os import mkdir
+from os.path import join
+from shutil import rmtree
 from sys import version_info
+from tempfile import mkdtemp
 from mock import (
-    call, MagicMock, patch
+    MagicMock, patch
 )
 from parameterized import (
     parameterized, param
@@ -21,9 +25,10 @@ from pydvdid.exceptions import (
     FileContentReadException, FileTimeOutOfRangeException, PathDoesNotExistException
 )
 from pydvdid.functions import (
-    compute, _check_dvd_path_exists, _check_video_ts_path_exists, _get_file_creation_time,
-    _get_file_name, _get_file_size, _get_first_64k_content, _get_video_ts_file_paths,
-    _get_vmgi_file_content, _get_vts01i_file_content
+    compute, _check_dvd_path_exists, _check_video_ts_path_exists, _get_file_name,
+    _get_file_records, _get_first_64k_content,
+    _get_video_ts_file_entries, _get_vmgi_file_content, _get_vts01i_file_content,
+    _map_first_64k_content
 )
 
 
@@ -103,34 +108,124 @@ def _check_video_ts_path_exists_raises_exception_when_path_does_not_exist(mock_i
     mock_isdir.assert_called_once_with("DVD_PATH/VIDEO_TS")
 
 
+def _create_stat_result(ctime, size, mode=0o100644):
+    """Returns a mock stat result holding the supplied creation time, size and mode.
+    """
+
+    return MagicMock(st_ctime=ctime, st_size=size, st_mode=mode)
+
+
+def _create_directory_entry(name, is_file, stat_result=None):
+    """Returns a mock scandir directory entry with the supplied name, which is a file where
+       'is_file' is True, and whose stat() returns the supplied stat result.
+    """
+
+    directory_entry = MagicMock()
+    directory_entry.name = name
+    directory_entry.is_file.return_value = is_file
+    directory_entry.stat.return_value = stat_result
+
+    return directory_entry
+
+
 @istest
-@patch("pydvdid.functions.isfile")
-@patch("pydvdid.functions.listdir")
-def _get_video_ts_file_paths_returns_a_sorted_list_of_file_paths(mock_listdir, mock_isfile): # pylint: disable=locally-disabled, invalid-name
-    """Tests that invocation of _get_video_ts_file_paths() uses listdir to get the contents of the
-       VIDEO_TS folder of the specified DVD path, then uses isfile to filter out directories, then
-       returns a sorted list of the file paths.
+@patch("pydvdid.functions.scandir")
+def _get_video_ts_file_entries_returns_a_sorted_list_of_file_paths_and_stat_results(mock_scandir): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of _get_video_ts_file_entries() uses scandir to get the contents of the
+       VIDEO_TS folder of the specified DVD path, filters out directories, then returns a list of
+       the file paths and stat results sorted by path, stat'ing each file once.
+    """
+
+    stat_results = [_create_stat_result(1436705100.0 + index, index) for index in range(0, 3)]
+    directory_entries = [
+        _create_directory_entry("VTS_01_0.VOB", True, stat_results[0]),
+        _create_directory_entry("unexpected_folder", False),
+        _create_directory_entry("VTS_01_0.BUP", True, stat_results[1]),
+        _create_directory_entry("VTS_01_0.IFO", True, stat_results[2])
+    ]
+
+    mock_scandir.return_value = iter(directory_entries)
+
+    video_ts_file_entries = _get_video_ts_file_entries("DVD_PATH")
+
+    eq_([
+        ("DVD_PATH/VIDEO_TS/VTS_01_0.BUP", stat_results[1]),
+        ("DVD_PATH/VIDEO_TS/VTS_01_0.IFO", stat_results[2]),
+        ("DVD_PATH/VIDEO_TS/VTS_01_0.VOB", stat_results[0])
+    ], video_ts_file_entries)
+
+    mock_scandir.assert_called_once_with("DVD_PATH/VIDEO_TS")
+
+    for directory_entry in directory_entries:
+        eq_(1 if directory_entry.is_file.return_value else 0, directory_entry.stat.call_count)
+
+
+@istest
+@patch("pydvdid.functions.scandir")
+def _get_video_ts_file_entries_issues_the_stat_calls_through_the_supplied_map_function(mock_scandir): # pylint: disable=locally-disabled, invalid-name, line-too-long
+    """Tests that invocation of _get_video_ts_file_entries() with a map function (e.g. the map()
+       method of an executor) issues the stat calls of the files through it, once per file.
+    """
+
+    stat_results = [_create_stat_result(1436705100.0 + index, index) for index in range(0, 2)]
+    mock_scandir.return_value = iter([
+        _create_directory_entry("VTS_01_0.IFO", True, stat_results[0]),
+        _create_directory_entry("unexpected_folder", False),
+        _create_directory_entry("VIDEO_TS.IFO", True, stat_results[1])
+    ])
+
+    mapped_items = []
+
+    def _map(function, items): # pylint: disable=locally-disabled, missing-docstring
+        mapped_items.extend(items)
+        return [function(item) for item in mapped_items]
+
+    video_ts_file_entries = _get_video_ts_file_entries("DVD_PATH", _map)
+
+    eq_([
+        ("DVD_PATH/VIDEO_TS/VIDEO_TS.IFO", stat_results[1]),
+        ("DVD_PATH/VIDEO_TS/VTS_01_0.IFO", stat_results[0])
+    ], video_ts_file_entries)
+
+    eq_(["VTS_01_0.IFO", "VIDEO_TS.IFO"], [mapped_item.name for mapped_item in mapped_items])
+
+
+@istest
+@patch("pydvdid.functions.scandir", None)
+@patch("pydvdid.functions.stat")
+@patch("pydvdid.functions.listdir") # pylint: disable=locally-disabled, invalid-name
+def _get_video_ts_file_entries_uses_listdir_and_stat_without_scandir(mock_listdir, mock_stat):
+    """Tests that invocation of _get_video_ts_file_entries() where scandir is not available uses
+       listdir to get the contents of the VIDEO_TS folder of the specified DVD path, then stat's
+       each entry once, filtering out directories and entries which cannot be stat'ed.
     """
 
     mock_listdir.return_value = [
-        "VTS_01_0.VOB", "unexpected_folder", "VTS_01_0.BUP", "VTS_01_0.IFO"
+        "VTS_01_0.VOB", "unexpected_folder", "broken_link", "VTS_01_0.BUP"
     ]
 
-    mock_isfile.side_effect = [True, False, True, True]
+    stat_results = {
+        "DVD_PATH/VIDEO_TS/VTS_01_0.VOB": _create_stat_result(1436705100.0, 100),
+        "DVD_PATH/VIDEO_TS/unexpected_folder": _create_stat_result(1436705101.0, 0, 0o40755),
+        "DVD_PATH/VIDEO_TS/VTS_01_0.BUP": _create_stat_result(1436705102.0, 200)
+    }
 
-    video_ts_file_paths = _get_video_ts_file_paths("DVD_PATH")
+    def _fake_stat(file_path): # pylint: disable=locally-disabled, missing-docstring
+        if file_path not in stat_results:
+            raise OSError(file_path)
+        return stat_results[file_path]
+    mock_stat.side_effect = _fake_stat
+
+    video_ts_file_entries = _get_video_ts_file_entries("DVD_PATH")
 
     eq_([
-        "DVD_PATH/VIDEO_TS/VTS_01_0.BUP", "DVD_PATH/VIDEO_TS/VTS_01_0.IFO",
-        "DVD_PATH/VIDEO_TS/VTS_01_0.VOB"
-    ], video_ts_file_paths)
+        ("DVD_PATH/VIDEO_TS/VTS_01_0.BUP", stat_results["DVD_PATH/VIDEO_TS/VTS_01_0.BUP"]),
+        ("DVD_PATH/VIDEO_TS/VTS_01_0.VOB", stat_results["DVD_PATH/VIDEO_TS/VTS_01_0.VOB"])
+    ], video_ts_file_entries)
 
     mock_listdir.assert_called_once_with("DVD_PATH/VIDEO_TS")
 
-    mock_isfile.assert_has_calls([
-        call("DVD_PATH/VIDEO_TS/VTS_01_0.VOB"), call("DVD_PATH/VIDEO_TS/unexpected_folder"),
-        call("DVD_PATH/VIDEO_TS/VTS_01_0.BUP"), call("DVD_PATH/VIDEO_TS/VTS_01_0.IFO")
-    ])
+    eq_(4, mock_stat.call_count)
 
 
 @istest
@@ -138,18 +233,14 @@ def _get_video_ts_file_paths_returns_a_sorted_list_of_file_paths(mock_listdir, m
     param("Creation Time '1600-12-31 23:59:59'", "DVD_PATH/VIDEO_TS/VIDEO_TS.BUP", -11644473601),
     param("Creation Time '10000-01-01 00:00:00'", "DVD_PATH/VIDEO_TS/VIDEO_TS.IFO", 253402300800)
 ])
-@patch("pydvdid.functions.getctime") # pylint: disable=locally-disabled, invalid-name
-def _get_file_creation_time_raises_exception_when_file_creation_time_is_invalid(description,
-                                                                                file_path, ctime,
-                                                                                mock_getctime):
-    """Tests that invocation of _get_file_creation_time() with a file path that has a creation time
+def _get_file_records_raises_exception_when_file_creation_time_is_invalid(description, file_path, # pylint: disable=locally-disabled, invalid-name
+                                                                          ctime):
+    """Tests that invocation of _get_file_records() with a stat result that has a creation time
        that is outside the allowable range of values raises a FileTimeOutOfRangeException exception.
     """
 
-    mock_getctime.return_value = ctime
-
     try:
-        _get_file_creation_time(file_path)
+        _get_file_records([(file_path, _create_stat_result(ctime, 0))])
     except FileTimeOutOfRangeException:
         pass
     except Exception as exception: # pylint: disable=locally-disabled, broad-except
@@ -159,8 +250,6 @@ def _get_file_creation_time_raises_exception_when_file_creation_time_is_invalid(
         template = "Test case '{0}' failed: An exception was expected but was not raised."
         ok_(False, template.format(description))
 
-    mock_getctime.assert_called_once_with(file_path)
-
 
 @istest
 @parameterized([
@@ -171,18 +260,16 @@ def _get_file_creation_time_raises_exception_when_file_creation_time_is_invalid(
     param("Creation Time '2015-07-01 21:51:43'", "DVD_PATH/VIDEO_TS/VTS_02_2.VOB", 1435787503,
           bytearray([0x80, 0x01, 0x23, 0x1e, 0x48, 0xb4, 0xd0, 0x01]))
 ])
-@patch("pydvdid.functions.getctime") # pylint: disable=locally-disabled, invalid-name
-def _get_file_creation_time_returns_correctly_when_file_creation_time_is_valid(description,
-                                                                               file_path, ctime,
-                                                                               expected,
-                                                                               mock_getctime):
-    """Tests that invocation of _get_file_creation_time() with a file path that has a creation time
-       that is within the allowable range of values returns correctly.
+def _get_file_records_formats_the_file_creation_time_correctly(description, file_path, ctime, # pylint: disable=locally-disabled, invalid-name
+                                                               expected):
+    """Tests that invocation of _get_file_records() with a stat result that has a creation time
+       that is within the allowable range of values formats it correctly, as a Microsoft FILETIME
+       in the first 8 bytes of the file's record.
     """
 
-    mock_getctime.return_value = ctime
-
-    file_creation_time_bytearray = _get_file_creation_time(file_path)
+    file_creation_time_bytearray = _get_file_records([
+        (file_path, _create_stat_result(ctime, 0))
+    ])[:8]
 
     template = "Test case {0}' failed: expected '{1}', actual '{2}'."
     assert_message = template.format(description, _format_as_bytestring(expected),
@@ -190,8 +277,6 @@ def _get_file_creation_time_returns_correctly_when_file_creation_time_is_valid(d
 
     eq_(expected, file_creation_time_bytearray, assert_message)
 
-    mock_getctime.assert_called_once_with(file_path)
-
 
 @istest
 @parameterized([
@@ -204,14 +289,15 @@ def _get_file_creation_time_returns_correctly_when_file_creation_time_is_valid(d
     param("Size less than 4Gb", "DVD_PATH/VIDEO_TS/VTS_02_0.VOB", 3812800233,
           bytearray([0xe9, 0xb6, 0x42, 0xe3]))
 ])
-@patch("pydvdid.functions.getsize") # pylint: disable=locally-disabled, invalid-name
-def _get_file_size_returns_correctly(description, file_path, file_size, expected, mock_getsize):
-    """Tests that invocation of _get_file_size() returns correctly.
+def _get_file_records_formats_the_file_size_correctly(description, file_path, file_size, # pylint: disable=locally-disabled, invalid-name
+                                                      expected):
+    """Tests that invocation of _get_file_records() formats the file size held in the supplied stat
+       result correctly, as the 4 bytes following the creation time in the file's record.
     """
 
-    mock_getsize.return_value = file_size
-
-    file_size_bytearray = _get_file_size(file_path)
+    file_size_bytearray = _get_file_records([
+        (file_path, _create_stat_result(1435787503, file_size))
+    ])[8:12]
 
     template = "Test case '{0}' failed: expected '{1}', actual '{2}'."
     assert_message = template.format(description, _format_as_bytestring(expected),
@@ -219,8 +305,6 @@ def _get_file_size_returns_correctly(description, file_path, file_size, expected
 
     eq_(expected, file_size_bytearray, assert_message)
 
-    mock_getsize.assert_called_once_with(file_path)
-
 
 @istest
 @parameterized([
@@ -247,6 +331,34 @@ def _get_file_name_returns_correctly(description, file_path, file_name, expected
     mock_basename.assert_called_once_with(file_path)
 
 
+@istest
+def _get_file_records_returns_the_concatenated_file_creation_times_sizes_and_names(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of _get_file_records() returns a record for each file, in the order
+       supplied, holding its creation time and size (taken from the supplied stat result) followed
+       by its name, formatted as by _get_file_name().
+    """
+
+    file_paths = ["/VIDEO_TS/VIDEO_TS.IFO", "/VIDEO_TS/1\u20ac.txt", "/VIDEO_TS/VTS_01_1.VOB"]
+    ctimes = [1436705100.0, 1436705101.5, 1436705102.25]
+    sizes = [43051, 202, 3812800233]
+
+    file_entries = [
+        (file_path, _create_stat_result(ctime, size))
+        for file_path, ctime, size in zip(file_paths, ctimes, sizes)
+    ]
+
+    file_records = _get_file_records(file_entries)
+
+    expected = bytearray()
+    for file_entry in file_entries:
+        file_record = _get_file_records([file_entry])
+        eq_(_get_file_name(file_entry[0]), file_record[12:])
+
+        expected += file_record
+
+    eq_(expected, file_records)
+
+
 @istest
 @patch("pydvdid.functions._get_first_64k_content")
 def _get_vmgi_file_content_calls_through_to__get_first_64k_content(mock_get_first_64k_content): # pylint: disable=locally-disabled, invalid-name
@@ -260,7 +372,23 @@ def _get_vmgi_file_content_calls_through_to__get_first_64k_content(mock_get_firs
 
     eq_(bytearray([0xa7, 0x20, 0x38, 0x1f, 0xaa]), vmgi_file_content)
 
-    mock_get_first_64k_content.assert_called_once_with("DVD_PATH/VIDEO_TS/VIDEO_TS.IFO")
+    mock_get_first_64k_content.assert_called_once_with("DVD_PATH/VIDEO_TS/VIDEO_TS.IFO", None)
+
+
+@istest
+@patch("pydvdid.functions._map_first_64k_content")
+def _get_vmgi_file_content_calls_through_to__map_first_64k_content_with_use_mmap(mock_map_first_64k_content): # pylint: disable=locally-disabled, invalid-name, line-too-long
+    """Tests that invocation of _get_vmgi_file_content() with 'use_mmap' True calls a 'private'
+       method to map the first 65536 bytes of the specified file.
+    """
+
+    mock_map_first_64k_content.return_value = bytearray([0xa7, 0x20, 0x38, 0x1f, 0xaa])
+
+    vmgi_file_content = _get_vmgi_file_content("DVD_PATH", use_mmap=True)
+
+    eq_(bytearray([0xa7, 0x20, 0x38, 0x1f, 0xaa]), vmgi_file_content)
+
+    mock_map_first_64k_content.assert_called_once_with("DVD_PATH/VIDEO_TS/VIDEO_TS.IFO", None)
 
 
 @istest
@@ -276,7 +404,23 @@ def _get_vts01i_file_content_calls_through_to__get_first_64k_content(mock_get_fi
 
     eq_(bytearray([0x10, 0x31, 0x44, 0x0c]), vts01i_file_content)
 
-    mock_get_first_64k_content.assert_called_once_with("DVD_PATH/VIDEO_TS/VTS_01_0.IFO")
+    mock_get_first_64k_content.assert_called_once_with("DVD_PATH/VIDEO_TS/VTS_01_0.IFO", None)
+
+
+@istest
+@patch("pydvdid.functions._map_first_64k_content")
+def _get_vts01i_file_content_calls_through_to__map_first_64k_content_with_use_mmap(mock_map_first_64k_content): # pylint: disable=locally-disabled, invalid-name, line-too-long
+    """Tests that invocation of _get_vts01i_file_content() with 'use_mmap' True calls a 'private'
+       method to map the first 65536 bytes of the specified file.
+    """
+
+    mock_map_first_64k_content.return_value = bytearray([0x10, 0x31, 0x44, 0x0c])
+
+    vts01i_file_content = _get_vts01i_file_content("DVD_PATH", use_mmap=True)
+
+    eq_(bytearray([0x10, 0x31, 0x44, 0x0c]), vts01i_file_content)
+
+    mock_map_first_64k_content.assert_called_once_with("DVD_PATH/VIDEO_TS/VTS_01_0.IFO", None)
 
 
 @istest
@@ -404,6 +548,144 @@ def _get_first_64k_content_returns_correctly_when_file_content_greater_than_64k(
     mock_file_object.readinto.assert_called_once_with(expected_file_content[:65536])
 
 
+@istest
+@patch(("__builtin__" if version_info[0] < 3 else "builtins") + ".open")
+@patch("pydvdid.functions.getsize")
+@patch("pydvdid.functions.isfile")
+def _get_first_64k_content_does_not_stat_the_file_when_file_size_is_supplied(mock_isfile, # pylint: disable=locally-disabled, invalid-name
+                                                                             mock_getsize,
+                                                                             mock_open):
+    """Tests that invocation of _get_first_64k_content() with the file size supplied reads that many
+       bytes without checking that the file exists or getting its size.
+    """
+
+    mock_file_object = MagicMock()
+    mock_open.return_value.__enter__.return_value = mock_file_object
+    mock_file_object.readinto.side_effect = len
+
+    first_64k_content = _get_first_64k_content("DVD_PATH/VIDEO_TS/VIDEO_TS.IFO", 10)
+    eq_(bytearray(10), first_64k_content)
+
+    eq_(0, mock_isfile.call_count)
+    eq_(0, mock_getsize.call_count)
+    mock_open.assert_called_once_with("DVD_PATH/VIDEO_TS/VIDEO_TS.IFO", "rb")
+
+
+@istest
+@parameterized([
+    param("Empty file", 0, None),
+    param("File less than 64k", 10, None),
+    param("File greater than 64k", 100000, None),
+    param("File size supplied", 100000, 100000)
+])
+def _map_first_64k_content_returns_the_first_64k_of_the_file(description, file_size, # pylint: disable=locally-disabled, invalid-name
+                                                              supplied_file_size):
+    """Tests that invocation of _map_first_64k_content() returns the first 64Kb of content (or the
+       entire content, for a file which is less than 64Kb in size) of an existent file.
+
+       (This is a Nose generator test which receives a set of data provided by parameterized).
+    """
+
+    root_path = mkdtemp()
+
+    try:
+        file_path = join(root_path, "VIDEO_TS.IFO")
+        file_content = bytearray(item & 0xff for item in range(0, file_size))
+        with open(file_path, "wb") as file_object:
+            file_object.write(file_content)
+
+        first_64k_content = _map_first_64k_content(file_path, supplied_file_size)
+
+        eq_(bytes(file_content[:65536]), bytes(first_64k_content),
+            "Test case '{0}' failed.".format(description))
+
+        # the mapping is released before the folder is removed, as a mapped file cannot be deleted
+        # on Windows
+        del first_64k_content
+    finally:
+        rmtree(root_path)
+
+
+@istest
+@parameterized([
+    param("Path does not exist", 100, PathDoesNotExistException),
+    param("File shorter than supplied size", 5, FileContentReadException)
+])
+def _map_first_64k_content_raises_exception_when_content_cannot_be_mapped(description, file_size, # pylint: disable=locally-disabled, invalid-name
+                                                                          exception_type):
+    """Tests that invocation of _map_first_64k_content() raises a PathDoesNotExistException for a
+       path which does not exist, and a FileContentReadException where the file is shorter than the
+       supplied file size.
+
+       (This is a Nose generator test which receives a set of data provided by parameterized).
+    """
+
+    root_path = mkdtemp()
+
+    try:
+        file_path = join(root_path, "VTS_01_0.IFO")
+        supplied_file_size = None
+
+        if exception_type is FileContentReadException:
+            with open(file_path, "wb") as file_object:
+                file_object.write(bytearray(file_size))
+            supplied_file_size = 100
+
+        try:
+            _map_first_64k_content(file_path, supplied_file_size)
+        except exception_type:
+            pass
+        except Exception as exception: # pylint: disable=locally-disabled, broad-except
+            ok_(False, "An unexpected {0} exception was raised in test case '{1}'.".format(
+                type(exception).__name__, description))
+        else:
+            ok_(False, "An exception was expected but was not raised in test case '{0}'.".format(
+                description))
+    finally:
+        rmtree(root_path)
+
+
+@istest
+@patch("pydvdid.functions.mmap")
+def _map_first_64k_content_reads_the_content_when_the_file_cannot_be_mapped(mock_mmap): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of _map_first_64k_content() for a file on a filesystem that cannot be
+       mapped (where mmap raises an OSError) reads the content as _get_first_64k_content() does.
+    """
+
+    mock_mmap.side_effect = OSError(19, "No such device")
+
+    root_path = mkdtemp()
+
+    try:
+        file_path = join(root_path, "VIDEO_TS.IFO")
+        with open(file_path, "wb") as file_object:
+            file_object.write(bytearray([0x43, 0x90, 0xdc, 0x18]))
+
+        first_64k_content = _map_first_64k_content(file_path)
+    finally:
+        rmtree(root_path)
+
+    eq_(bytearray([0x43, 0x90, 0xdc, 0x18]), first_64k_content)
+    eq_(1, mock_mmap.call_count)
+
+
+@istest
+@patch("pydvdid.functions.mmap", None)
+@patch("pydvdid.functions._get_first_64k_content")
+def _map_first_64k_content_calls_through_to__get_first_64k_content_without_mmap(mock_get_first_64k_content): # pylint: disable=locally-disabled, invalid-name, line-too-long
+    """Tests that invocation of _map_first_64k_content() where mmap is not available reads the
+       content with _get_first_64k_content().
+    """
+
+    mock_get_first_64k_content.return_value = bytearray([0x10, 0x31, 0x44, 0x0c])
+
+    first_64k_content = _map_first_64k_content("DVD_PATH/VIDEO_TS/VTS_01_0.IFO", 4)
+
+    eq_(bytearray([0x10, 0x31, 0x44, 0x0c]), first_64k_content)
+
+    mock_get_first_64k_content.assert_called_once_with("DVD_PATH/VIDEO_TS/VTS_01_0.IFO", 4)
+
+
 @nottest
 def _format_as_bytestring(value):
     """Simple utility function for providing a hex representation of a unicode string, compatible
@@ -416,15 +698,13 @@ def _format_as_bytestring(value):
 @istest
 @patch("pydvdid.functions._get_vts01i_file_content")
 @patch("pydvdid.functions._get_vmgi_file_content")
-@patch("pydvdid.functions.getsize")
-@patch("pydvdid.functions.getctime")
-@patch("pydvdid.functions._get_video_ts_file_paths")
+@patch("pydvdid.functions._get_video_ts_file_entries")
 @patch("pydvdid.functions._check_video_ts_path_exists")
 @patch("pydvdid.functions._check_dvd_path_exists")
 def compute_returns_correct_crc64_for_a_real_dvd(mock_check_dvd_path_exists, # pylint: disable=locally-disabled, invalid-name, too-many-arguments
                                                  mock_check_video_ts_path_exists,
-                                                 mock_get_video_ts_file_paths, mock_getctime,
-                                                 mock_getsize, mock_get_vmgi_file_content,
+                                                 mock_get_video_ts_file_entries,
+                                                 mock_get_vmgi_file_content,
                                                  mock_get_vts01i_file_content):
     """Tests that invocation of compute() returns the expected CRC-64 for a known DVD content,
        Room on the Broom by Magic Light Pictures.
@@ -434,7 +714,7 @@ def compute_returns_correct_crc64_for_a_real_dvd(mock_check_dvd_path_exists, # p
 
     mock_check_dvd_path_exists.return_value = None
     mock_check_video_ts_path_exists.return_value = None
-    mock_get_video_ts_file_paths.return_value = [
+    file_paths = [
         "DVD_PATH/VIDEO_TS/VIDEO_TS.BUP", "DVD_PATH/VIDEO_TS/VIDEO_TS.IFO",
         "DVD_PATH/VIDEO_TS/VIDEO_TS.VOB", "DVD_PATH/VIDEO_TS/VTS_01_0.BUP",
         "DVD_PATH/VIDEO_TS/VTS_01_0.IFO", "DVD_PATH/VIDEO_TS/VTS_01_0.VOB",
@@ -447,16 +727,19 @@ def compute_returns_correct_crc64_for_a_real_dvd(mock_check_dvd_path_exists, # p
         "DVD_PATH/VIDEO_TS/VTS_04_0.IFO", "DVD_PATH/VIDEO_TS/VTS_04_0.VOB",
         "DVD_PATH/VIDEO_TS/VTS_04_1.VOB"
     ]
-    mock_getctime.side_effect = [
+    ctimes = [
         1359453416.0, 1359453416.0, 1359453418.0, 1359453418.0, 1359453418.0, 1359453419.0,
         1359453419.0, 1359453422.0, 1359453422.0, 1359453429.0, 1359453576.0, 1359453656.0,
         1359453658.0, 1359453658.0, 1359453658.0, 1359453803.0, 1359453819.0, 1359453820.0,
         1359453820.0, 1359453820.0, 1359453838.0
     ]
-    mock_getsize.side_effect = [
+    sizes = [
         16384, 16384, 6174720, 18432, 18432, 3512320, 51200, 47104, 47104, 37902336, 1073424384,
-        591493120, 36864, 36864, 10240, 1073651712, 88340480, 18432, 18432, 10240, 138311680,
-        16384, 18432
+        591493120, 36864, 36864, 10240, 1073651712, 88340480, 18432, 18432, 10240, 138311680
+    ]
+    mock_get_video_ts_file_entries.return_value = [
+        (file_path, _create_stat_result(ctime, size))
+        for file_path, ctime, size in zip(file_paths, ctimes, sizes)
     ]
     mock_get_vmgi_file_content.return_value = [
         0x44, 0x56, 0x44, 0x56, 0x49, 0x44, 0x45, 0x4f, 0x2d, 0x56, 0x4d, 0x47, 0x00, 0x00, 0x0b,
@@ -2787,3 +3070,116 @@ def compute_returns_correct_crc64_for_a_real_dvd(mock_check_dvd_path_exists, # p
 
     result = compute("DVD_PATH")
     eq_("a5acf20f2e56954b", str(result))
+
+    mock_get_vmgi_file_content.assert_called_once_with("DVD_PATH", 16384, False)
+    mock_get_vts01i_file_content.assert_called_once_with("DVD_PATH", 18432, False)
+
+
+def _create_dvd_path(root_path, file_names):
+    """Creates a DVD folder under the supplied root path, with a VIDEO_TS folder holding files of
+       distinct content with the supplied names, and returns its path.
+    """
+
+    dvd_path = join(root_path, "DVD")
+    mkdir(dvd_path)
+    mkdir(join(dvd_path, "VIDEO_TS"))
+
+    for index, file_name in enumerate(file_names):
+        with open(join(dvd_path, "VIDEO_TS", file_name), "wb") as file_object:
+            file_object.write(bytearray((i * (index + 3)) & 0xff for i in range(0, 0x1000 * index)))
+
+    return dvd_path
+
+
+@istest
+@parameterized([
+    param("Single thread", 1),
+    param("Two threads", 2),
+    param("More threads than files", 16)
+])
+def compute_returns_the_same_crc64_when_reads_are_concurrent(description, max_concurrent_reads): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of compute() with 'max_concurrent_reads' returns the same checksum as
+       when the files are stat'ed and read one after another.
+
+       (This is a Nose generator test which receives a set of data provided by parameterized).
+    """
+
+    root_path = mkdtemp()
+
+    try:
+        dvd_path = _create_dvd_path(root_path, [
+            "VTS_01_1.VOB", "VIDEO_TS.BUP", "VTS_01_0.IFO", "VIDEO_TS.IFO", "VTS_01_0.BUP",
+            "VIDEO_TS.VOB", "VTS_01_0.VOB"
+        ])
+        mkdir(join(dvd_path, "VIDEO_TS", "unexpected_folder"))
+
+        eq_(compute(dvd_path), compute(dvd_path, max_concurrent_reads),
+            "Test case '{0}' failed.".format(description))
+    finally:
+        rmtree(root_path)
+
+
+@istest
+@parameterized([
+    param("Files read one after another", None),
+    param("Files read concurrently", 4)
+])
+def compute_returns_the_same_crc64_when_the_ifo_files_are_mapped(description, # pylint: disable=locally-disabled, invalid-name
+                                                                  max_concurrent_reads):
+    """Tests that invocation of compute() with 'use_mmap' True returns the same checksum as when
+       the .ifo files are read into buffers.
+
+       (This is a Nose generator test which receives a set of data provided by parameterized).
+    """
+
+    root_path = mkdtemp()
+
+    try:
+        dvd_path = _create_dvd_path(root_path, [
+            "VTS_01_1.VOB", "VIDEO_TS.BUP", "VTS_01_0.IFO", "VIDEO_TS.IFO", "VTS_01_0.BUP"
+        ])
+
+        eq_(compute(dvd_path),
+            compute(dvd_path, max_concurrent_reads=max_concurrent_reads, use_mmap=True),
+            "Test case '{0}' failed.".format(description))
+    finally:
+        rmtree(root_path)
+
+
+@istest
+def compute_raises_exception_when_an_ifo_file_does_not_exist_and_reads_are_concurrent(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of compute() with 'max_concurrent_reads' raises a
+       PathDoesNotExistException exception when the VTS_01_0.IFO file does not exist.
+    """
+
+    root_path = mkdtemp()
+
+    try:
+        dvd_path = _create_dvd_path(root_path, ["VIDEO_TS.IFO", "VIDEO_TS.VOB"])
+
+        try:
+            compute(dvd_path, max_concurrent_reads=4)
+        except PathDoesNotExistException as exception:
+            ok_("VTS_01_0.IFO" in str(exception))
+        except Exception as exception: # pylint: disable=locally-disabled, broad-except
+            ok_(False, "An unexpected {0} exception was raised.".format(type(exception).__name__))
+        else:
+            ok_(False, "An exception was expected but was not raised.")
+    finally:
+        rmtree(root_path)
+
+
+@istest
+def compute_raises_valueerror_when_max_concurrent_reads_is_less_than_1(): # pylint: disable=locally-disabled, invalid-name
+    """Tests that invocation of compute() with 'max_concurrent_reads' less than 1 raises a
+       ValueError exception.
+    """
+
+    try:
+        compute("DVD_PATH", max_concurrent_reads=0)
+    except ValueError:
+        pass
+    except Exception as exception: # pylint: disable=locally-disabled, broad-except
+        ok_(False, "An unexpected {0} exception was raised.".format(type(exception).__name__))
+    else:
+        ok_(False, "An exception was expected but was not raised.")